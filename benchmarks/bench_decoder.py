@@ -0,0 +1,55 @@
+"""
+Compare the columnar decoder (`tradingview_screener.decoder.decode_rows`) with the previous
+row-by-row DataFrame construction.
+
+Usage: `python benchmarks/bench_decoder.py [n_rows ...]`
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import timeit
+
+import pandas as pd
+
+from tradingview_screener.decoder import decode_rows
+
+COLUMNS = [
+    'name', 'exchange', 'sector', 'type', 'close', 'open', 'high', 'low', 'volume', 'VWAP',
+    'market_cap_basic', 'RSI', 'EMA8|5', 'EMA25|5', 'EMA200|5', 'close|5', 'volume|5',
+    'premarket_change', 'postmarket_change', 'relative_volume_10d_calc',
+]  # fmt: skip
+EXCHANGES = ['NASDAQ', 'NYSE', 'AMEX', 'OTC']
+SECTORS = ['Technology Services', 'Finance', 'Health Technology', 'Energy Minerals', None]
+
+
+def make_data(n_rows: int) -> list[dict]:
+    rnd = random.Random(0)
+    data = []
+    for i in range(n_rows):
+        row = [f'T{i}', rnd.choice(EXCHANGES), rnd.choice(SECTORS), 'stock']
+        row += [rnd.random() * 100 for _ in range(4)]
+        row += [rnd.randint(0, 10**8)]
+        row += [None if rnd.random() < 0.05 else rnd.random() * 100 for _ in range(11)]
+        data.append({'s': f'NASDAQ:T{i}', 'd': row})
+    return data
+
+
+def decode_rows_old(data: list[dict], columns: list[str]) -> pd.DataFrame:
+    return pd.DataFrame(data=([row['s'], *row['d']] for row in data), columns=['ticker', *columns])
+
+
+def main(sizes: list[int]) -> None:
+    print(f'{"rows":>8} {"row-by-row":>12} {"columnar":>12} {"speedup":>8}')
+    for n_rows in sizes:
+        data = make_data(n_rows)
+        number = max(1, 200_000 // n_rows)
+        old = min(timeit.repeat(lambda: decode_rows_old(data, COLUMNS), number=number, repeat=5))
+        new = min(timeit.repeat(lambda: decode_rows(data, COLUMNS), number=number, repeat=5))
+        old, new = old / number, new / number
+        print(f'{n_rows:>8} {old * 1000:>10.2f}ms {new * 1000:>10.2f}ms {old / new:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main([int(x) for x in sys.argv[1:]] or [1_000, 10_000, 50_000])
@@ -0,0 +1,44 @@
+"""
+Parse time of a scanner response with every installed JSON backend.
+
+Usage: `python benchmarks/bench_json.py [n_rows ...]` (or `python -m benchmarks.bench_json`)
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import timeit
+from pathlib import Path
+
+# the sibling modules are imported by name, also when the script is run with `-m`
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_decoder import make_data  # noqa: E402
+
+from tradingview_screener import json_backend
+
+
+def main(sizes: list[int]) -> None:
+    backends = []
+    for name in json_backend.BACKENDS:
+        try:
+            json_backend.set_backend(name)
+        except ImportError:
+            continue
+        backends.append((name, json_backend.loads))
+    json_backend.set_backend()
+
+    print(f'{"rows":>8} {"size":>9} ' + ' '.join(f'{name:>10}' for name, _ in backends))
+    for n_rows in sizes:
+        body = json.dumps({'totalCount': n_rows, 'data': make_data(n_rows)}).encode()
+        number = max(1, 100_000 // n_rows)
+        timings = []
+        for _, loads in backends:
+            elapsed = min(timeit.repeat(lambda: loads(body), number=number, repeat=5)) / number
+            timings.append(f'{elapsed * 1000:>8.2f}ms')
+        print(f'{n_rows:>8} {len(body) / 1e6:>7.1f}MB ' + ' '.join(timings))
+
+
+if __name__ == '__main__':
+    main([int(x) for x in sys.argv[1:]] or [1_000, 10_000, 100_000])
@@ -0,0 +1,214 @@
+"""
+End-to-end benchmarks of the hot paths, against a local `ReplayScanner` (see `mock_scanner.py`).
+
+For every dataset size (rows x columns) it measures:
+- `decode`: `decode_rows()` on an already parsed response
+- `get_scanner_data`: a single request, from the payload to the DataFrame
+- `fetch_all`: the same rows, requested in pages of `--page-size`
+- `get_all_symbols`: the GET request that lists the tickers of a market (one per row count)
+
+Every timing is the best of `--repeat` runs (each one looped for at least `--min-time`), which is
+the least noisy estimate on a shared machine.
+
+The results can be saved to a JSON file, appended to a history file (one JSON object per line, with
+the commit), and compared with a previous run. The comparison flags every benchmark that is slower
+than the baseline by more than `--max-regression`, and exits with status 1 if one of them is gated:
+by default all of them, or only the ones whose name starts with a `--gate` prefix, which are then
+held to `--gate-max-regression` (the network benchmarks are too noisy on shared CI runners to fail
+a build, the CPU-bound `decode` ones are stable). `--report-only` never fails.
+
+Usage:
+
+    python benchmarks/bench_scanner.py --save base.json
+    python benchmarks/bench_scanner.py --compare base.json --max-regression 0.25
+    python -m benchmarks.bench_scanner --compare base.json --gate decode --gate-max-regression 1
+    python -m benchmarks.bench_scanner --compare base.json --report-only
+    python benchmarks/bench_scanner.py --rows 50 250000 --cols 4 200 --max-cells 50000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import json
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+# the sibling modules are imported by name, also when the script is run with `-m`
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from mock_scanner import Dataset, ReplayScanner  # noqa: E402
+
+import tradingview_screener.screener as screener  # noqa: E402
+from tradingview_screener import Query, Transport, json_backend  # noqa: E402
+from tradingview_screener.decoder import decode_rows  # noqa: E402
+
+DEFAULT_ROWS = [50, 5_000, 50_000, 250_000]
+DEFAULT_COLS = [4, 20, 200]
+
+
+def measure(fn: Callable[..., Any], repeat: int, min_time: float, *args: Any) -> float:
+    """
+    :return: the best time of a single call of `fn(*args)`, in seconds (calls that take less than
+     `min_time` are run in a loop, to reduce the timer noise)
+    """
+    start = time.perf_counter()
+    fn(*args)
+    first = time.perf_counter() - start
+    number = max(1, int(min_time / first)) if first else 1000
+
+    best = first
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn(*args)
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def run_dataset(
+    dataset: Dataset, page_size: int, repeat: int, min_time: float
+) -> dict[str, dict[str, float]]:
+    n_rows, n_cols = len(dataset), len(dataset.columns)
+    label = f'{n_rows}x{n_cols}'
+    results = {}
+
+    def record(name: str, seconds: float) -> None:
+        results[name] = {'seconds': seconds, 'rows_per_s': n_rows / seconds}
+        print(f'{name:<32} {seconds * 1000:>10.2f}ms {n_rows / seconds:>14,.0f} rows/s')
+
+    data = json_backend.loads(dataset.body())['data']
+    record(f'decode[{label}]', measure(decode_rows, repeat, min_time, data, dataset.columns))
+
+    with ReplayScanner(dataset) as scanner, Transport() as transport:
+        q = Query().select(*dataset.columns).limit(n_rows).set_transport(transport)
+        q.url = scanner.url
+        record(f'get_scanner_data[{label}]', measure(q.get_scanner_data, repeat, min_time))
+        if n_rows > page_size:
+            seconds = measure(lambda: q.fetch_all(page_size=page_size), repeat, min_time)
+            record(f'fetch_all[{label}]', seconds)
+    return results
+
+
+def run_symbols(n_rows: int, repeat: int, min_time: float) -> dict[str, dict[str, float]]:
+    url = screener.URL
+    with ReplayScanner(Dataset.synthetic(n_rows, 1)) as scanner, Transport() as transport:
+        screener.URL = scanner.url_template
+        try:
+            fn = lambda: screener.get_all_symbols(transport=transport)  # noqa: E731
+            seconds = measure(fn, repeat, min_time)
+        finally:
+            screener.URL = url
+    name = f'get_all_symbols[{n_rows}]'
+    print(f'{name:<32} {seconds * 1000:>10.2f}ms {n_rows / seconds:>14,.0f} rows/s')
+    return {name: {'seconds': seconds, 'rows_per_s': n_rows / seconds}}
+
+
+def git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def compare(results: dict, baseline: dict, max_regression: float) -> list[str]:
+    """
+    :return: the names of the benchmarks that are slower than the baseline by more than
+     `max_regression` (i.e. 0.25 for 25%)
+    """
+    regressions = []
+    print(f'\n{"benchmark":<32} {"baseline":>12} {"current":>12} {"change":>8}')
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        old, new = baseline[name]['seconds'], result['seconds']
+        change = new / old - 1
+        flag = ''
+        if change > max_regression:
+            regressions.append(name)
+            flag = '  REGRESSION'
+        print(f'{name:<32} {old * 1000:>10.2f}ms {new * 1000:>10.2f}ms {change:>+7.1%}{flag}')
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=DEFAULT_ROWS)
+    parser.add_argument('--cols', type=int, nargs='+', default=DEFAULT_COLS)
+    parser.add_argument(
+        '--max-cells', type=int, default=10_000_000, help='skip the larger rows x cols datasets'
+    )
+    parser.add_argument('--page-size', type=int, default=5_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--min-time', type=float, default=0.05)
+    parser.add_argument('--save', type=Path, help='write the results to this JSON file')
+    parser.add_argument('--history', type=Path, help='append the results to this JSON-lines file')
+    parser.add_argument('--compare', type=Path, help='a JSON file saved by a previous run')
+    parser.add_argument('--max-regression', type=float, default=0.25)
+    parser.add_argument(
+        '--gate',
+        nargs='+',
+        metavar='PREFIX',
+        help='only the benchmarks whose name starts with one of these prefixes fail the run',
+    )
+    parser.add_argument(
+        '--gate-max-regression',
+        type=float,
+        help='the threshold of the gated benchmarks, defaults to --max-regression',
+    )
+    parser.add_argument(
+        '--report-only', action='store_true', help='print the regressions, but exit with 0'
+    )
+    args = parser.parse_args(argv)
+
+    results = {}
+    for n_rows in args.rows:
+        for n_cols in args.cols:
+            if n_rows * n_cols > args.max_cells:
+                print(f'skipping {n_rows}x{n_cols} (more than --max-cells)')
+                continue
+            dataset = Dataset.synthetic(n_rows, n_cols)
+            results.update(run_dataset(dataset, args.page_size, args.repeat, args.min_time))
+        results.update(run_symbols(n_rows, args.repeat, args.min_time))
+
+    report = {
+        'commit': git_commit(),
+        'date': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+    if args.save:
+        args.save.write_text(json.dumps(report, indent=2))
+    if args.history:
+        with args.history.open('a') as f:
+            f.write(json.dumps(report) + '\n')
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        print(f'\ncompared with {baseline.get("commit")} ({baseline.get("date")})')
+        regressions = compare(results, baseline['results'], args.max_regression)
+        if regressions:
+            print(f'\n{len(regressions)} benchmark(s) regressed: {", ".join(regressions)}')
+        failures = regressions
+        if args.gate:
+            gated = {k: v for k, v in results.items() if k.startswith(tuple(args.gate))}
+            threshold = args.gate_max_regression
+            if threshold is None:
+                threshold = args.max_regression
+            print(f'\ngated benchmarks ({", ".join(args.gate)}), max regression {threshold:.0%}:')
+            failures = compare(gated, baseline['results'], threshold)
+        if failures and not args.report_only:
+            print(f'\nFAILED: {", ".join(failures)}')
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
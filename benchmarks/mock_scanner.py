@@ -0,0 +1,154 @@
+"""
+A local stand-in for `scanner.tradingview.com` that replays a recorded (or synthetic) response.
+
+The rows are encoded to JSON once, when the dataset is loaded, and every request only joins the
+slice selected by the `range` of the payload, so the server adds as little as possible to the
+timings of the client.
+
+Usage:
+
+>>> from tradingview_screener import Query
+>>> with ReplayScanner(Dataset.synthetic(n_rows=50_000, n_cols=20)) as scanner:
+...     q = Query().select(*scanner.dataset.columns)
+...     q.url = scanner.url
+...     q.get_scanner_data()
+
+A response recorded from the real API can be replayed with `Dataset.load('response.json')`, where
+the file holds the JSON body of the response and the `columns` that were selected.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# 20 numeric fields x 10 timeframes, so up to 200 distinct (and valid) columns
+NUMERIC_FIELDS = [
+    'close', 'volume', 'open', 'high', 'low', 'VWAP', 'RSI', 'EMA5', 'EMA10', 'EMA20',
+    'EMA50', 'EMA100', 'EMA200', 'SMA20', 'SMA50', 'SMA200', 'ATR', 'ADX', 'MACD.macd', 'change',
+]  # fmt: skip
+TIMEFRAMES = ['', '1', '5', '15', '30', '60', '120', '240', '1W', '1M']
+STRING_FIELDS = ['name', 'exchange']
+EXCHANGES = ['NASDAQ', 'NYSE', 'AMEX', 'OTC']
+
+
+def make_columns(n_cols: int) -> list[str]:
+    numeric = [f'{f}|{tf}' if tf else f for tf in TIMEFRAMES for f in NUMERIC_FIELDS]
+    columns = [*STRING_FIELDS, *numeric]
+    if not 1 <= n_cols <= len(columns):
+        raise ValueError(f'n_cols must be between 1 and {len(columns)}, got {n_cols}')
+    return columns[:n_cols]
+
+
+class Dataset:
+    """
+    The rows of a scanner response, each one already encoded to JSON.
+    """
+
+    def __init__(self, tickers: list[str], rows: list[bytes], columns: list[str]) -> None:
+        self.tickers = tickers
+        self.rows = rows
+        self.columns = columns
+        self.symbols = [json.dumps({'s': t, 'd': []}).encode() for t in tickers]
+
+    @classmethod
+    def synthetic(cls, n_rows: int, n_cols: int, seed: int = 0) -> Dataset:
+        rnd = random.Random(seed)
+        columns = make_columns(n_cols)
+        tickers, rows = [], []
+        for i in range(n_rows):
+            exchange = rnd.choice(EXCHANGES)
+            values = []
+            for column in columns:
+                if column == 'name':
+                    values.append(f'T{i}')
+                elif column == 'exchange':
+                    values.append(exchange)
+                else:
+                    values.append(None if rnd.random() < 0.05 else round(rnd.random() * 100, 4))
+            ticker = f'{exchange}:T{i}'
+            tickers.append(ticker)
+            rows.append(json.dumps({'s': ticker, 'd': values}, separators=(',', ':')).encode())
+        return cls(tickers, rows, columns)
+
+    @classmethod
+    def load(cls, path: str | Path) -> Dataset:
+        """
+        :param path: a JSON file with the `columns` of the query and the `data` of the response
+        """
+        recorded = json.loads(Path(path).read_bytes())
+        data = recorded['data']
+        rows = [json.dumps(row, separators=(',', ':')).encode() for row in data]
+        return cls([row['s'] for row in data], rows, recorded['columns'])
+
+    def body(self, start: int = 0, end: int | None = None, symbols_only: bool = False) -> bytes:
+        rows = self.symbols if symbols_only else self.rows
+        data = b','.join(rows[start:end])
+        return b'{"totalCount":%d,"data":[%s]}' % (len(rows), data)
+
+    @property
+    def n_bytes(self) -> int:
+        return len(self.body())
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+
+class ReplayScanner:
+    """
+    Serve a `Dataset` over HTTP/1.1 (with keep-alive) on a random local port.
+
+    A POST request gets the rows within the `range` of its payload, and a GET request (like the one
+    sent by `get_all_symbols()`) gets the tickers only.
+    """
+
+    def __init__(self, dataset: Dataset) -> None:
+        self.dataset = dataset
+        self.requests = 0
+        scanner = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def _reply(self, body: bytes) -> None:
+                scanner.requests += 1
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self) -> None:
+                self._reply(scanner.dataset.body(symbols_only=True))
+
+            def do_POST(self) -> None:
+                payload = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+                start, end = payload.get('range', [0, None])
+                self._reply(scanner.dataset.body(start, end))
+
+            def log_message(self, *args) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f'http://127.0.0.1:{self._server.server_port}/america/scan'
+
+    @property
+    def url_template(self) -> str:
+        # the same format as `constants.URL`
+        return f'http://127.0.0.1:{self._server.server_port}/{{market}}/scan'
+
+    def __enter__(self) -> ReplayScanner:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,255 @@
+"""
+Replay stored OHLCV candles through the live indicators and strategies, and trade the signals
+with a PaperBroker.
+
+The candles are a long table (Parquet or CSV) with the columns
+`timestamp, ticker, open, high, low, close, volume`. Naive timestamps are in the market time zone
+(`BOT_MARKET_TIMEZONE`), and the days are the days of that time zone, like in the live bot.
+
+The candles are pivoted into one (timestamp x ticker) matrix per field, and the indicators of all
+the tickers are computed at once by `replay_matrix()` (bot/indicators.py): the same recurrences as
+the live IndicatorEngine, so the EMAs/RSI carry over from one day to the next exactly like in the
+bot. The first `warmup` candles of a ticker only warm up its indicators (the live scanner starts
+from a 250-candle download).
+
+Then the strategies are evaluated on all the bars of a day at once, one process per day with
+`--workers`, and the fills are replayed bar after bar, in this process, through
+trader.execute_signals.
+
+Usage: python src/bot/backtest.py candles.parquet [--workers 8] [--strategies ema_crossover]
+"""
+import argparse
+import contextlib
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+import pandas as pd
+
+from bot.broker import PaperBroker
+from bot.config import STARTING_CAPITAL, TIMEFRAME
+from bot.indicators import MAX_BARS, replay_matrix, to_market_time
+from bot.signals import SignalBatch, format_ts
+from bot.strategy import run_strategies
+from bot.trader import execute_signals
+
+FIELDS = ('open', 'high', 'low', 'close', 'volume')
+WARMUP_BARS = MAX_BARS  # the history the live scanner downloads before its first signal
+
+
+def load_candles(paths: Union[str, Path, Iterable[Union[str, Path]]]) -> pd.DataFrame:
+    if isinstance(paths, (str, Path)):
+        paths = [paths]
+    frames = []
+    for path in map(Path, paths):
+        if path.suffix == '.parquet':
+            frames.append(pd.read_parquet(path))
+        else:
+            frames.append(pd.read_csv(path))
+    candles = pd.concat(frames, ignore_index=True)
+
+    missing = {'timestamp', 'ticker', *FIELDS} - set(candles.columns)
+    if missing:
+        raise ValueError(f'the candles are missing the columns: {sorted(missing)}')
+    candles['timestamp'] = pd.to_datetime(candles['timestamp'])
+    return candles
+
+
+def pivot_candles(candles: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    """
+    :return: one (timestamp x ticker) frame per field, in the market time zone, NaN where a ticker
+     has no candle
+    """
+    candles = candles.dropna(subset=['close'])  # a candle without a close is no candle
+    candles = candles.drop_duplicates(['ticker', 'timestamp'], keep='last')
+    candles = candles.assign(timestamp=to_market_time(pd.DatetimeIndex(candles['timestamp'])))
+    wide = candles.pivot(index='timestamp', columns='ticker', values=list(FIELDS)).sort_index()
+    return {f: wide[f].astype(float) for f in FIELDS}
+
+
+def replay_indicators(wide: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """
+    :return: the candles with the indicators of their ticker after each one (`EMA<period>`,
+     `VWAP`, `RSI`) and their position in the history of the ticker (`bar`), sorted by time
+    """
+    close = wide['close']
+    days = close.index.normalize().asi8
+    arrays = {f: wide[f].to_numpy() for f in ('high', 'low', 'close', 'volume')}
+    indicators = replay_matrix(**arrays, days=days)
+
+    # back to one row per candle
+    traded = ~np.isnan(arrays['close'])
+    rows, cols = np.nonzero(traded)
+    return pd.DataFrame({
+        'timestamp': close.index[rows],
+        'ticker': close.columns.to_numpy(dtype=object)[cols],
+        'close': arrays['close'][rows, cols],
+        **{name: values[rows, cols] for name, values in indicators.items()},
+        'bar': np.cumsum(traded, axis=0)[rows, cols] - 1,
+    })
+
+
+def _scan_frame(indicators: pd.DataFrame, tf: str) -> pd.DataFrame:
+    # the indicators named like the columns of a live scan, plus the time of every bar
+    frame = indicators.rename(columns={
+        c: f'{c}|{tf}' for c in indicators.columns if c.startswith('EMA') or c in ('VWAP', 'RSI')
+    })
+    frame[f'close|{tf}'] = frame['close']
+    frame['ts'] = pd.DatetimeIndex(frame['timestamp']).as_unit('ns').asi8  # epoch nanoseconds
+    return frame
+
+
+def _day_signals(frame: pd.DataFrame, tf: str, strategies: Optional[List[str]]) -> SignalBatch:
+    # all the bars of the day at once, the signals keep the time of their bar
+    results = run_strategies(frame, tf, strategies)
+    bar_times = frame['ts'].to_numpy()
+    for name, batch in results.items():
+        if not np.isin(batch.ts, bar_times).all():
+            raise ValueError(f'the strategy {name!r} must give its signals the `ts` of their row')
+    batch = SignalBatch.concat(results.values())
+    # in time order, and in the order of the strategies within a bar
+    return batch.select(np.argsort(batch.ts, kind='stable'))
+
+
+@dataclass
+class BacktestReport:
+    starting_capital: float
+    final_value: float
+    equity: pd.Series  # portfolio value at the close of every day
+    trades: pd.DataFrame
+    n_signals: int
+    elapsed: float
+
+    @property
+    def pnl(self) -> float:
+        return self.final_value - self.starting_capital
+
+    @property
+    def pnl_pct(self) -> float:
+        return self.pnl / self.starting_capital * 100
+
+    @property
+    def max_drawdown(self) -> float:
+        if self.equity.empty:
+            return 0.0
+        return float((self.equity / self.equity.cummax() - 1).min() * 100)
+
+    @property
+    def win_rate(self) -> Optional[float]:
+        closed = self.trades['pnl'].dropna() if 'pnl' in self.trades else pd.Series(dtype=float)
+        return float((closed > 0).mean() * 100) if len(closed) else None
+
+    def print_summary(self):
+        realized = self.trades['pnl'].sum() if 'pnl' in self.trades else 0.0
+        pnl_str = f"+${self.pnl:,.2f}" if self.pnl >= 0 else f"-${abs(self.pnl):,.2f}"
+        win_rate = f"{self.win_rate:.1f}%" if self.win_rate is not None else "N/A"
+        print(f"\n{'='*50}")
+        print("  BACKTEST SUMMARY")
+        print(f"{'='*50}")
+        print(f"  Days:         {len(self.equity)}")
+        print(f"  Signals:      {self.n_signals:,}")
+        print(f"  Trades:       {len(self.trades):,}")
+        print(f"  Start:        ${self.starting_capital:,.2f}")
+        print(f"  End:          ${self.final_value:,.2f} ({pnl_str}, {self.pnl_pct:+.1f}%)")
+        print(f"  Realized:     ${realized:,.2f}")
+        print(f"  Win rate:     {win_rate}")
+        print(f"  Max drawdown: {self.max_drawdown:.1f}%")
+        print(f"  Time:         {self.elapsed:.1f}s")
+        print(f"{'='*50}\n")
+
+
+def run_backtest(
+    candles: pd.DataFrame,
+    timeframe: str = None,
+    strategies: Optional[List[str]] = None,
+    starting_capital: float = None,
+    workers: int = 0,
+    warmup: int = WARMUP_BARS,
+) -> BacktestReport:
+    start = time.perf_counter()
+    tf = timeframe or TIMEFRAME
+    capital = starting_capital or STARTING_CAPITAL
+
+    wide = pivot_candles(candles)
+    indicators = replay_indicators(wide)
+    frame = _scan_frame(indicators[indicators['bar'] >= warmup], tf)
+
+    # the last price of every ticker at the end of every day, forward-filled once
+    close = wide['close'].ffill()
+    days = close.index.normalize().unique()
+    day_ends = close.index.searchsorted(days + pd.Timedelta(days=1), side='left') - 1
+    # the bars of every day in the (time-sorted) scan frame
+    frame_days = frame['timestamp'].dt.normalize()
+    bounds = zip(frame_days.searchsorted(days, 'left'), frame_days.searchsorted(days, 'right'))
+    day_frames = [frame.iloc[lo:hi] for lo, hi in bounds]
+
+    with contextlib.ExitStack() as stack:
+        if workers > 1:
+            executor = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+            day_batches = executor.map(_day_signals, day_frames, repeat(tf), repeat(strategies))
+        else:
+            day_batches = map(_day_signals, day_frames, repeat(tf), repeat(strategies))
+
+        devnull = stack.enter_context(open(os.devnull, 'w'))
+        with contextlib.redirect_stdout(devnull):
+            broker = PaperBroker(capital)
+        equity = {}
+        n_signals = 0
+        for day, day_end, batch in zip(days, day_ends, day_batches):
+            n_signals += len(batch)
+            # the fills are sequential: every bar is executed after the previous one
+            bar_starts = np.flatnonzero(np.diff(batch.ts)) + 1
+            for rows in np.split(np.arange(len(batch)), bar_starts) if len(batch) else []:
+                n_trades = len(broker.trade_log)
+                with contextlib.redirect_stdout(devnull):
+                    execute_signals(batch.select(rows), broker)
+                bar_time = format_ts(int(batch.ts[rows[0]]))
+                for trade in broker.trade_log[n_trades:]:
+                    trade['time'] = bar_time
+
+            # mark to market with the last price of every ticker so far
+            equity[day] = broker.get_portfolio_value(close.iloc[day_end].dropna().to_dict())
+
+    last_prices = close.iloc[-1].dropna().to_dict() if len(close) else {}
+    return BacktestReport(
+        starting_capital=capital,
+        final_value=broker.get_portfolio_value(last_prices),
+        equity=pd.Series(equity, dtype=float),
+        trades=pd.DataFrame(broker.trade_log),
+        n_signals=n_signals,
+        elapsed=time.perf_counter() - start,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Backtest the bot strategies on stored candles')
+    parser.add_argument('paths', nargs='+', help='Parquet/CSV files with OHLCV candles')
+    parser.add_argument('--timeframe', default=TIMEFRAME)
+    parser.add_argument('--strategies', help='comma-separated, defaults to all of them')
+    parser.add_argument('--capital', type=float, default=STARTING_CAPITAL)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--warmup', type=int, default=WARMUP_BARS)
+    parser.add_argument('--trades', help='write the trades to this CSV file')
+    args = parser.parse_args()
+
+    strategies = args.strategies.split(',') if args.strategies else None
+    candles = load_candles(args.paths)
+    print(f"[backtest] {len(candles):,} candles, {candles['ticker'].nunique()} tickers")
+    report = run_backtest(
+        candles, args.timeframe, strategies, args.capital, args.workers, args.warmup
+    )
+    report.print_summary()
+    if args.trades:
+        report.trades.to_csv(args.trades, index=False)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,15 +1,24 @@
 import os
 from pathlib import Path
-from dotenv import load_dotenv
 
 # Load .env.local from project root (two levels up from this file)
 _project_root = Path(__file__).resolve().parent.parent.parent
-load_dotenv(_project_root / '.env.local')
+try:
+    from dotenv import load_dotenv
+except ImportError:
+    # without python-dotenv the settings come from the environment only (i.e. in the tests)
+    pass
+else:
+    load_dotenv(_project_root / '.env.local')
 
 # Scan settings
 SCAN_INTERVAL_MINUTES = int(os.environ.get('BOT_SCAN_INTERVAL_MINUTES', '5'))
 TIMEFRAME = os.environ.get('BOT_TIMEFRAME', '5')
 
+# The exchange time zone: the days of the candles (VWAP reset, backtest days) and the times of the
+# signals are in this time zone, naive timestamps are assumed to be in it as well
+MARKET_TIMEZONE = os.environ.get('BOT_MARKET_TIMEZONE', 'America/New_York')
+
 # Watchlist — comma-separated tickers like "NASDAQ:AAPL,NASDAQ:TSLA"
 WATCHLIST = [t.strip() for t in os.environ.get('BOT_WATCHLIST', '').split(',') if t.strip()]
 
@@ -18,6 +27,14 @@ EMA_SHORT = int(os.environ.get('BOT_EMA_SHORT', '8'))
 EMA_LONG = int(os.environ.get('BOT_EMA_LONG', '25'))
 EMA_TREND = int(os.environ.get('BOT_EMA_TREND', '200'))
 
+# Strategies to run on every scan (see bot/strategy.py), comma-separated, and how many of them
+# to evaluate in parallel (0 = one after the other)
+ENABLED_STRATEGIES = [s.strip() for s in os.environ.get('BOT_STRATEGIES', 'ema_crossover').split(',') if s.strip()]
+STRATEGY_WORKERS = int(os.environ.get('BOT_STRATEGY_WORKERS', '0'))
+
+# Where the extended-hours scanner keeps the EMA/VWAP/RSI state of every ticker between runs
+INDICATOR_STATE_PATH = os.environ.get('BOT_INDICATOR_STATE_PATH', str(_project_root / '.bot_indicators.json'))
+
 # Alert cooldown — don't re-alert the same ticker+action within this many minutes
 ALERT_COOLDOWN_MINUTES = int(os.environ.get('BOT_ALERT_COOLDOWN_MINUTES', '30'))
 
@@ -0,0 +1,323 @@
+"""
+Incremental EMA/VWAP/RSI per ticker, updated in O(1) for every new candle.
+
+The state of every ticker is the running form of the usual pandas computations, so folding the
+same candles gives the same values:
+- EMA: `ewm(span=period, adjust=False)`, one running value per period
+- RSI: `ewm(com=period - 1, min_periods=period)` (adjust=True) of the gains/losses, kept as the
+  weighted sums of the gains/losses and of the weights
+- VWAP: cumulative typical price x volume and volume, reset on the first candle of every day
+
+The live scanner (bot/webull_scanner.py) only commits the completed candles: the last candle of a
+download may still be forming, so it's applied to a copy of the state and committed on the next
+cycle. The states are saved to a JSON file, so a restart only downloads the candles it missed.
+The backtest (bot/backtest.py) runs the same recurrences for all the tickers at once, over
+(timestamp x ticker) matrices: `replay_matrix()`.
+
+The days (for the VWAP) are the days of the market time zone, the timestamps are converted to it.
+"""
+import json
+import math
+import os
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from bot.config import EMA_SHORT, EMA_LONG, EMA_TREND, INDICATOR_STATE_PATH, MARKET_TIMEZONE
+
+MAX_BARS = 250  # the history downloaded when there is no state (and the `volume` window)
+RSI_PERIOD = 14
+INTERVAL = pd.Timedelta(minutes=5)
+
+
+@dataclass
+class IndicatorState:
+    periods: tuple = (EMA_SHORT, EMA_LONG, EMA_TREND)
+    rsi_period: int = RSI_PERIOD
+    last_ts: Optional[datetime] = None      # the last committed candle
+    prev_close: Optional[float] = None
+    ema: Dict[int, float] = field(default_factory=dict)
+    gain_sum: float = 0.0
+    loss_sum: float = 0.0
+    weight: float = 0.0
+    n: int = 0
+    vwap_day: Optional[date] = None
+    cum_tp_vol: float = 0.0
+    cum_vol: float = 0.0
+    volumes: deque = field(default_factory=lambda: deque(maxlen=MAX_BARS))
+
+    def update(self, ts: datetime, high: float, low: float, close: float, volume: float):
+        ema = self.ema
+        for period in self.periods:
+            prev = ema.get(period)
+            ema[period] = close if prev is None else prev + 2 / (period + 1) * (close - prev)
+
+        # the first delta is NaN, which `where()` turns into a 0.0 gain and loss
+        delta = 0.0 if self.prev_close is None else close - self.prev_close
+        decay = 1 - 1 / self.rsi_period
+        self.gain_sum = (delta if delta > 0 else 0.0) + decay * self.gain_sum
+        self.loss_sum = (-delta if delta < 0 else 0.0) + decay * self.loss_sum
+        self.weight = 1.0 + decay * self.weight
+        self.n += 1
+        self.prev_close = close
+
+        day = ts.date()
+        if day != self.vwap_day:
+            self.vwap_day = day
+            self.cum_tp_vol = self.cum_vol = 0.0
+        self.cum_tp_vol += (high + low + close) / 3 * volume
+        self.cum_vol += volume
+
+        self.volumes.append(volume)
+        self.last_ts = ts
+
+    def rsi(self) -> float:
+        if self.n < self.rsi_period or self.loss_sum == 0:
+            return math.nan
+        rs = self.gain_sum / self.loss_sum  # the weights cancel out
+        return 100 - (100 / (1 + rs))
+
+    def vwap(self) -> float:
+        return self.cum_tp_vol / self.cum_vol if self.cum_vol else math.nan
+
+    def copy(self) -> 'IndicatorState':
+        state = IndicatorState(**{**self.__dict__, 'ema': dict(self.ema)})
+        state.volumes = deque(self.volumes, maxlen=MAX_BARS)
+        return state
+
+    def to_dict(self) -> dict:
+        return {
+            **self.__dict__,
+            'periods': list(self.periods),
+            'last_ts': pd.Timestamp(self.last_ts).isoformat() if self.last_ts else None,
+            'ema': {str(p): v for p, v in self.ema.items()},
+            'vwap_day': self.vwap_day.isoformat() if self.vwap_day else None,
+            'volumes': list(self.volumes),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'IndicatorState':
+        state = cls(**{
+            **data,
+            'periods': tuple(data['periods']),
+            'last_ts': to_market_time(pd.Timestamp(data['last_ts'])) if data['last_ts'] else None,
+            'ema': {int(p): v for p, v in data['ema'].items()},
+            'vwap_day': date.fromisoformat(data['vwap_day']) if data['vwap_day'] else None,
+        })
+        state.volumes = deque(data['volumes'], maxlen=MAX_BARS)
+        return state
+
+
+def to_market_time(ts):
+    # a Timestamp or a DatetimeIndex, naive ones are already in the market time zone
+    if ts.tz is None:
+        return ts.tz_localize(MARKET_TIMEZONE)
+    return ts.tz_convert(MARKET_TIMEZONE)
+
+
+def _bar_index(bars: pd.DataFrame) -> pd.DatetimeIndex:
+    # the timestamps match the candles with the state, they can't be made up
+    if isinstance(bars.index, pd.DatetimeIndex):
+        return to_market_time(bars.index)
+    for col in ('timestamp', 'time', 'date'):
+        if col in bars.columns:
+            return to_market_time(pd.DatetimeIndex(pd.to_datetime(bars[col])))
+    raise ValueError('the candles have no timestamps (a DatetimeIndex or a `timestamp` column)')
+
+
+def _fields(bars: pd.DataFrame):
+    close = bars['close'].to_numpy(dtype=float)
+    high = bars['high'].to_numpy(dtype=float) if 'high' in bars.columns else close
+    low = bars['low'].to_numpy(dtype=float) if 'low' in bars.columns else close
+    if 'volume' in bars.columns:
+        volume = bars['volume'].to_numpy(dtype=float)
+    else:
+        volume = np.zeros(len(bars))
+    return high.tolist(), low.tolist(), close.tolist(), volume.tolist()
+
+
+class IndicatorEngine:
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        periods: Iterable[int] = None,
+        interval: pd.Timedelta = INTERVAL,
+    ):
+        self.path = path or INDICATOR_STATE_PATH
+        self.periods = tuple(periods or (EMA_SHORT, EMA_LONG, EMA_TREND))
+        self.interval = interval
+        self.states: Dict[str, IndicatorState] = {}
+
+    @classmethod
+    def load(cls, path: Optional[str] = None, **kwargs) -> 'IndicatorEngine':
+        engine = cls(path, **kwargs)
+        try:
+            with open(engine.path) as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return engine
+        except (OSError, ValueError) as e:
+            print(f"[indicators] Ignoring unreadable state {engine.path}: {e}")
+            return engine
+        for ticker, state in data.items():
+            state = IndicatorState.from_dict(state)
+            # a change of the EMA periods invalidates the state
+            if state.periods == engine.periods:
+                engine.states[ticker] = state
+        return engine
+
+    def save(self):
+        data = {ticker: state.to_dict() for ticker, state in self.states.items()}
+        tmp = f'{self.path}.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp, self.path)  # never leave a half-written file
+
+    def bars_needed(self, ticker: str) -> int:
+        state = self.states.get(ticker)
+        if state is None or state.last_ts is None:
+            return MAX_BARS
+        last = pd.Timestamp(state.last_ts)
+        now = pd.Timestamp.now(tz=last.tz)
+        # the candles after the last committed one, plus the one being formed
+        missed = math.ceil(max((now - last) / self.interval, 0)) + 1
+        return max(2, min(MAX_BARS, missed))
+
+    def _state(self, ticker: str, first_ts: pd.Timestamp) -> IndicatorState:
+        state = self.states.get(ticker)
+        if state is not None and state.last_ts is not None:
+            # a download reaches back to the last committed candle, unless it was capped at
+            # MAX_BARS: then the candles in between are lost and the state would be wrong
+            if first_ts > state.last_ts + self.interval:
+                print(
+                    f"[indicators] {ticker}: no candles between {state.last_ts} and {first_ts}, "
+                    f"re-seeding the indicators"
+                )
+                state = None
+        if state is None:
+            state = self.states[ticker] = IndicatorState(periods=self.periods)
+        return state
+
+    def update(self, ticker: str, bars: pd.DataFrame) -> Optional[dict]:
+        """
+        Fold the new candles of a live download into the state of the ticker, the last candle
+        (which may still be forming) is only applied to a copy.
+
+        :return: the indicators as of the last candle, or None if there are no candles
+        """
+        if bars is None or bars.empty:
+            return None
+        index = _bar_index(bars)
+        state = self._state(ticker, index[0])
+        last_ts = state.last_ts
+        high, low, close, volume = _fields(bars)
+
+        for i in range(len(bars) - 1):
+            if last_ts is None or index[i] > last_ts:
+                state.update(index[i], high[i], low[i], close[i], volume[i])
+
+        current = state.copy()
+        if last_ts is None or index[-1] > last_ts:
+            current.update(index[-1], high[-1], low[-1], close[-1], volume[-1])
+        return {
+            'close': close[-1],
+            'ema': dict(current.ema),
+            'vwap': current.vwap(),
+            'rsi': current.rsi(),
+            'volume': sum(current.volumes),
+            'last_volume': current.volumes[-1] if current.volumes else 0.0,
+        }
+
+    def replay(self, ticker: str, bars: pd.DataFrame) -> pd.DataFrame:
+        """
+        Fold completed candles (i.e. stored ones) into the state of the ticker, one at a time.
+
+        :return: the indicators after every candle, one row per candle (`EMA<period>`, `VWAP`,
+         `RSI`), for the candles that are newer than the state
+        """
+        index = _bar_index(bars)
+        if not len(index):
+            return pd.DataFrame(columns=[*(f'EMA{p}' for p in self.periods), 'VWAP', 'RSI'])
+        state = self._state(ticker, index[0])
+        if state.last_ts is not None:
+            new = index > state.last_ts
+            bars, index = bars[new], index[new]
+        high, low, close, volume = _fields(bars)
+
+        update, ema, periods = state.update, state.ema, self.periods
+        rows = []
+        for row in zip(index.to_pydatetime(), high, low, close, volume):
+            update(*row)
+            rows.append([ema[p] for p in periods] + [state.vwap(), state.rsi()])
+        columns = [*(f'EMA{p}' for p in periods), 'VWAP', 'RSI']
+        return pd.DataFrame(np.array(rows, dtype=float), index=index, columns=columns)
+
+
+def replay_matrix(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    volume: np.ndarray,
+    days: np.ndarray,
+    periods: Iterable[int] = None,
+    rsi_period: int = RSI_PERIOD,
+) -> Dict[str, np.ndarray]:
+    """
+    `IndicatorState.update()` for many tickers at once: the same operations, on whole rows of
+    (timestamp x ticker) matrices, so the results are the same to the last bit. A NaN close is a
+    missing candle, which leaves the state of that ticker as it is.
+
+    :param days: the day of every row (any integer code), the VWAP starts over on a new day
+    :return: the indicators after every candle (`EMA<period>`, `VWAP`, `RSI`), as matrices of the
+     same shape
+    """
+    periods = tuple(periods or (EMA_SHORT, EMA_LONG, EMA_TREND))
+    n_rows, n_tickers = close.shape
+    out = {f'EMA{p}': np.empty(close.shape) for p in periods}
+    out['VWAP'], out['RSI'] = np.empty(close.shape), np.empty(close.shape)
+
+    def state():
+        return np.full(n_tickers, np.nan)
+
+    ema = {p: state() for p in periods}
+    prev_close, gain_sum, loss_sum = state(), np.zeros(n_tickers), np.zeros(n_tickers)
+    n = np.zeros(n_tickers, dtype=np.int64)
+    vwap_day = np.full(n_tickers, np.iinfo(np.int64).min)
+    cum_tp_vol, cum_vol = np.zeros(n_tickers), np.zeros(n_tickers)
+    decay = 1 - 1 / rsi_period
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        for t in range(n_rows):
+            c = close[t]
+            traded = ~np.isnan(c)
+            for period in periods:
+                prev = ema[period]
+                value = np.where(np.isnan(prev), c, prev + 2 / (period + 1) * (c - prev))
+                ema[period] = np.where(traded, value, prev)
+                out[f'EMA{period}'][t] = ema[period]
+
+            # the first delta of a ticker gives a 0.0 gain and loss
+            delta = np.where(np.isnan(prev_close), 0.0, c - prev_close)
+            gain = np.where(delta > 0, delta, 0.0) + decay * gain_sum
+            loss = np.where(delta < 0, -delta, 0.0) + decay * loss_sum
+            gain_sum = np.where(traded, gain, gain_sum)
+            loss_sum = np.where(traded, loss, loss_sum)
+            n += traded
+            prev_close = np.where(traded, c, prev_close)
+
+            new_day = traded & (vwap_day != days[t])
+            vwap_day = np.where(traded, days[t], vwap_day)
+            cum_tp_vol = np.where(new_day, 0.0, cum_tp_vol)
+            cum_vol = np.where(new_day, 0.0, cum_vol)
+            tp_vol = (high[t] + low[t] + c) / 3 * volume[t]
+            cum_tp_vol = np.where(traded, cum_tp_vol + tp_vol, cum_tp_vol)
+            cum_vol = np.where(traded, cum_vol + volume[t], cum_vol)
+
+            out['VWAP'][t] = np.where(cum_vol != 0, cum_tp_vol / cum_vol, np.nan)
+            rsi = 100 - (100 / (1 + gain_sum / loss_sum))
+            out['RSI'][t] = np.where((n >= rsi_period) & (loss_sum != 0), rsi, np.nan)
+    return out
@@ -7,10 +7,11 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 import schedule
 
 from bot.config import SCAN_INTERVAL_MINUTES, TIMEFRAME, BROKER_MODE, TRADEZERO_USERNAME, TRADEZERO_PASSWORD
+from bot.config import ENABLED_STRATEGIES, STRATEGY_WORKERS
 from bot.scanner import scan_stocks
 from bot.webull_scanner import scan_extended_hours
 from bot.watchlist import fetch_gainers
-from bot.strategy import ema_crossover
+from bot.strategy import SignalBatch, run_strategies
 from bot.alerter import send_alert, send_portfolio_summary
 from bot.storage import save_signal, was_recently_alerted
 from bot.broker import PaperBroker, TradeZeroBroker
@@ -49,31 +50,38 @@ def run_scan():
         df = scan_extended_hours(WATCHLIST, TIMEFRAME)
     else:
         print("[bot] Regular scan")
-        df = scan_stocks(WATCHLIST, TIMEFRAME)
+        df = scan_stocks(WATCHLIST, TIMEFRAME, ENABLED_STRATEGIES)
 
     if df is None or df.empty:
         print("[bot] No data returned")
         return
 
-    signals = ema_crossover(df, TIMEFRAME)
+    results = run_strategies(df, TIMEFRAME, ENABLED_STRATEGIES, max_workers=STRATEGY_WORKERS)
+    signals = SignalBatch.concat(results.values())
+    for name, strategy_signals in results.items():
+        print(f"[bot] {name}: {len(strategy_signals)} signal(s)")
     print(f"[bot] Found {len(signals)} signal(s)")
 
-    # Alert + deduplicate
-    for signal in signals:
-        if was_recently_alerted(signal.ticker, signal.action):
+    # Alert + deduplicate, then store the alerted signals in one write
+    # (the batch isn't stored yet, so the cooldown within the batch is checked here)
+    alerted = [False] * len(signals)
+    seen = set()
+    for i, signal in enumerate(signals):
+        key = (signal.ticker, signal.action)
+        if key in seen or was_recently_alerted(signal.ticker, signal.action):
             print(f"[bot] Skipping (cooldown): {signal.ticker} {signal.action}")
             continue
+        seen.add(key)
         send_alert(signal)
-        save_signal(signal)
+        alerted[i] = True
+    save_signal(signals.select(alerted))
 
     # Execute trades via broker
     execute_signals(signals, broker)
 
     # Print portfolio summary with current prices
     if hasattr(broker, 'print_summary'):
-        prices = {}
-        for signal in signals:
-            prices[signal.ticker] = signal.price
+        prices = dict(zip(signals.ticker.tolist(), signals.price.tolist()))
         # Also include prices for existing positions from the scan data
         if df is not None and not df.empty:
             close_col = f'close|{TIMEFRAME}'
@@ -88,6 +96,7 @@ def run_scan():
 
 def main():
     print(f"[bot] Starting EMA Crossover Bot")
+    print(f"[bot] Strategies: {', '.join(ENABLED_STRATEGIES)}")
     print(f"[bot] Mode: {BROKER_MODE}")
     print(f"[bot] Watchlist: dynamic (Webull top gainers, vol > 100K)")
     print(f"[bot] Interval: every {SCAN_INTERVAL_MINUTES} minutes")
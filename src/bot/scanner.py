@@ -5,6 +5,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from tradingview_screener.query import Query
 from bot.config import EMA_SHORT, EMA_LONG, EMA_TREND
+from bot.strategy import required_columns
 
 
 def _ema_col(period, tf):
@@ -23,10 +24,12 @@ def _build_columns(tf):
     ]
 
 
-def scan_stocks(tickers, timeframe='5'):
+def scan_stocks(tickers, timeframe='5', strategies=None):
     if not tickers:
         return None
-    q = Query().select(*_build_columns(timeframe)).set_tickers(*tickers)
+    # one query for all the strategies: the base columns plus every column they declare
+    columns = list(dict.fromkeys(_build_columns(timeframe) + required_columns(timeframe, strategies)))
+    q = Query().select(*columns).set_tickers(*tickers)
     n_rows, df = q.get_scanner_data()
     return df
 
@@ -0,0 +1,234 @@
+import time
+from dataclasses import dataclass, field, fields
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from bot.config import MARKET_TIMEZONE
+
+ACTIONS = ('buy', 'strong_buy', 'sell_ema_cross', 'sell_vwap_break', 'strong_sell')
+ACTION_CODES = {action: code for code, action in enumerate(ACTIONS)}
+BUY_CODES = (ACTION_CODES['buy'], ACTION_CODES['strong_buy'])
+
+_TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%S'
+
+
+def _add_slots(cls):
+    # what `dataclass(slots=True)` does on Python 3.10+, which 3.9 lacks: recreate the class with
+    # __slots__ (and without the field defaults as class attributes, __init__ already has them)
+    names = tuple(f.name for f in fields(cls))
+
+    def __getstate__(self):
+        return [getattr(self, name) for name in names]
+
+    def __setstate__(self, state):
+        # a frozen class can't be unpickled with setattr()
+        for name, value in zip(names, state):
+            object.__setattr__(self, name, value)
+
+    attrs = {k: v for k, v in cls.__dict__.items() if k not in (*names, '__dict__', '__weakref__')}
+    attrs.update(__slots__=names, __getstate__=__getstate__, __setstate__=__setstate__)
+    return type(cls)(cls.__name__, cls.__bases__, attrs)
+
+
+def format_ts(ts: int) -> str:
+    # epoch nanoseconds -> market time, the format stored in MongoDB
+    return pd.Timestamp(ts, tz='UTC').tz_convert(MARKET_TIMEZONE).strftime(_TIMESTAMP_FORMAT)
+
+
+@_add_slots
+@dataclass(frozen=True)
+class Signal:
+    ticker: str
+    action: str          # 'buy', 'strong_buy', 'sell_ema_cross', 'sell_vwap_break', 'strong_sell'
+    price: float
+    ema_short: float
+    ema_long: float
+    ema_trend: float
+    vwap: Optional[float] = None
+    rsi: Optional[float] = None
+    ts: int = field(default_factory=time.time_ns)  # epoch nanoseconds
+
+    @property
+    def timestamp(self) -> str:
+        # only formatted when it's displayed or stored
+        return format_ts(self.ts)
+
+    def to_doc(self) -> dict:
+        return {
+            'ticker': self.ticker,
+            'action': self.action,
+            'price': self.price,
+            'ema_short': self.ema_short,
+            'ema_long': self.ema_long,
+            'ema_trend': self.ema_trend,
+            'vwap': self.vwap,
+            'rsi': self.rsi,
+            'timestamp': self.timestamp,
+        }
+
+
+_FLOAT_FIELDS = ('price', 'ema_short', 'ema_long', 'ema_trend', 'vwap', 'rsi')
+
+
+def _none_if_nan(value: float) -> Optional[float]:
+    return None if value != value else value
+
+
+# eq=False: comparing batches field by field is ambiguous for arrays
+@dataclass(frozen=True, eq=False)
+class SignalBatch:
+    """
+    Many signals stored column by column: one array per field, with the actions as small integer
+    codes (see `ACTIONS`) and the timestamps as epoch nanoseconds. Missing VWAP/RSI values are NaN.
+
+    Iterating over a batch yields `Signal` objects, so code written for a list of signals keeps
+    working, but the hot paths (storage, trading, backtests) use the arrays directly.
+    """
+
+    ticker: np.ndarray      # object
+    action: np.ndarray      # int8 codes
+    price: np.ndarray       # float64
+    ema_short: np.ndarray
+    ema_long: np.ndarray
+    ema_trend: np.ndarray
+    vwap: np.ndarray
+    rsi: np.ndarray
+    ts: np.ndarray          # int64, epoch nanoseconds
+
+    @classmethod
+    def from_arrays(
+        cls,
+        ticker: Sequence[str],
+        action: Union[Sequence[str], np.ndarray],
+        price,
+        ema_short,
+        ema_long,
+        ema_trend,
+        vwap=None,
+        rsi=None,
+        ts: Union[int, Sequence[int], None] = None,
+    ) -> 'SignalBatch':
+        n = len(ticker)
+        action = np.asarray(action)
+        if action.dtype.kind in 'US' or action.dtype == object:
+            action = np.array([ACTION_CODES[a] for a in action.tolist()], dtype=np.int8)
+
+        def floats(values):
+            if values is None:
+                return np.full(n, np.nan)
+            values = np.asarray(values)
+            if values.dtype.kind in 'biuf':
+                return values.astype(float, copy=False)
+            # lists with None (or strings) go through pandas
+            return pd.to_numeric(pd.Series(values, dtype=object), errors='coerce').to_numpy(
+                dtype=float, na_value=np.nan
+            )
+
+        ts = time.time_ns() if ts is None else ts
+        return cls(
+            ticker=np.asarray(ticker, dtype=object),
+            action=action.astype(np.int8, copy=False),
+            price=floats(price),
+            ema_short=floats(ema_short),
+            ema_long=floats(ema_long),
+            ema_trend=floats(ema_trend),
+            vwap=floats(vwap),
+            rsi=floats(rsi),
+            ts=np.broadcast_to(np.asarray(ts, dtype=np.int64), (n,)).copy(),
+        )
+
+    @classmethod
+    def from_signals(cls, signals: Iterable[Signal]) -> 'SignalBatch':
+        signals = list(signals)
+        return cls.from_arrays(
+            [s.ticker for s in signals],
+            [s.action for s in signals],
+            *([getattr(s, f) for s in signals] for f in _FLOAT_FIELDS),
+            ts=[s.ts for s in signals],
+        )
+
+    @classmethod
+    def empty(cls) -> 'SignalBatch':
+        return cls.from_arrays([], [], [], [], [], [])
+
+    @classmethod
+    def concat(cls, batches: Iterable['SignalBatch']) -> 'SignalBatch':
+        batches = [b if isinstance(b, SignalBatch) else cls.from_signals(b) for b in batches]
+        if not batches:
+            return cls.empty()
+        return cls(**{
+            name: np.concatenate([getattr(b, name) for b in batches])
+            for name in cls.__dataclass_fields__
+        })
+
+    @property
+    def actions(self) -> np.ndarray:
+        return np.asarray(ACTIONS, dtype=object)[self.action]
+
+    @property
+    def is_buy(self) -> np.ndarray:
+        return np.isin(self.action, BUY_CODES)
+
+    @property
+    def is_sell(self) -> np.ndarray:
+        return ~self.is_buy
+
+    def select(self, mask) -> 'SignalBatch':
+        return SignalBatch(**{
+            name: getattr(self, name)[mask] for name in self.__dataclass_fields__
+        })
+
+    def to_frame(self) -> pd.DataFrame:
+        df = pd.DataFrame({name: getattr(self, name) for name in self.__dataclass_fields__})
+        df['action'] = pd.Categorical.from_codes(self.action, ACTIONS)
+        return df
+
+    def to_docs(self) -> List[Dict]:
+        # the same documents as `Signal.to_doc()`, one per row
+        timestamps = {ts: format_ts(ts) for ts in np.unique(self.ts).tolist()}
+        columns = [getattr(self, f).tolist() for f in _FLOAT_FIELDS]
+        return [
+            {
+                'ticker': ticker,
+                'action': ACTIONS[code],
+                'price': price,
+                'ema_short': ema_s,
+                'ema_long': ema_l,
+                'ema_trend': ema_t,
+                'vwap': _none_if_nan(vwap),
+                'rsi': _none_if_nan(rsi),
+                'timestamp': timestamps[ts],
+            }
+            for ticker, code, price, ema_s, ema_l, ema_t, vwap, rsi, ts in zip(
+                self.ticker.tolist(), self.action.tolist(), *columns, self.ts.tolist()
+            )
+        ]
+
+    def __getitem__(self, i: int) -> Signal:
+        return Signal(
+            ticker=self.ticker[i],
+            action=ACTIONS[self.action[i]],
+            price=float(self.price[i]),
+            ema_short=float(self.ema_short[i]),
+            ema_long=float(self.ema_long[i]),
+            ema_trend=float(self.ema_trend[i]),
+            vwap=_none_if_nan(float(self.vwap[i])),
+            rsi=_none_if_nan(float(self.rsi[i])),
+            ts=int(self.ts[i]),
+        )
+
+    def __iter__(self) -> Iterator[Signal]:
+        return (self[i] for i in range(len(self)))
+
+    def __len__(self) -> int:
+        return len(self.ticker)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __repr__(self) -> str:
+        codes, counts = np.unique(self.action, return_counts=True)
+        counts = {ACTIONS[code]: count for code, count in zip(codes.tolist(), counts.tolist())}
+        return f'SignalBatch({len(self)} signals, {counts})'
@@ -1,8 +1,8 @@
-from dataclasses import asdict
 from datetime import datetime, timedelta
+from typing import Union
 
 from bot.config import MONGODB_CONNECTION_STRING, MONGODB_DATABASE, SIGNALS_COLLECTION, ALERT_COOLDOWN_MINUTES
-from bot.strategy import Signal
+from bot.strategy import Signal, SignalBatch
 
 # In-memory cooldown cache as fallback when MongoDB is unavailable
 _recent_alerts = {}
@@ -17,11 +17,14 @@ def _get_collection():
     return client, db[SIGNALS_COLLECTION]
 
 
-def save_signal(signal: Signal):
+def save_signal(signal: Union[Signal, SignalBatch]):
+    # a batch is written with a single insert_many
+    docs = signal.to_docs() if isinstance(signal, SignalBatch) else [signal.to_doc()]
+    if not docs:
+        return
     try:
         client, collection = _get_collection()
-        doc = asdict(signal)
-        collection.insert_one(doc)
+        collection.insert_many(docs)
         client.close()
     except Exception as e:
         print(f"[storage] MongoDB unavailable, signal not persisted: {e}")
@@ -1,28 +1,129 @@
-from dataclasses import dataclass, field
-from datetime import datetime
-from typing import List, Optional
+import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Union
 
+import numpy as np
 import pandas as pd
 
 from bot.config import EMA_SHORT, EMA_LONG, EMA_TREND, TIMEFRAME
+from bot.signals import ACTION_CODES, Signal, SignalBatch  # noqa: F401 (Signal is re-exported)
 
+logger = logging.getLogger(__name__)
 
-@dataclass
-class Signal:
-    ticker: str
-    action: str          # 'buy', 'strong_buy', 'sell_ema_cross', 'sell_vwap_break', 'strong_sell'
-    price: float
-    ema_short: float
-    ema_long: float
-    ema_trend: float
-    vwap: Optional[float] = None
-    rsi: Optional[float] = None
-    timestamp: str = field(default_factory=lambda: datetime.now().strftime('%Y-%m-%dT%H:%M:%S'))
 
+@dataclass(frozen=True)
+class Strategy:
+    name: str
+    func: Callable[[pd.DataFrame, str], Union[SignalBatch, List[Signal]]]
+    columns: Callable[[str], List[str]]  # the scan columns it reads, for a given timeframe
 
-def ema_crossover(df: pd.DataFrame, timeframe: str = None) -> List[Signal]:
+
+# name -> Strategy, filled by @register
+STRATEGIES: Dict[str, Strategy] = {}
+
+
+def register(name: str, columns: Callable[[str], List[str]]):
+    def decorator(func):
+        STRATEGIES[name] = Strategy(name, func, columns)
+        return func
+    return decorator
+
+
+def get_strategies(names: Optional[Iterable[str]] = None) -> List[Strategy]:
+    if names is None:
+        return list(STRATEGIES.values())
+    missing = [n for n in names if n not in STRATEGIES]
+    if missing:
+        raise KeyError(f'unknown strategies: {missing}, available: {list(STRATEGIES)}')
+    return [STRATEGIES[n] for n in names]
+
+
+def required_columns(timeframe: str = None, names: Optional[Iterable[str]] = None) -> List[str]:
+    # the union of the columns of the strategies, in order and without duplicates
+    tf = timeframe or TIMEFRAME
+    columns = {}
+    for strategy in get_strategies(names):
+        columns.update(dict.fromkeys(strategy.columns(tf)))
+    return list(columns)
+
+
+def _run_one(strategy: Strategy, df: pd.DataFrame, tf: str, strict: bool = False) -> SignalBatch:
+    try:
+        signals = strategy.func(df, tf)
+    except Exception:
+        if strict:
+            raise
+        # one broken strategy shouldn't stop the others, but it must show up in the logs
+        logger.exception("[strategy] %s failed", strategy.name)
+        return SignalBatch.empty()
+    # strategies may also return a plain list of Signal objects
+    return signals if isinstance(signals, SignalBatch) else SignalBatch.from_signals(signals)
+
+
+def run_strategies(
+    df: pd.DataFrame,
+    timeframe: str = None,
+    names: Optional[Iterable[str]] = None,
+    max_workers: int = 0,
+    processes: bool = False,
+    strict: bool = False,
+) -> Dict[str, SignalBatch]:
+    """
+    Evaluate the strategies over the same scan frame.
+
+    With `max_workers` > 1 they run in a thread pool (or a process pool with `processes=True`,
+    for CPU-heavy strategies, in which case they must be module-level functions).
+    A strategy that raises is logged and gives no signals, unless `strict=True` (then the
+    exception is raised).
+
+    A frame may have a `ts` column with the time of every row (epoch nanoseconds, the backtest
+    evaluates many bars at once), the signals of a row must then carry its `ts`.
+    """
+    tf = timeframe or TIMEFRAME
+    strategies = get_strategies(names)
+    if df is None or df.empty:
+        return {strategy.name: SignalBatch.empty() for strategy in strategies}
+
+    if max_workers <= 1 or len(strategies) <= 1:
+        return {strategy.name: _run_one(strategy, df, tf, strict) for strategy in strategies}
+
+    pool = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    with pool(max_workers=min(max_workers, len(strategies))) as executor:
+        futures = {s.name: executor.submit(_run_one, s, df, tf, strict) for s in strategies}
+        return {name: future.result() for name, future in futures.items()}
+
+
+def _present(df: pd.DataFrame, col: str) -> Optional[np.ndarray]:
+    # a field is missing if its column is missing (-> None) or if the value is None, NaN counts
+    # as present (the comparisons below are just False for it)
+    if col not in df.columns:
+        return None
+    values = df[col].to_numpy()
+    if values.dtype != object:
+        return np.ones(len(values), dtype=bool)
+    return np.fromiter((v is not None for v in values), dtype=bool, count=len(values))
+
+
+def _floats(df: pd.DataFrame, col: str) -> np.ndarray:
+    series = df[col]
+    if series.dtype.kind in 'biuf':
+        return series.to_numpy(dtype=float)
+    return pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+
+
+def _ema_crossover_columns(tf: str) -> List[str]:
+    return [
+        'name', 'close', f'close|{tf}',
+        f'EMA{EMA_SHORT}|{tf}', f'EMA{EMA_LONG}|{tf}', f'EMA{EMA_TREND}|{tf}',
+        f'VWAP|{tf}', f'RSI|{tf}',
+    ]
+
+
+@register('ema_crossover', _ema_crossover_columns)
+def ema_crossover(df: pd.DataFrame, timeframe: str = None) -> SignalBatch:
     if df is None or df.empty:
-        return []
+        return SignalBatch.empty()
 
     tf = timeframe or TIMEFRAME
     ema_short_col = f'EMA{EMA_SHORT}|{tf}'
@@ -32,55 +133,65 @@ def ema_crossover(df: pd.DataFrame, timeframe: str = None) -> List[Signal]:
     rsi_col = f'RSI|{tf}'
     close_col = f'close|{tf}'
 
-    signals = []
-    for _, row in df.iterrows():
-        ticker = row.get('ticker', row.get('name', 'UNKNOWN'))
-        price = row.get(close_col, row.get('close', 0))
-        ema_s = row.get(ema_short_col, None)
-        ema_l = row.get(ema_long_col, None)
-        ema_t = row.get(ema_trend_col, None)
-        vwap = row.get(vwap_col, None)
-        rsi = row.get(rsi_col, None)
-
-        if ema_s is None or ema_l is None or ema_t is None or vwap is None:
-            continue
-
-        action = None
-
-        ema_bullish = ema_s > ema_l
-        above_vwap = price > vwap
-        above_trend = price > ema_t
-
-        # === BUY: EMA bullish + above VWAP + above trend ===
-        if ema_bullish and above_vwap and above_trend:
-            action = 'buy'
-            if rsi and 40 < rsi < 70:
-                action = 'strong_buy'
-
-        # === SELL SIGNALS (any one triggers exit) ===
-
-        # Strong sell: EMA bearish AND below VWAP (both confirm)
-        elif not ema_bullish and not above_vwap:
-            action = 'strong_sell'
-
-        # EMA cross exit: EMA8 crossed below EMA25 (momentum lost)
-        elif not ema_bullish and above_vwap:
-            action = 'sell_ema_cross'
-
-        # VWAP exit: price dropped below VWAP while EMA still bullish (early warning)
-        elif ema_bullish and not above_vwap:
-            action = 'sell_vwap_break'
-
-        if action:
-            signals.append(Signal(
-                ticker=ticker,
-                action=action,
-                price=price,
-                ema_short=ema_s,
-                ema_long=ema_l,
-                ema_trend=ema_t,
-                vwap=vwap,
-                rsi=rsi,
-            ))
-
-    return signals
+    # rows with a missing EMA or VWAP are skipped
+    valid = np.ones(len(df), dtype=bool)
+    for col in (ema_short_col, ema_long_col, ema_trend_col, vwap_col):
+        present = _present(df, col)
+        if present is None:
+            return SignalBatch.empty()
+        valid &= present
+
+    price_col = close_col if close_col in df.columns else 'close' if 'close' in df.columns else None
+    price = _floats(df, price_col) if price_col else np.zeros(len(df))
+    ema_s = _floats(df, ema_short_col)
+    ema_l = _floats(df, ema_long_col)
+    ema_t = _floats(df, ema_trend_col)
+    vwap = _floats(df, vwap_col)
+    rsi = _floats(df, rsi_col) if rsi_col in df.columns else np.full(len(df), np.nan)
+
+    ema_bullish = ema_s > ema_l
+    above_vwap = price > vwap
+    above_trend = price > ema_t
+    buy = ema_bullish & above_vwap & above_trend
+    rsi_band = (rsi > 40) & (rsi < 70)
+
+    action = np.select(
+        [
+            # === BUY: EMA bullish + above VWAP + above trend ===
+            buy & rsi_band,
+            buy,
+            # === SELL SIGNALS (any one triggers exit) ===
+            # Strong sell: EMA bearish AND below VWAP (both confirm)
+            ~ema_bullish & ~above_vwap,
+            # EMA cross exit: EMA8 crossed below EMA25 (momentum lost)
+            ~ema_bullish & above_vwap,
+            # VWAP exit: price dropped below VWAP while EMA still bullish (early warning)
+            ema_bullish & ~above_vwap,
+        ],
+        [
+            ACTION_CODES[a]
+            for a in ('strong_buy', 'buy', 'strong_sell', 'sell_ema_cross', 'sell_vwap_break')
+        ],
+        default=-1,
+    )
+    rows = np.flatnonzero(valid & (action >= 0))
+
+    if 'ticker' in df.columns:
+        tickers = df['ticker'].to_numpy()[rows]
+    elif 'name' in df.columns:
+        tickers = df['name'].to_numpy()[rows]
+    else:
+        tickers = np.full(len(rows), 'UNKNOWN', dtype=object)
+
+    # no per-signal objects: the rows that fire are gathered into arrays
+    return SignalBatch.from_arrays(
+        tickers,
+        action[rows],
+        price[rows],
+        ema_s[rows],
+        ema_l[rows],
+        ema_t[rows],
+        vwap[rows],
+        rsi[rows],
+        ts=df['ts'].to_numpy(dtype=np.int64)[rows] if 'ts' in df.columns else None,
+    )
@@ -1,28 +1,34 @@
-import math
-from typing import List
+from typing import List, Union
+
+import numpy as np
 
 from bot.broker import Broker
 from bot.config import POSITION_SIZE
-from bot.strategy import Signal
+from bot.signals import ACTIONS
+from bot.strategy import Signal, SignalBatch
 
 
-def execute_signals(signals: List[Signal], broker: Broker):
+def execute_signals(signals: Union[SignalBatch, List[Signal]], broker: Broker):
+    if not isinstance(signals, SignalBatch):
+        signals = SignalBatch.from_signals(signals)
     if not signals:
         return
 
-    for signal in signals:
-        ticker = signal.ticker
-        price = signal.price
-
-        if price <= 0:
-            continue
-
-        is_buy = signal.action in ('buy', 'strong_buy')
-        is_sell = signal.action in ('sell_ema_cross', 'sell_vwap_break', 'strong_sell')
+    # sizes for the whole batch at once, and drop the signals that can't be traded
+    price = signals.price
+    with np.errstate(divide='ignore', invalid='ignore'):
+        qty = np.floor(POSITION_SIZE / np.where(price > 0, price, np.nan))
+    tradable = np.flatnonzero((price > 0) & (qty > 0))
 
-        qty = math.floor(POSITION_SIZE / price)
-        if qty <= 0:
-            continue
+    for ticker, code, price, qty, is_buy in zip(
+        signals.ticker[tradable].tolist(),
+        signals.action[tradable].tolist(),
+        price[tradable].tolist(),
+        qty[tradable].astype(int).tolist(),
+        signals.is_buy[tradable].tolist(),
+    ):
+        action = ACTIONS[code]
+        is_sell = not is_buy
 
         if is_buy:
             # Cover short position first if we have one
@@ -30,12 +36,12 @@ def execute_signals(signals: List[Signal], broker: Broker):
                 positions = broker.get_positions() if not hasattr(broker, 'short_positions') else {}
                 short_pos = getattr(broker, 'short_positions', {}).get(ticker)
                 if short_pos:
-                    print(f"[trader] Signal: {signal.action.upper()} {ticker} @ ${price:.2f} -> covering {short_pos.qty} short shares")
+                    print(f"[trader] Signal: {action.upper()} {ticker} @ ${price:.2f} -> covering {short_pos.qty} short shares")
                     broker.cover(ticker, short_pos.qty, price)
 
             # Open long if not already holding
             if not broker.has_position(ticker):
-                print(f"[trader] Signal: {signal.action.upper()} {ticker} @ ${price:.2f} -> buying {qty} shares")
+                print(f"[trader] Signal: {action.upper()} {ticker} @ ${price:.2f} -> buying {qty} shares")
                 broker.buy(ticker, qty, price)
             else:
                 print(f"[trader] Already holding {ticker} long, skipping buy")
@@ -50,13 +56,13 @@ def execute_signals(signals: List[Signal], broker: Broker):
                         'sell_ema_cross': 'EMA8 crossed below EMA25',
                         'sell_vwap_break': 'Price dropped below VWAP',
                         'strong_sell': 'EMA bearish + below VWAP',
-                    }.get(signal.action, signal.action)
+                    }.get(action, action)
                     print(f"[trader] EXIT LONG {ticker} @ ${price:.2f} ({reason}) -> selling {pos.qty} shares")
                     broker.sell(ticker, pos.qty, price)
 
             # Open short position
             if not broker.has_short_position(ticker):
-                print(f"[trader] Signal: {signal.action.upper()} {ticker} @ ${price:.2f} -> shorting {qty} shares")
+                print(f"[trader] Signal: {action.upper()} {ticker} @ ${price:.2f} -> shorting {qty} shares")
                 broker.short(ticker, qty, price)
             else:
                 print(f"[trader] Already short {ticker}, skipping")
@@ -1,7 +1,5 @@
 import pandas as pd
-import numpy as np
-from datetime import datetime, date
-from webull import webull
+from datetime import datetime
 
 from bot.config import EMA_SHORT, EMA_LONG, EMA_TREND
 
@@ -11,47 +9,36 @@ def _strip_exchange(ticker: str) -> str:
     return ticker.split(':')[-1] if ':' in ticker else ticker
 
 
-def _calc_ema(series: pd.Series, period: int) -> pd.Series:
-    return series.ewm(span=period, adjust=False).mean()
+_engine = None
 
 
-def _calc_vwap(df: pd.DataFrame) -> float:
-    """Calculate VWAP from today's candles only."""
-    today = date.today().isoformat()
-    today_df = df[df.index.astype(str).str.startswith(today)]
-    if today_df.empty:
-        today_df = df.tail(78)  # fallback: ~1 trading day of 5-min bars
-
-    typical_price = (today_df['high'] + today_df['low'] + today_df['close']) / 3
-    cum_tp_vol = (typical_price * today_df['volume']).cumsum()
-    cum_vol = today_df['volume'].cumsum()
-    vwap = cum_tp_vol / cum_vol.replace(0, np.nan)
-    return vwap.iloc[-1] if not vwap.empty else None
-
-
-def _calc_rsi(series: pd.Series, period: int = 14) -> float:
-    delta = series.diff()
-    gain = delta.where(delta > 0, 0.0)
-    loss = (-delta).where(delta < 0, 0.0)
-    avg_gain = gain.ewm(com=period - 1, min_periods=period).mean()
-    avg_loss = loss.ewm(com=period - 1, min_periods=period).mean()
-    rs = avg_gain / avg_loss.replace(0, np.nan)
-    rsi = 100 - (100 / (1 + rs))
-    return rsi.iloc[-1] if not rsi.empty else None
+def _indicator_engine():
+    # loaded once per process, the state is then kept in memory between cycles
+    global _engine
+    if _engine is None:
+        from bot.indicators import IndicatorEngine
+        _engine = IndicatorEngine.load()
+        print(f"[webull_scanner] Indicator state for {len(_engine.states)} tickers")
+    return _engine
 
 
 def scan_extended_hours(tickers, timeframe='5'):
-    """Fetch candle data from Webull and calculate EMA/VWAP/RSI for extended hours."""
+    """Fetch the new candles from Webull and update EMA/VWAP/RSI for extended hours."""
     if not tickers:
         return None
 
+    # imported here so the indicator functions can be used without the Webull client
+    from webull import webull
+
     wb = webull()
+    engine = _indicator_engine()
     rows = []
 
     for ticker in tickers:
         symbol = _strip_exchange(ticker)
         try:
-            bars = wb.get_bars(stock=symbol, interval='m5', count=250)
+            # only the candles since the last cycle (250 for a ticker without state)
+            bars = wb.get_bars(stock=symbol, interval='m5', count=engine.bars_needed(ticker))
             if bars is None or (isinstance(bars, pd.DataFrame) and bars.empty):
                 print(f"[webull_scanner] No candle data for {symbol}")
                 continue
@@ -63,15 +50,15 @@ def scan_extended_hours(tickers, timeframe='5'):
                 print(f"[webull_scanner] Missing 'close' column for {symbol}")
                 continue
 
-            close = bars['close'].astype(float)
-            ema_s = _calc_ema(close, EMA_SHORT)
-            ema_l = _calc_ema(close, EMA_LONG)
-            ema_t = _calc_ema(close, EMA_TREND)
-            vwap = _calc_vwap(bars)
-            rsi = _calc_rsi(close)
+            ind = engine.update(ticker, bars)
+            ema_s = ind['ema'][EMA_SHORT]
+            ema_l = ind['ema'][EMA_LONG]
+            ema_t = ind['ema'][EMA_TREND]
+            vwap = ind['vwap']
+            rsi = ind['rsi']
 
             # Use live quote for current price (includes extended hours)
-            latest_close = close.iloc[-1]
+            latest_close = ind['close']
             try:
                 quote = wb.get_quote(stock=symbol)
                 if quote and isinstance(quote, dict):
@@ -95,22 +82,30 @@ def scan_extended_hours(tickers, timeframe='5'):
                 'name': symbol,
                 'close': latest_close,
                 f'close|{tf}': latest_close,
-                f'EMA{EMA_SHORT}|{tf}': ema_s.iloc[-1],
-                f'EMA{EMA_LONG}|{tf}': ema_l.iloc[-1],
-                f'EMA{EMA_TREND}|{tf}': ema_t.iloc[-1],
+                f'EMA{EMA_SHORT}|{tf}': ema_s,
+                f'EMA{EMA_LONG}|{tf}': ema_l,
+                f'EMA{EMA_TREND}|{tf}': ema_t,
                 f'VWAP|{tf}': vwap,
                 f'RSI|{tf}': rsi,
-                'volume': int(bars['volume'].astype(float).sum()) if 'volume' in bars.columns else 0,
-                f'volume|{tf}': int(bars['volume'].astype(float).iloc[-1]) if 'volume' in bars.columns else 0,
+                'volume': int(ind['volume']),
+                f'volume|{tf}': int(ind['last_volume']),
             }
             rows.append(row)
             vwap_str = f"${vwap:.2f}" if vwap else "N/A"
-            print(f"[webull_scanner] {ticker}: close=${latest_close:.2f}, EMA{EMA_SHORT}={ema_s.iloc[-1]:.2f}, EMA{EMA_LONG}={ema_l.iloc[-1]:.2f}, VWAP={vwap_str}")
+            print(
+                f"[webull_scanner] {ticker}: close=${latest_close:.2f}, "
+                f"EMA{EMA_SHORT}={ema_s:.2f}, EMA{EMA_LONG}={ema_l:.2f}, VWAP={vwap_str}"
+            )
 
         except Exception as e:
             print(f"[webull_scanner] Error fetching {symbol}: {e}")
             continue
 
+    try:
+        engine.save()
+    except OSError as e:
+        print(f"[webull_scanner] Could not save the indicator state: {e}")
+
     if not rows:
         return None
 
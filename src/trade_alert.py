@@ -18,7 +18,7 @@ from Webull import Webull
 
 load_dotenv('.env.local')
 
-from tradingview_screener import Column
+from tradingview_screener import Column, batch_scanner_data
 from tradingview_screener.query import Query
 
 
@@ -76,6 +76,8 @@ def check_action(ema1, ema2):
         return ''
 
 def check_postmarket_break(stockbreaks, tf):
+    template = Query().select('name', 'close|'+tf, 'premarket_high','premarket_low', 'premarket_volume', 'pre_change|'+tf, 'premarket_change', 'premarket_change_abs', 'postmarket_high', 'postmarket_low', 'postmarket_volume', 'postmarket_change', 'postmarket_change_abs', '24h_close_prev|'+tf, 'volume','volume|'+tf, 'VWAP', 'VWAP|'+tf, 'RSI|'+tf, 'EMA8|'+tf, 'EMA25|'+tf, 'EMA200|'+tf, 'EMA8', 'EMA25','EMA200',  'high', 'low', 'market_cap_basic', 'total_shares_outstanding_fundamental', 'net_debt',  '52 Week High', '52 Week Low').freeze()
+    queries = []
     for stockbreak in stockbreaks:
         breaklist = stockbreak.split('|')
         stock = breaklist[0]
@@ -83,10 +85,14 @@ def check_postmarket_break(stockbreaks, tf):
         price = float(breaklist[2])
         q = ''
         if action == 'short/sell/break':
-            q = Query().select('name', 'close|'+tf, 'premarket_high','premarket_low', 'premarket_volume', 'pre_change|'+tf, 'premarket_change', 'premarket_change_abs', 'postmarket_high', 'postmarket_low', 'postmarket_volume', 'postmarket_change', 'postmarket_change_abs', '24h_close_prev|'+tf, 'volume','volume|'+tf, 'VWAP', 'VWAP|'+tf, 'RSI|'+tf, 'EMA8|'+tf, 'EMA25|'+tf, 'EMA200|'+tf, 'EMA8', 'EMA25','EMA200',  'high', 'low', 'market_cap_basic', 'total_shares_outstanding_fundamental', 'net_debt',  '52 Week High', '52 Week Low').where(Column('postmarket_high') > price)
+            q = template.where(Column('postmarket_high') > price)
         else:
-            q = Query().select('name', 'close|'+tf, 'premarket_high','premarket_low', 'premarket_volume', 'pre_change|'+tf, 'premarket_change', 'premarket_change_abs', 'postmarket_high', 'postmarket_low', 'postmarket_volume', 'postmarket_change', 'postmarket_change_abs', '24h_close_prev|'+tf, 'volume','volume|'+tf, 'VWAP', 'VWAP|'+tf, 'RSI|'+tf, 'EMA8|'+tf, 'EMA25|'+tf, 'EMA200|'+tf, 'EMA8', 'EMA25','EMA200',  'high', 'low', 'market_cap_basic', 'total_shares_outstanding_fundamental', 'net_debt',  '52 Week High', '52 Week Low').where(Column('postmarket_high') > price)
-        n_rows, df = q.set_tickers(stock).get_scanner_data()
+            q = template.where(Column('postmarket_high') > price)
+        queries.append(q.set_tickers(stock))
+
+    for stockbreak, (n_rows, df) in zip(stockbreaks, batch_scanner_data(queries)):
+        breaklist = stockbreak.split('|')
+        action = breaklist[1]
         if not df.empty:
             df['time'] = [get_current_time()]
             df['action'] = action
@@ -99,6 +105,9 @@ def check_postmarket_break(stockbreaks, tf):
             store_rows(df.to_dict('records')[:10], 'trade_alert')
 
 def check_premarket_break(stockbreaks, tf):
+    short_template = Query().select('name', 'close|'+tf, 'premarket_high','premarket_low', 'premarket_volume', 'pre_change|'+tf, 'premarket_change', 'premarket_change_abs', 'postmarket_high', 'postmarket_low', 'postmarket_volume', 'postmarket_change', 'postmarket_change_abs', '24h_close_prev|'+tf, 'volume','volume|'+tf, 'VWAP', 'VWAP|'+tf, 'RSI|'+tf, 'EMA8|'+tf, 'EMA25|'+tf, 'EMA200|'+tf, 'EMA8', 'EMA25','EMA200',  'high', 'low', 'market_cap_basic', 'total_shares_outstanding_fundamental', 'net_debt',  '52 Week High', '52 Week Low').freeze()
+    long_template = Query().select('name', 'close|1d', 'close|'+tf, 'premarket_high','premarket_low', 'premarket_volume', 'pre_change|'+tf, 'premarket_change', 'premarket_change_abs', 'postmarket_high', 'postmarket_low', 'postmarket_volume', 'postmarket_change', 'postmarket_change_abs', '24h_close_prev|'+tf, 'volume','volume|'+tf, 'VWAP', 'VWAP|'+tf, 'RSI|'+tf, 'EMA8|'+tf, 'EMA25|'+tf, 'EMA200|'+tf, 'EMA8', 'EMA25','EMA200',  'high', 'low', 'market_cap_basic', 'total_shares_outstanding_fundamental', 'net_debt',  '52 Week High', '52 Week Low').freeze()
+    queries = []
     for stockbreak in stockbreaks:
         breaklist = stockbreak.split('|')
         stock = breaklist[0]
@@ -106,10 +115,14 @@ def check_premarket_break(stockbreaks, tf):
         price = float(breaklist[2])
         q = ''
         if action == 'short/sell/break':
-            q = Query().select('name', 'close|'+tf, 'premarket_high','premarket_low', 'premarket_volume', 'pre_change|'+tf, 'premarket_change', 'premarket_change_abs', 'postmarket_high', 'postmarket_low', 'postmarket_volume', 'postmarket_change', 'postmarket_change_abs', '24h_close_prev|'+tf, 'volume','volume|'+tf, 'VWAP', 'VWAP|'+tf, 'RSI|'+tf, 'EMA8|'+tf, 'EMA25|'+tf, 'EMA200|'+tf, 'EMA8', 'EMA25','EMA200',  'high', 'low', 'market_cap_basic', 'total_shares_outstanding_fundamental', 'net_debt',  '52 Week High', '52 Week Low').where(Column('premarket_high') > price)
+            q = short_template.where(Column('premarket_high') > price)
         else:
-            q = Query().select('name', 'close|1d', 'close|'+tf, 'premarket_high','premarket_low', 'premarket_volume', 'pre_change|'+tf, 'premarket_change', 'premarket_change_abs', 'postmarket_high', 'postmarket_low', 'postmarket_volume', 'postmarket_change', 'postmarket_change_abs', '24h_close_prev|'+tf, 'volume','volume|'+tf, 'VWAP', 'VWAP|'+tf, 'RSI|'+tf, 'EMA8|'+tf, 'EMA25|'+tf, 'EMA200|'+tf, 'EMA8', 'EMA25','EMA200',  'high', 'low', 'market_cap_basic', 'total_shares_outstanding_fundamental', 'net_debt',  '52 Week High', '52 Week Low').where(Column('premarket_high') > price)
-        n_rows, df = q.set_tickers(stock).get_scanner_data()
+            q = long_template.where(Column('premarket_high') > price)
+        queries.append(q.set_tickers(stock))
+
+    for stockbreak, (n_rows, df) in zip(stockbreaks, batch_scanner_data(queries)):
+        breaklist = stockbreak.split('|')
+        action = breaklist[1]
         if not df.empty:
             df['time'] = [get_current_time()]
             df['action'] = action
@@ -122,6 +135,8 @@ def check_premarket_break(stockbreaks, tf):
             store_rows(df.to_dict('records')[:10], 'trade_alert')
 
 def check_break(stockbreaks, tf):
+    template = Query().select('name', 'close|'+tf, 'premarket_high','premarket_low', 'premarket_volume', 'pre_change|'+tf, 'premarket_change', 'premarket_change_abs', 'postmarket_high', 'postmarket_low', 'postmarket_volume', 'postmarket_change', 'postmarket_change_abs', '24h_close_prev|'+tf, 'volume','volume|'+tf, 'VWAP', 'VWAP|'+tf, 'RSI|'+tf, 'EMA8|'+tf, 'EMA25|'+tf, 'EMA200|'+tf, 'EMA8', 'EMA25', 'EMA200',  'high', 'low', 'market_cap_basic', 'total_shares_outstanding_fundamental', 'net_debt',  '52 Week High', '52 Week Low').freeze()
+    queries = []
     for stockbreak in stockbreaks:
         breaklist = stockbreak.split('|')
         stock = breaklist[0]
@@ -129,10 +144,14 @@ def check_break(stockbreaks, tf):
         price = float(breaklist[2])
         q = ''
         if action == 'short/sell/break':
-            q = Query().select('name', 'close|'+tf, 'premarket_high','premarket_low', 'premarket_volume', 'pre_change|'+tf, 'premarket_change', 'premarket_change_abs', 'postmarket_high', 'postmarket_low', 'postmarket_volume', 'postmarket_change', 'postmarket_change_abs', '24h_close_prev|'+tf, 'volume','volume|'+tf, 'VWAP', 'VWAP|'+tf, 'RSI|'+tf, 'EMA8|'+tf, 'EMA25|'+tf, 'EMA200|'+tf, 'EMA8', 'EMA25', 'EMA200',  'high', 'low', 'market_cap_basic', 'total_shares_outstanding_fundamental', 'net_debt',  '52 Week High', '52 Week Low').where(Column('close|'+tf) > price)
+            q = template.where(Column('close|'+tf) > price)
         else:
-            q = Query().select('name', 'close|'+tf, 'premarket_high','premarket_low', 'premarket_volume', 'pre_change|'+tf, 'premarket_change', 'premarket_change_abs', 'postmarket_high', 'postmarket_low', 'postmarket_volume', 'postmarket_change', 'postmarket_change_abs', '24h_close_prev|'+tf, 'volume','volume|'+tf, 'VWAP', 'VWAP|'+tf, 'RSI|'+tf, 'EMA8|'+tf, 'EMA25|'+tf, 'EMA200|'+tf, 'EMA8', 'EMA25', 'EMA200',  'high', 'low', 'market_cap_basic', 'total_shares_outstanding_fundamental', 'net_debt',  '52 Week High', '52 Week Low').where(Column('close|'+tf) > price)
-        n_rows, df = q.set_tickers(stock).get_scanner_data()
+            q = template.where(Column('close|'+tf) > price)
+        queries.append(q.set_tickers(stock))
+
+    for stockbreak, (n_rows, df) in zip(stockbreaks, batch_scanner_data(queries)):
+        breaklist = stockbreak.split('|')
+        action = breaklist[1]
         if not df.empty:
             df['time'] = [get_current_time()]
             df['action'] = action
@@ -145,27 +164,33 @@ def check_break(stockbreaks, tf):
             store_rows(df.to_dict('records')[:10], 'trade_alert')
 
 def check_trend(stocks, tf):
+    short_template = Query().select('name', 'close|'+tf, 'premarket_high','premarket_low', 'premarket_volume', 'pre_change|'+tf, 'premarket_change', 'premarket_change_abs', 'postmarket_high', 'postmarket_low', 'postmarket_volume', 'postmarket_change', 'postmarket_change_abs', '24h_close_prev|'+tf, 'volume','volume|'+tf, 'VWAP', 'VWAP|'+tf, 'RSI|'+tf, 'EMA8|'+tf, 'EMA25|'+tf, 'EMA8', 'EMA25', 'EMA200|'+tf, 'EMA200',  'high', 'low', 'market_cap_basic', 'total_shares_outstanding_fundamental', 'net_debt',  '52 Week High', '52 Week Low').where(Column('EMA8|'+tf) < Column('EMA25|'+tf), Column('close|'+tf) < Column('VWAP|'+tf)).freeze()
+    long_template = Query().select('name', 'close|'+tf, 'premarket_high','premarket_low', 'premarket_volume', 'pre_change|'+tf, 'premarket_change', 'premarket_change_abs', 'postmarket_high', 'postmarket_low', 'postmarket_volume', 'postmarket_change', 'postmarket_change_abs', '24h_close_prev|'+tf, 'volume','volume|'+tf, 'VWAP', 'VWAP|'+tf, 'RSI|'+tf, 'EMA8|'+tf, 'EMA25|'+tf, 'EMA200|'+tf, 'EMA8', 'EMA25', 'EMA200',  'high', 'low', 'market_cap_basic', 'total_shares_outstanding_fundamental', 'net_debt',  '52 Week High', '52 Week Low').where(Column('EMA8|'+tf) > Column('EMA25|'+tf), Column('close|'+tf) > Column('VWAP|'+tf)).freeze()
+    short_queries = []
+    long_queries = []
     for stock in stocks:
-        q = Query().select('name', 'close|'+tf, 'premarket_high','premarket_low', 'premarket_volume', 'pre_change|'+tf, 'premarket_change', 'premarket_change_abs', 'postmarket_high', 'postmarket_low', 'postmarket_volume', 'postmarket_change', 'postmarket_change_abs', '24h_close_prev|'+tf, 'volume','volume|'+tf, 'VWAP', 'VWAP|'+tf, 'RSI|'+tf, 'EMA8|'+tf, 'EMA25|'+tf, 'EMA8', 'EMA25', 'EMA200|'+tf, 'EMA200',  'high', 'low', 'market_cap_basic', 'total_shares_outstanding_fundamental', 'net_debt',  '52 Week High', '52 Week Low').where(Column('EMA8|'+tf) < Column('EMA25|'+tf), Column('close|'+tf) < Column('VWAP|'+tf))
-        n_rows, df = q.set_tickers(stock).get_scanner_data()
-        if not df.empty:
-            df['time'] = [get_current_time()]
-            df['action'] = 'short/sell'
-            quote = json.dumps(df.to_dict('records')[:10], indent=4)
+        short_queries.append(short_template.set_tickers(stock))
+        long_queries.append(long_template.set_tickers(stock))
+
+    results = batch_scanner_data(short_queries + long_queries)
+    # one stock at a time (its short alert, then its long alert), like the per-stock queries did
+    for (_, short_df), (_, long_df) in zip(results[:len(stocks)], results[len(stocks):]):
+        if not short_df.empty:
+            short_df['time'] = [get_current_time()]
+            short_df['action'] = 'short/sell'
+            quote = json.dumps(short_df.to_dict('records')[:10], indent=4)
             print(quote)
             # send_sms(("short --- " + quote)
             # send_message_to_alert_webhook(quote)
-            # store_rows(df.to_dict('records')[:10], 'trade_alert')
-        q = Query().select('name', 'close|'+tf, 'premarket_high','premarket_low', 'premarket_volume', 'pre_change|'+tf, 'premarket_change', 'premarket_change_abs', 'postmarket_high', 'postmarket_low', 'postmarket_volume', 'postmarket_change', 'postmarket_change_abs', '24h_close_prev|'+tf, 'volume','volume|'+tf, 'VWAP', 'VWAP|'+tf, 'RSI|'+tf, 'EMA8|'+tf, 'EMA25|'+tf, 'EMA200|'+tf, 'EMA8', 'EMA25', 'EMA200',  'high', 'low', 'market_cap_basic', 'total_shares_outstanding_fundamental', 'net_debt',  '52 Week High', '52 Week Low').where(Column('EMA8|'+tf) > Column('EMA25|'+tf), Column('close|'+tf) > Column('VWAP|'+tf))
-        n_rows, df = q.set_tickers(stock).get_scanner_data()
-        if not df.empty:
-            df['time'] = [get_current_time()]
-            df['action'] = 'cover/buy'
-            quote = json.dumps(df.to_dict('records')[:10], indent=4)
+            # store_rows(short_df.to_dict('records')[:10], 'trade_alert')
+        if not long_df.empty:
+            long_df['time'] = [get_current_time()]
+            long_df['action'] = 'cover/buy'
+            quote = json.dumps(long_df.to_dict('records')[:10], indent=4)
             print(quote)
             # send_sms(("short --- " + quote)
             # send_message_to_alert_webhook(quote)
-            # store_rows(df.to_dict('records')[:10], 'trade_alert')
+            # store_rows(long_df.to_dict('records')[:10], 'trade_alert')
 
 def read_custom_formatted_records(
     uri=os.environ.get('MONGODB_URI', 'mongodb://localhost:27017/'),
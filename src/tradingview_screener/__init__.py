@@ -4,5 +4,46 @@
 
 from __future__ import annotations
 
-from tradingview_screener.query import Column, Query
-from tradingview_screener.screener import Scanner, get_all_symbols
+from typing import TYPE_CHECKING
+
+from tradingview_screener.cache import ResponseCache
+from tradingview_screener.query import Column, FrozenQuery, Query, gather_scanner_data
+from tradingview_screener.ratelimit import RateLimiter
+from tradingview_screener.stats import RequestStats
+from tradingview_screener.transport import (
+    AsyncTransport,
+    Transport,
+    set_default_async_transport,
+    set_default_transport,
+)
+from tradingview_screener.universe import SymbolCache, Universe
+
+if TYPE_CHECKING:
+    from tradingview_screener.batch import batch_scanner_data
+    from tradingview_screener.filters import apply_filters, filter_mask
+    from tradingview_screener.screener import Scanner, get_all_symbols, get_universe
+
+# these modules import pandas (or build queries) when they are imported, so they are only loaded the
+# first time one of their names is accessed
+_LAZY_NAMES = {
+    'batch_scanner_data': 'tradingview_screener.batch',
+    'apply_filters': 'tradingview_screener.filters',
+    'filter_mask': 'tradingview_screener.filters',
+    'Scanner': 'tradingview_screener.screener',
+    'get_all_symbols': 'tradingview_screener.screener',
+    'get_universe': 'tradingview_screener.screener',
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_NAMES:
+        import importlib
+
+        value = getattr(importlib.import_module(_LAZY_NAMES[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_NAMES])
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+__all__ = ['batch_scanner_data']
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Sequence
+
+import pandas as pd
+
+from tradingview_screener.decoder import decode_rows
+from tradingview_screener.filters import LOCAL_OPERATIONS, filter_columns, filter_mask
+from tradingview_screener.query import Query
+from tradingview_screener.transport import get_default_transport
+
+
+def _is_batchable(query: Query) -> bool:
+    tickers = query.query.get('symbols', {}).get('tickers')
+    expressions = query.query.get('filter', [])
+    return bool(tickers) and all(expr['operation'] in LOCAL_OPERATIONS for expr in expressions)
+
+
+def _group_key(query: Query) -> str:
+    template = {k: v for k, v in query.query.items() if k not in ('symbols', 'filter', 'range')}
+    return json.dumps([query.url, id(query.transport), template], sort_keys=True)
+
+
+def batch_scanner_data(
+    queries: Sequence[Query], max_tickers: int = 500, max_workers: int = 4, **kwargs
+) -> list[tuple[int, pd.DataFrame]]:
+    """
+    Execute many ticker queries with as few requests as possible.
+
+    The queries that use `set_tickers()` and select the same columns are merged into a single
+    request with all of their tickers (split into several requests of at most `max_tickers`
+    tickers), then the `where()` filter and the `offset()`/`limit()` of every query are applied
+    locally, so each query gets back exactly what `get_scanner_data()` would have returned.
+
+    The queries that can't be merged (no tickers, or a filter that can only be evaluated by the
+    server, like `crosses_above()`) are sent on their own.
+
+    Examples:
+
+    Instead of sending one request per ticker
+    >>> cols = ['name', 'close|5', 'VWAP|5', 'EMA8|5', 'EMA25|5']
+    >>> breaks = {'NASDAQ:AAPL': 185.0, 'NASDAQ:TSLA': 250.0, 'NYSE:GME': 17.5}
+    >>> queries = [
+    ...     Query().select(*cols).where(Column('close|5') > price).set_tickers(ticker)
+    ...     for ticker, price in breaks.items()
+    ... ]
+    >>> results = batch_scanner_data(queries)  # a single request
+    >>> [df['ticker'].tolist() for _, df in results]
+    [['NASDAQ:AAPL'], [], ['NYSE:GME']]
+
+    :param queries: the `Query` objects to execute
+    :param max_tickers: max number of tickers sent in a single request
+    :param max_workers: max number of requests sent at the same time
+    :param kwargs: kwargs to pass to `requests.Session.post()`
+    :return: a list of `(total_count, dataframe)` tuples, one for each query (in the same order)
+    """
+    results: list[Any] = [None] * len(queries)
+    groups: dict[str, list[int]] = {}
+    for i, query in enumerate(queries):
+        if _is_batchable(query):
+            groups.setdefault(_group_key(query), []).append(i)
+
+    def run_single(i: int) -> None:
+        results[i] = queries[i].get_scanner_data(**kwargs)
+
+    def run_group(indexes: list[int]) -> None:
+        template = queries[indexes[0]]
+        transport = template.transport or get_default_transport()
+
+        tickers = [t for i in indexes for t in queries[i].query['symbols']['tickers']]
+        tickers = list(dict.fromkeys(tickers))  # remove duplicates, keep the order
+        chunks = [tickers[i : i + max_tickers] for i in range(0, len(tickers), max_tickers)]
+
+        selected = template.query.get('columns', [])
+        extra = [c for i in indexes for c in filter_columns(queries[i].query.get('filter', []))]
+        sort = template.query.get('sort')
+        if sort and len(chunks) > 1:
+            extra.append(sort['sortBy'])
+        columns = list(dict.fromkeys([*selected, *extra]))
+
+        payload = {k: v for k, v in template.query.items() if k not in ('filter', 'range')}
+        frames = []
+        for chunk in chunks:
+            chunk_payload = {
+                **payload,
+                'columns': columns,
+                'symbols': {'tickers': chunk},
+                'range': [0, len(chunk)],
+            }
+            json_obj = transport.scan(template.url, chunk_payload, **kwargs)
+            frames.append(decode_rows(json_obj['data'], columns))
+        df = pd.concat(frames, ignore_index=True)
+
+        # every request is sorted by the server, but the chunks must be merged back in order
+        if sort and len(chunks) > 1:
+            ascending = sort['sortOrder'] == 'asc'
+            df = df.sort_values(sort['sortBy'], ascending=ascending, kind='stable')
+
+        for i in indexes:
+            query = queries[i].query
+            subset = df[df['ticker'].isin(query['symbols']['tickers'])]
+            subset = subset[filter_mask(subset, *query.get('filter', []))]
+            rows_count = len(subset)
+            start, end = query['range']
+            subset = subset[['ticker', *selected]].iloc[start:end].reset_index(drop=True)
+            results[i] = (rows_count, subset)
+
+    batched = {i for indexes in groups.values() for i in indexes}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(run_group, indexes) for indexes in groups.values()]
+        futures += [executor.submit(run_single, i) for i in range(len(queries)) if i not in batched]
+        for future in futures:
+            future.result()
+
+    return results
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+__all__ = ['ResponseCache']
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+
+class ResponseCache:
+    """
+    An in-memory LRU cache of scanner responses, where every entry expires after `ttl` seconds.
+
+    The cache is opt-in, pass it to a `Transport` to make identical requests (same URL and same
+    query) sent within the TTL return instantly, without going to the network.
+
+    Note that the cached responses are shared between the callers, so they must not be modified.
+
+    Examples:
+
+    >>> from tradingview_screener import Query, ResponseCache, Transport, set_default_transport
+    >>> cache = ResponseCache(ttl=10, maxsize=512)
+    >>> set_default_transport(Transport(cache=cache))
+    >>> q = Query().select('close', 'volume').set_tickers('NASDAQ:AAPL', 'NASDAQ:TSLA')
+    >>> q.get_scanner_data()  # network
+    >>> q.get_scanner_data()  # cache
+    >>> cache.hits, cache.misses
+    (1, 1)
+    """
+
+    def __init__(self, ttl: float = 5.0, maxsize: int = 256) -> None:
+        """
+        :param ttl: how many seconds an entry stays valid
+        :param maxsize: max number of entries, the least recently used ones are evicted first
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(url: str, payload: dict | bytes | None, **kwargs) -> str:
+        """
+        Create a key from the canonical JSON of the request (the order of the keys doesn't matter).
+
+        :param url: scanner URL
+        :param payload: the query dict (or its JSON encoding, see `Query.compile()`)
+        :param kwargs: the extra request kwargs (headers, cookies, etc.), `timeout` is ignored
+        :return: a hex digest
+        """
+        kwargs.pop('timeout', None)
+        if isinstance(payload, bytes):
+            payload = payload.decode()
+        canonical = json.dumps(
+            [url, payload, kwargs], sort_keys=True, separators=(',', ':'), default=repr
+        )
+        return hashlib.sha1(canonical.encode()).hexdigest()
+
+    def get(self, key: str) -> Any | None:
+        """
+        :return: the cached response, or `None` if it's missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return (
+            f'< ResponseCache(ttl={self.ttl!r}, maxsize={self.maxsize!r}, '
+            f'hits={self.hits}, misses={self.misses}) >'
+        )
@@ -0,0 +1,75 @@
+"""
+Resolve and validate column names against the catalog in `constants.COLUMNS`.
+
+A column name is either a key of `COLUMNS` (a "display name", like `Volume Weighted Average Price`),
+or a field name (`VWAP`), optionally followed by a timeframe (`VWAP|5`). The names are resolved
+once and cached, so selecting the same columns on every scan cycle costs a dictionary lookup, and a
+typo raises an error right away instead of a failed request.
+"""
+
+from __future__ import annotations
+
+__all__ = ['resolve_column', 'is_known_column']
+
+import difflib
+import sys
+from functools import lru_cache
+
+from tradingview_screener import constants
+
+
+@lru_cache(maxsize=None)
+def _base_names() -> frozenset[str]:
+    # the catalog also lists some fields with a timeframe (`24h_close_prev|5`), keep the base only
+    return frozenset(column.split('|')[0] for column in constants.COLUMNS.values())
+
+
+def is_known_column(name: str) -> bool:
+    """
+    :param name: a field name, optionally with a timeframe, i.e. `close` or `close|5`
+    :return: `True` if the field (without the timeframe) is in the catalog
+    """
+    return name.split('|')[0] in _base_names()
+
+
+@lru_cache(maxsize=4096)
+def resolve_column(name: str) -> str:
+    """
+    Convert a column name to the field name used by the API.
+
+    Examples:
+
+    >>> resolve_column('Volume Weighted Average Price')
+    'VWAP'
+    >>> resolve_column('Volume Weighted Average Price|5')
+    'VWAP|5'
+    >>> resolve_column('EMA8|5')
+    'EMA8|5'
+    >>> resolve_column('EMA8|')
+    Traceback (most recent call last):
+     ...
+    ValueError: invalid column name: 'EMA8|' (the timeframe after `|` is missing)
+    >>> resolve_column('volumee|5')
+    Traceback (most recent call last):
+     ...
+    ValueError: unknown column: 'volumee|5', did you mean 'volume'? (use ...)
+
+    :param name: a key or a value from `constants.COLUMNS`, optionally followed by `|timeframe`
+    :return: the field name (interned, so comparing it against other names is cheap)
+    """
+    column = constants.COLUMNS.get(name)
+    if column is not None:
+        return sys.intern(column)
+
+    base, sep, timeframe = name.partition('|')
+    if sep and not timeframe:
+        raise ValueError(f'invalid column name: {name!r} (the timeframe after `|` is missing)')
+    base = constants.COLUMNS.get(base, base)
+    if base not in _base_names():
+        message = f'unknown column: {name!r}'
+        matches = difflib.get_close_matches(base, _base_names(), n=1)
+        if matches:
+            message += f', did you mean {matches[0]!r}?'
+        message += ' (use `Column.from_unknown_name()` for fields that are not in the catalog)'
+        raise ValueError(message)
+    return sys.intern(f'{base}|{timeframe}' if sep else base)
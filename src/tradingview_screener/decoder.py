@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+__all__ = ['decode_rows']
+
+from typing import Any, Sequence
+
+import numpy as np
+import pandas as pd
+
+from tradingview_screener.constants import COLUMN_DTYPES
+
+try:
+    # the same (C) routine that `pd.DataFrame(list_of_lists)` uses internally
+    from pandas._libs.lib import to_object_array as _to_object_array
+except ImportError:  # pragma: no cover
+
+    def _to_object_array(rows: list[list[Any]]) -> np.ndarray:
+        return pd.DataFrame(rows, dtype=object).to_numpy()
+
+
+def _column_array(column: str, values: np.ndarray) -> Any:
+    dtype = COLUMN_DTYPES.get(column.split('|')[0])
+    if dtype == 'category':
+        codes, categories = pd.factorize(values)
+        return pd.Categorical.from_codes(codes, categories)
+    if dtype == 'object':
+        return values
+
+    # check the type of the first non-null value to tell numbers apart from strings/bools/lists
+    first = next((v for v in values if v is not None), None)
+    if first is None or type(first) in (int, float):
+        try:
+            return values.astype(np.float64)  # `None` becomes `NaN`
+        except (TypeError, ValueError):
+            pass  # mixed types
+    return pd.Series(values, dtype=object).infer_objects()
+
+
+def decode_rows(data: list[dict[str, Any]], columns: Sequence[str]) -> pd.DataFrame:
+    """
+    Decode the `data` array of a scanner response into a DataFrame, column by column.
+
+    Instead of letting pandas guess the dtype of every column from Python objects, the rows are
+    laid out once into a 2D object array, and each column is converted straight into a typed array
+    according to `constants.COLUMN_DTYPES` (`float64` for the numeric fields, `category` for labels
+    like `exchange` or `sector`).
+
+    :param data: the `data` field of the response, i.e. `[{'s': 'NASDAQ:AAPL', 'd': [...]}, ...]`
+    :param columns: the columns that were selected in the query
+    :return: a DataFrame with a `ticker` column followed by the selected columns
+    """
+    tickers = np.array([row['s'] for row in data], dtype=object)
+    if data and columns:
+        values = _to_object_array([row['d'] for row in data])
+    else:
+        values = np.empty((len(data), len(columns)), dtype=object)
+
+    # use integer keys so duplicate column names are kept
+    arrays = {0: tickers}
+    for i, column in enumerate(columns):
+        arrays[i + 1] = _column_array(column, values[:, i])
+
+    df = pd.DataFrame(arrays, copy=False)
+    df.columns = ['ticker', *columns]
+    return df
@@ -0,0 +1,182 @@
+"""
+Evaluate the `where()` filters of a query locally, on a DataFrame that was already fetched.
+
+The filters created with `Column` (`Column('close') > 5`, `Column('close').between(...)`,
+`Column('type').isin(...)`, `Column('description').like(...)`, etc.) are plain dictionaries, so the
+same filters that are sent to the server can also be applied to a DataFrame with vectorized
+NumPy/pandas operations. This makes it possible to fetch a superset of the data once, and then
+filter it in many different ways without sending a new request each time.
+
+Examples:
+
+>>> from tradingview_screener import Column, Query
+>>> from tradingview_screener.filters import apply_filters
+>>> _, df = Query().select('close', 'volume', 'VWAP', 'EMA5', 'EMA20', 'type').fetch_all()
+>>> above_vwap = apply_filters(df, Column('close') > Column('VWAP'), Column('volume') > 1e6)
+>>> pullbacks = apply_filters(df, Column('close').between(Column('EMA5'), Column('EMA20')))
+
+The `crosses*` operations compare the current values with the previous ones, so they need the
+DataFrame fetched in the previous cycle (the rows are matched by ticker):
+>>> apply_filters(df, Column('EMA5').crosses_above(Column('EMA20')), previous=previous_df)
+"""
+
+from __future__ import annotations
+
+__all__ = ['LOCAL_OPERATIONS', 'filter_columns', 'filter_mask', 'apply_filters']
+
+from typing import TYPE_CHECKING, Any, Sequence
+
+import numpy as np
+import pandas as pd
+
+from tradingview_screener.columns import is_known_column
+from tradingview_screener.query import IsinValues
+
+if TYPE_CHECKING:
+    from tradingview_screener.query import FilterOperationDict
+
+
+# the operations that can be evaluated without the previous values (`crosses*` need them)
+LOCAL_OPERATIONS = frozenset(
+    {
+        'greater',
+        'egreater',
+        'less',
+        'eless',
+        'equal',
+        'nequal',
+        'in_range',
+        'not_in_range',
+        'match',
+    }
+)
+
+
+def _is_column(value: Any, df: pd.DataFrame | None = None) -> bool:
+    # the API uses the same syntax for literals and column references (`{'right': 'VWAP'}`), so just
+    # like the server we treat the strings that are valid column names as columns
+    if not isinstance(value, str):
+        return False
+    return is_known_column(value) or (df is not None and value in df.columns)
+
+
+def filter_columns(expressions: Sequence[FilterOperationDict]) -> list[str]:
+    """
+    :return: the columns that the expressions reference (the ones needed to evaluate them)
+    """
+    columns = []
+    for expr in expressions:
+        columns.append(expr['left'])
+        right = expr['right']
+        for value in right if isinstance(right, list) else [right]:
+            if _is_column(value):
+                columns.append(value)
+    return columns
+
+
+def _values(df: pd.DataFrame, column: str) -> np.ndarray | pd.Series:
+    if column not in df.columns:
+        raise KeyError(f'the filter needs the column {column!r}, but it is not in the DataFrame')
+    series = df[column]
+    # NumPy is faster for numbers, but pandas handles `None` in object arrays
+    return series.to_numpy() if series.dtype.kind in 'biuf' else series
+
+
+def _operand(df: pd.DataFrame, value: Any) -> Any:
+    return _values(df, value) if _is_column(value, df) else value
+
+
+def _compare(op: str, left: Any, right: Any) -> Any:
+    if op == 'greater':
+        return left > right
+    if op == 'egreater':
+        return left >= right
+    if op == 'less':
+        return left < right
+    if op == 'eless':
+        return left <= right
+    if op == 'equal':
+        return left == right
+    if op == 'nequal':
+        return left != right
+    raise ValueError(f'unknown operation: {op!r}')
+
+
+def _crosses(
+    op: str, df: pd.DataFrame, previous: pd.DataFrame | None, expr: FilterOperationDict
+) -> np.ndarray:
+    if previous is None:
+        raise ValueError(f'{op!r} compares with the previous values, pass `previous=...`')
+    # align the previous rows with the current ones
+    previous = previous.drop_duplicates('ticker').set_index('ticker').reindex(df['ticker'])
+
+    left = _operand(df, expr['left'])
+    right = _operand(df, expr['right'])
+    prev_left = _operand(previous, expr['left'])
+    prev_right = _operand(previous, expr['right'])
+
+    above = (prev_left <= prev_right) & (left > right)
+    below = (prev_left >= prev_right) & (left < right)
+    if op == 'crosses_above':
+        return np.asarray(above, dtype=bool)
+    if op == 'crosses_below':
+        return np.asarray(below, dtype=bool)
+    return np.asarray(above | below, dtype=bool)
+
+
+def filter_mask(
+    df: pd.DataFrame, *expressions: FilterOperationDict, previous: pd.DataFrame | None = None
+) -> np.ndarray:
+    """
+    Evaluate the filter expressions on a DataFrame (the expressions are combined with AND, just
+    like in `Query.where()`).
+
+    :param df: a DataFrame returned by `Query.get_scanner_data()` (or similar)
+    :param expressions: one or more filters, i.e. `Column('close') > Column('VWAP')`
+    :param previous: the DataFrame of the previous cycle, only needed by the `crosses*` operations
+    :return: a boolean array, with one value for each row of `df`
+    """
+    mask = np.ones(len(df), dtype=bool)
+    for expr in expressions:
+        op = expr['operation']
+        right = expr['right']
+
+        if op in ('crosses', 'crosses_above', 'crosses_below'):
+            result = _crosses(op, df, previous, expr)
+        elif op == 'match':
+            left = df[expr['left']].astype(object)
+            result = left.str.contains(str(right), case=False, regex=False, na=False)
+        elif op in ('in_range', 'not_in_range'):
+            left = _values(df, expr['left'])
+            # `between()` and `isin()` both use `in_range`, the values of `isin()` are tagged by
+            # `Column`; for filters written by hand, a pair of numbers/columns is a range
+            if isinstance(right, IsinValues):
+                result = pd.Series(left).isin(right)
+            elif len(right) == 2 and not any(
+                isinstance(v, str) and not _is_column(v, df) for v in right
+            ):
+                low, high = (_operand(df, v) for v in right)
+                result = (left >= low) & (left <= high)
+            else:
+                result = pd.Series(left).isin(right)
+            if op == 'not_in_range':
+                result = ~np.asarray(result, dtype=bool)
+        else:
+            result = _compare(op, _values(df, expr['left']), _operand(df, right))
+
+        mask &= np.asarray(result, dtype=bool)
+    return mask
+
+
+def apply_filters(
+    df: pd.DataFrame, *expressions: FilterOperationDict, previous: pd.DataFrame | None = None
+) -> pd.DataFrame:
+    """
+    Return the rows of the DataFrame that match all the filter expressions.
+
+    :param df: a DataFrame returned by `Query.get_scanner_data()` (or similar)
+    :param expressions: one or more filters, i.e. `Column('close') > Column('VWAP')`
+    :param previous: the DataFrame of the previous cycle, only needed by the `crosses*` operations
+    :return: the filtered DataFrame (with a new index)
+    """
+    return df[filter_mask(df, *expressions, previous=previous)].reset_index(drop=True)
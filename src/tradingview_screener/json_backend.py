@@ -0,0 +1,76 @@
+"""
+A small pluggable layer over the JSON libraries used to decode the scanner responses.
+
+The fastest installed parser is picked automatically, in this order: `orjson`, `msgspec`, `ujson`,
+and finally the standard library `json`. None of them is required, install one with
+`pip install orjson` to speed up big responses.
+
+The responses are decoded straight from the raw bytes of the body, without decoding them into a
+`str` first.
+
+Examples:
+
+>>> from tradingview_screener import json_backend
+>>> json_backend.get_backend()
+'orjson'
+>>> json_backend.set_backend('json')  # force the standard library
+>>> json_backend.loads(b'{"totalCount": 0, "data": []}')
+{'totalCount': 0, 'data': []}
+"""
+
+from __future__ import annotations
+
+__all__ = ['BACKENDS', 'loads', 'get_backend', 'set_backend']
+
+import importlib
+import json
+from typing import Any, Callable
+
+BACKENDS = ('orjson', 'msgspec', 'ujson', 'json')
+
+
+def _load_backend(name: str) -> Callable[[bytes], Any]:
+    if name == 'json':
+        return json.loads
+    module = importlib.import_module(name)  # raises ImportError if it's not installed
+    if name == 'msgspec':
+        return module.json.decode
+    return module.loads
+
+
+def set_backend(name: str | None = None) -> str:
+    """
+    Select the JSON library used to decode the responses.
+
+    :param name: one of `BACKENDS`, or `None` to pick the fastest one installed
+    :return: the name of the selected backend
+    """
+    global loads, _backend
+    if name is not None and name not in BACKENDS:
+        raise ValueError(f'unknown JSON backend: {name!r}, choose one of {BACKENDS}')
+
+    for candidate in BACKENDS if name is None else (name,):
+        try:
+            loads = _load_backend(candidate)
+        except ImportError:
+            if name is not None:
+                raise
+        else:
+            _backend = candidate
+            break
+    return _backend
+
+
+def get_backend() -> str:
+    """
+    :return: the name of the backend currently in use
+    """
+    return _backend
+
+
+loads: Callable[[bytes], Any]
+"""
+Decode a JSON document from `bytes` (or `str`) with the selected backend.
+"""
+_backend: str
+set_backend()
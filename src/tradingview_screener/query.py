@@ -1,14 +1,30 @@
 from __future__ import annotations
 
-__all__ = ['Query', 'Column']
+__all__ = ['Query', 'Column', 'FrozenQuery', 'PreparedQuery', 'gather_scanner_data']
 
+import copy
+import json
 import pprint
-from typing import Any, Literal, TypedDict
-
-import pandas as pd
-import requests
-
-from tradingview_screener.constants import COLUMNS, HEADERS, MARKETS, URL
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Literal, TypedDict
+
+from tradingview_screener import constants
+from tradingview_screener.columns import resolve_column
+from tradingview_screener.constants import URL
+from tradingview_screener.stats import RequestStats
+from tradingview_screener.transport import (
+    AsyncTransport,
+    Transport,
+    get_default_async_transport,
+    get_default_transport,
+)
+
+if TYPE_CHECKING:
+    # pandas is only imported once a query is executed, to keep `import tradingview_screener` fast
+    import pandas as pd
 
 
 class FilterOperationDict(TypedDict):
@@ -50,6 +66,16 @@ class QueryDict(TypedDict):
     range: list[int]  # a with two integers, i.e. `[0, 100]`
 
 
+class IsinValues(list):
+    """
+    The values of `Column.isin()`.
+
+    `between()` and `isin()` are both sent as `in_range`, so the values of `isin()` are tagged
+    with this type (encoded as a plain JSON list) for `filters.filter_mask()` to evaluate them as
+    a set of values, and not as a `[low, high]` range.
+    """
+
+
 class Column:
     """
     A Column object represents a field in the tradingview stock screener,
@@ -73,25 +99,26 @@ class Column:
         """
         Create a column object from a given column name
 
-        :param name: string, should be either a key or a value from the `COLUMNS` dictionary
-        """
-        # if `name` is a dictionary key: get its value. otherwise make sure that it's a
-        # dictionary value.
-        self.name = COLUMNS.get(name, name)
-
-    # disable this method and do the column/field validation through the server
-    # @classmethod
-    # def from_unknown_name(cls, name: str) -> Column:
-    #     """
-    #     Create a column object from a column name that isn't in the `COLUMNS` dictionary
-    #
-    #     :param name: string, column name
-    #     :return: Column
-    #     """
-    #     # close is just a temporary column, so it won't raise an error at `__init__`
-    #     column = cls(name='close')
-    #     column.name = name
-    #     return column
+        :param name: string, should be either a key or a value from the `COLUMNS` dictionary,
+         optionally followed by a timeframe, i.e. `close|5`
+        :raises ValueError: if the name isn't in the `COLUMNS` dictionary, see `from_unknown_name()`
+        """
+        # the names are resolved and validated once, then cached (see `columns.resolve_column()`)
+        self.name = resolve_column(name)
+
+    @classmethod
+    def from_unknown_name(cls, name: str) -> Column:
+        """
+        Create a column object from a column name that isn't in the `COLUMNS` dictionary, the name
+        is then validated by the server.
+
+        :param name: string, column name
+        :return: Column
+        """
+        # close is just a temporary column, so it won't raise an error at `__init__`
+        column = cls(name='close')
+        column.name = name
+        return column
 
     @staticmethod
     def _extract_value(obj) -> ...:
@@ -159,7 +186,9 @@ class Column:
         )
 
     def isin(self, values) -> FilterOperationDict:
-        return FilterOperationDict(left=self.name, operation='in_range', right=list(values))
+        return FilterOperationDict(
+            left=self.name, operation='in_range', right=IsinValues(values)
+        )
 
     def like(self, other) -> FilterOperationDict:
         return FilterOperationDict(
@@ -357,6 +386,7 @@ class Query:
             'range': [0, 50],
         }
         self.url = 'https://scanner.tradingview.com/america/scan'
+        self.transport: Transport | None = None
 
     def set_markets(self, *markets: str) -> Query:
         """
@@ -478,14 +508,14 @@ class Query:
         """
         if len(markets) == 1:
             market = markets[0]
-            assert market in MARKETS
+            assert market in constants.MARKETS
 
             self.url = URL.format(market=market)
             self.query['markets'] = [market]
 
         elif len(markets) >= 1:
             for m in markets:
-                assert m in MARKETS
+                assert m in constants.MARKETS
 
             self.url = URL.format(market='global')
             self.query['markets'] = list(markets)
@@ -535,7 +565,7 @@ class Query:
 
     def select(self, *columns: Column | str) -> Query:
         self.query['columns'] = [
-            col.name if isinstance(col, Column) else Column(col).name for col in columns
+            col.name if isinstance(col, Column) else resolve_column(col) for col in columns
         ]
         return self
 
@@ -544,58 +574,234 @@ class Query:
         return self
 
     def order_by(self, column: Column | str, ascending: bool = True) -> Query:
-        column = column.name if isinstance(column, Column) else Column(column).name
+        column = column.name if isinstance(column, Column) else resolve_column(column)
         sort_order = 'asc' if ascending else 'desc'
         # noinspection PyTypeChecker
         self.query['sort'] = SortByDict(sortBy=column, sortOrder=sort_order)
         return self
 
     def offset(self, offset: int) -> Query:
-        self.query['range'][0] = offset
+        # the builder methods replace the values instead of changing them in place, so a
+        # `FrozenQuery` can share them with the queries derived from it
+        self.query['range'] = [offset, self.query['range'][1]]
         return self
 
     def limit(self, limit: int) -> Query:
-        self.query['range'][1] = limit
+        self.query['range'] = [self.query['range'][0], limit]
         return self
 
     # def set_options(self, options) -> None:
     #     raise NotImplementedError
 
-    def get_scanner_data(self, **kwargs) -> tuple[int, pd.DataFrame]:
+    def set_transport(self, transport: Transport | None) -> Query:
+        """
+        Send the requests of this query through the given `Transport` instead of the process-wide
+        default one (pass `None` to go back to the default).
+
+        :param transport: a `Transport` object, or `None`
+        :return: Self
+        """
+        self.transport = transport
+        return self
+
+    def get_scanner_data(
+        self, stats: RequestStats | None = None, **kwargs
+    ) -> tuple[int, pd.DataFrame]:
         """
         Perform a POST web-request and return the data from the API as a DataFrame.
 
-        Note that you can pass extra keyword-arguments that will be forwarded to `requests.post()`,
-        this can be very useful if you want to pass your own headers/cookies.
+        The request goes through the query's `Transport` (or the process-wide default), which keeps
+        a pool of keep-alive connections, so repeated calls don't pay a new TCP/TLS handshake.
+
+        Note that you can pass extra keyword-arguments that will be forwarded to
+        `requests.Session.post()`, this can be very useful if you want to pass your own
+        headers/cookies.
 
         (if you have paid for a live data add-on with TradingView, you want to pass your own
         headers and cookies to access that real-time data)
 
-        :param kwargs: kwargs to pass to `requests.post()`
+        :param stats: a `RequestStats` to fill with the timings of the request (they are also
+         passed to the hooks of the transport)
+        :param kwargs: kwargs to pass to `requests.Session.post()`
         :return: a tuple consisting of: (total_count, dataframe)
         """
-        kwargs.setdefault('headers', HEADERS)
-        kwargs.setdefault('timeout', 20)
-        r = requests.post(self.url, json=self.query, **kwargs)
+        transport = self.transport or get_default_transport()
+        stats = RequestStats() if stats is None else stats
+        json_obj = transport.scan(self.url, self.query, stats=stats, **kwargs)
+        result = _timed_parse(self._parse_response, json_obj, stats)
+        transport.emit(stats)
+        return result
+
+    async def aget_scanner_data(
+        self,
+        transport: AsyncTransport | None = None,
+        stats: RequestStats | None = None,
+        **kwargs,
+    ) -> tuple[int, pd.DataFrame]:
+        """
+        The asyncio version of `get_scanner_data()` (requires `aiohttp`).
 
-        if r.status_code >= 400:
-            # add the body to the error message for debugging purposes
-            r.reason += f'\n Body: {r.text}\n'
-            r.raise_for_status()
+        Examples:
 
-        json_obj = r.json()
+        >>> import asyncio
+        >>> from tradingview_screener import AsyncTransport
+        >>> async def main():
+        ...     async with AsyncTransport() as transport:
+        ...         q = Query().select('close', 'volume')
+        ...         return await q.aget_scanner_data(transport=transport)
+        >>> asyncio.run(main())
+        (17879,
+                 ticker   close     volume
+         0  NASDAQ:TSLA  248.50  118559595
+         ...
+
+        :param transport: the `AsyncTransport` to use, defaults to the process-wide one (its
+         connections are closed when the event loop shuts down, i.e. at the end of `asyncio.run()`)
+        :param stats: a `RequestStats` to fill with the timings of the request
+        :param kwargs: kwargs to pass to `aiohttp.ClientSession.request()`
+        :return: a tuple consisting of: (total_count, dataframe)
+        """
+        transport = transport or get_default_async_transport()
+        stats = RequestStats() if stats is None else stats
+        json_obj = await transport.scan(self.url, self.query, stats=stats, **kwargs)
+        result = _timed_parse(self._parse_response, json_obj, stats)
+        transport.emit(stats)
+        return result
+
+    def fetch_all(
+        self, page_size: int = 5_000, max_workers: int = 8, **kwargs
+    ) -> tuple[int, pd.DataFrame]:
+        """
+        Fetch the whole result set of the query, not just the `limit()` window.
+
+        The first page tells us how many rows match the query (`totalCount`), then the remaining
+        pages are requested in parallel and stitched together in order.
+        Since the data is live, a row may move across a page boundary between two requests, so
+        duplicate tickers are dropped (keeping the first occurrence).
+
+        Note that the `limit()` of the query is ignored, but the `offset()` is respected.
+
+        Examples:
+
+        >>> n_rows, df = Query().select('close', 'volume').fetch_all()
+        >>> n_rows, len(df)
+        (18060, 18060)
+
+        :param page_size: number of rows requested per page
+        :param max_workers: max number of pages downloaded at the same time
+        :param kwargs: kwargs to pass to `requests.Session.post()`
+        :return: a tuple consisting of: (total_count, dataframe)
+        """
+        import pandas as pd
+
+        pages = self._iter_pages(page_size, max_workers, **kwargs)
+        rows_count, first_df = next(pages)
+        df = pd.concat([first_df, *(df for _, df in pages)], ignore_index=True)
+        return rows_count, df
+
+    def iter_pages(
+        self, page_size: int = 5_000, max_workers: int = 2, **kwargs
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Like `fetch_all()`, but yield one DataFrame per page as soon as it arrives, instead of
+        building a single huge DataFrame.
+
+        At most `max_workers` pages are downloaded ahead of the consumer, so the peak memory stays
+        bounded by the page size no matter how many rows match the query.
+        The pages are yielded in order, and tickers already seen in a previous page are dropped.
+
+        Examples:
+
+        >>> from tradingview_screener.constants import MARKETS
+        >>> q = Query().select('close', 'market').set_markets(*MARKETS)
+        >>> for df in q.iter_pages(page_size=10_000):
+        ...     df.to_parquet(...)
+
+        :param page_size: number of rows requested per page
+        :param max_workers: max number of pages downloaded ahead of the consumer
+        :param kwargs: kwargs to pass to `requests.Session.post()`
+        :return: an iterator of DataFrames
+        """
+        for _, df in self._iter_pages(page_size, max_workers, **kwargs):
+            yield df
+
+    def _iter_pages(
+        self, page_size: int, max_workers: int, **kwargs
+    ) -> Iterator[tuple[int, pd.DataFrame]]:
+        transport = self.transport or get_default_transport()
+        start = self.query['range'][0]
+        seen: set[str] = set()
+
+        def fetch_page(offset: int) -> pd.DataFrame:
+            json_obj = transport.scan(self.url, self._page_payload(offset, page_size), **kwargs)
+            return self._parse_response(json_obj)[1]
+
+        def drop_seen(df: pd.DataFrame) -> pd.DataFrame:
+            df = df[~df['ticker'].isin(seen)].drop_duplicates('ticker', ignore_index=True)
+            seen.update(df['ticker'])
+            return df
+
+        json_obj = transport.scan(self.url, self._page_payload(start, page_size), **kwargs)
         rows_count = json_obj['totalCount']
-        data = json_obj['data']
+        yield rows_count, drop_seen(self._parse_response(json_obj)[1])
+        del json_obj
+
+        offsets = iter(range(start + page_size, rows_count, page_size))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = deque(executor.submit(fetch_page, o) for o in islice(offsets, max_workers))
+            try:
+                while pending:
+                    df = pending.popleft().result()
+                    pending.extend(executor.submit(fetch_page, o) for o in islice(offsets, 1))
+                    yield rows_count, drop_seen(df)
+            finally:
+                # if the consumer stops early, don't download the pages that are still queued
+                for future in pending:
+                    future.cancel()
+
+    def _page_payload(self, offset: int, page_size: int) -> QueryDict:
+        # a shallow copy is enough since we only replace the `range` list
+        # noinspection PyTypeChecker
+        return {**self.query, 'range': [offset, offset + page_size]}
 
-        df = pd.DataFrame(
-            data=([row['s'], *row['d']] for row in data),
-            columns=['ticker', *self.query.get('columns', ())],
-        )
+    def _parse_response(self, json_obj: dict[str, Any]) -> tuple[int, pd.DataFrame]:
+        from tradingview_screener.decoder import decode_rows
+
+        rows_count = json_obj['totalCount']
+        df = decode_rows(json_obj['data'], self.query.get('columns', []))
         return rows_count, df
 
+    def compile(self) -> PreparedQuery:
+        """
+        Freeze the query into a `PreparedQuery`, whose JSON body is encoded once.
+
+        Only the tickers and the range can change between executions, so sending the same query
+        again (i.e. on every scan cycle, with a different list of tickers) doesn't need to build and
+        encode the whole query dict again.
+
+        Examples:
+
+        >>> prepared = Query().select('name', 'close|5', 'VWAP|5').order_by('volume').compile()
+        >>> prepared.get_scanner_data(tickers=['NASDAQ:AAPL', 'NASDAQ:TSLA'])
+        >>> prepared.get_scanner_data(tickers=['NYSE:GME'], range=(0, 10))
+
+        :return: a `PreparedQuery`
+        """
+        return PreparedQuery(self.query, self.url, self.transport)
+
+    def freeze(self) -> FrozenQuery:
+        """
+        Create an immutable copy of the query, see `FrozenQuery`.
+
+        :return: a `FrozenQuery`
+        """
+        return FrozenQuery(self)
+
     def copy(self) -> Query:
         new = Query()
-        new.query = self.query.copy()
+        new.query = copy.deepcopy(self.query)
+        new.url = self.url
+        new.transport = self.transport
         return new
 
     def __repr__(self) -> str:
@@ -603,3 +809,239 @@ class Query:
 
     def __eq__(self, other) -> bool:
         return isinstance(other, Query) and self.query == other.query
+
+
+class FrozenQuery(Query):
+    """
+    An immutable `Query`, created with `Query.freeze()`.
+
+    The builder methods (`select()`, `where()`, `set_tickers()`, `limit()`, etc.) don't change the
+    query, they return a new `FrozenQuery` instead. The new query only copies the top-level dict,
+    and shares all the values that didn't change with the original one, so deriving many queries
+    from the same template is cheap, and a template can be shared between threads.
+
+    Examples:
+
+    >>> template = Query().select('name', 'close|5', 'VWAP|5').freeze()
+    >>> queries = [
+    ...     template.where(Column('close|5') > price).set_tickers(ticker)
+    ...     for ticker, price in [('NASDAQ:AAPL', 185.0), ('NYSE:GME', 17.5)]
+    ... ]
+    >>> template.query['columns']  # unchanged
+    ['name', 'close|5', 'VWAP|5']
+
+    Note that the values in `query` are shared, so they must not be modified.
+    """
+
+    def __init__(self, query: Query | None = None) -> None:
+        """
+        :param query: the `Query` to copy, defaults to `Query()`
+        """
+        query = Query() if query is None else query.copy()
+        self.__dict__.update(query.__dict__)
+        self.__dict__['_frozen'] = True
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self.__dict__.get('_frozen'):
+            raise AttributeError(f'{type(self).__name__} is immutable')
+        super().__setattr__(name, value)
+
+    def _derive(self, method: Callable[..., Query], *args, **kwargs) -> FrozenQuery:
+        new = object.__new__(type(self))
+        new.__dict__.update(self.__dict__, query=dict(self.query), _frozen=False)
+        method(new, *args, **kwargs)
+        new.__dict__['_frozen'] = True
+        return new
+
+    def set_markets(self, *markets: str) -> FrozenQuery:
+        return self._derive(Query.set_markets, *markets)
+
+    def set_tickers(self, *tickers: str) -> FrozenQuery:
+        return self._derive(Query.set_tickers, *tickers)
+
+    def select(self, *columns: Column | str) -> FrozenQuery:
+        return self._derive(Query.select, *columns)
+
+    def where(self, *expressions: FilterOperationDict) -> FrozenQuery:
+        return self._derive(Query.where, *expressions)
+
+    def order_by(self, column: Column | str, ascending: bool = True) -> FrozenQuery:
+        return self._derive(Query.order_by, column, ascending)
+
+    def offset(self, offset: int) -> FrozenQuery:
+        return self._derive(Query.offset, offset)
+
+    def limit(self, limit: int) -> FrozenQuery:
+        return self._derive(Query.limit, limit)
+
+    def set_transport(self, transport: Transport | None) -> FrozenQuery:
+        return self._derive(Query.set_transport, transport)
+
+    def freeze(self) -> FrozenQuery:
+        return self
+
+    def copy(self) -> Query:
+        """
+        :return: a mutable (deep) copy of the query
+        """
+        return Query.copy(self)
+
+
+class PreparedQuery:
+    """
+    An immutable, pre-encoded version of a `Query`, created with `Query.compile()`.
+
+    The static parts of the JSON body (columns, filters, sort, options, etc.) are encoded to bytes
+    once, and every execution only encodes the tickers and the range.
+    """
+
+    __slots__ = ('url', 'columns', 'transport', '_static', '_markets', '_symbols', '_range')
+
+    def __init__(self, query: QueryDict, url: str, transport: Transport | None = None) -> None:
+        fragments = {key: _encode(value) for key, value in query.items()}
+        set_attribute = super().__setattr__
+        set_attribute('url', url)
+        set_attribute('columns', tuple(query.get('columns', [])))
+        set_attribute('transport', transport)
+        set_attribute('_markets', fragments.pop('markets', None))
+        set_attribute('_symbols', fragments.pop('symbols', None))
+        set_attribute('_range', tuple(query.get('range', [0, 50])))
+        fragments.pop('range', None)
+        static = b','.join(b'"%s":%s' % (key.encode(), value) for key, value in fragments.items())
+        set_attribute('_static', static)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f'{type(self).__name__} is immutable')
+
+    def body(
+        self, tickers: Iterable[str] | None = None, range: tuple[int, int] | None = None
+    ) -> bytes:
+        """
+        :param tickers: the tickers to send, instead of the ones (or the markets) of the query
+        :param range: the `(offset, end)` rows to send, instead of the range of the query
+        :return: the JSON body of the request
+        """
+        parts = [self._static] if self._static else []
+        if tickers is not None:
+            # just like `Query.set_tickers()`, the markets aren't needed when the tickers are given
+            parts.append(b'"symbols":{"tickers":%s}' % _encode(list(tickers)))
+        else:
+            if self._markets is not None:
+                parts.append(b'"markets":%s' % self._markets)
+            if self._symbols is not None:
+                parts.append(b'"symbols":%s' % self._symbols)
+        parts.append(b'"range":%s' % _encode(list(self._range if range is None else range)))
+        return b'{%s}' % b','.join(parts)
+
+    def _url(self, tickers: Iterable[str] | None) -> str:
+        if tickers is None:
+            return self.url
+        # `https://scanner.tradingview.com/america/scan` -> `.../global/scan`
+        return self.url.rsplit('/', 2)[0] + '/global/scan'
+
+    def get_scanner_data(
+        self,
+        tickers: Iterable[str] | None = None,
+        range: tuple[int, int] | None = None,
+        stats: RequestStats | None = None,
+        **kwargs,
+    ) -> tuple[int, pd.DataFrame]:
+        """
+        The same as `Query.get_scanner_data()`, with the given tickers and range.
+
+        :param tickers: the tickers to send, instead of the ones (or the markets) of the query
+        :param range: the `(offset, end)` rows to send, instead of the range of the query
+        :param stats: a `RequestStats` to fill with the timings of the request
+        :param kwargs: kwargs to pass to `requests.Session.post()`
+        :return: a tuple consisting of: (total_count, dataframe)
+        """
+        transport = self.transport or get_default_transport()
+        stats = RequestStats() if stats is None else stats
+        body = self.body(tickers, range)
+        json_obj = transport.scan(self._url(tickers), body, stats=stats, **kwargs)
+        result = _timed_parse(self._parse_response, json_obj, stats)
+        transport.emit(stats)
+        return result
+
+    async def aget_scanner_data(
+        self,
+        tickers: Iterable[str] | None = None,
+        range: tuple[int, int] | None = None,
+        transport: AsyncTransport | None = None,
+        stats: RequestStats | None = None,
+        **kwargs,
+    ) -> tuple[int, pd.DataFrame]:
+        """
+        The asyncio version of `get_scanner_data()` (requires `aiohttp`).
+        """
+        transport = transport or get_default_async_transport()
+        stats = RequestStats() if stats is None else stats
+        body = self.body(tickers, range)
+        json_obj = await transport.scan(self._url(tickers), body, stats=stats, **kwargs)
+        result = _timed_parse(self._parse_response, json_obj, stats)
+        transport.emit(stats)
+        return result
+
+    def _parse_response(self, json_obj: dict[str, Any]) -> tuple[int, pd.DataFrame]:
+        from tradingview_screener.decoder import decode_rows
+
+        return json_obj['totalCount'], decode_rows(json_obj['data'], self.columns)
+
+    def __repr__(self) -> str:
+        return f'< PreparedQuery({self.body().decode()}) >'
+
+
+def _encode(value: Any) -> bytes:
+    return json.dumps(value, separators=(',', ':')).encode()
+
+
+def _timed_parse(
+    parse: Callable[[dict[str, Any]], tuple[int, pd.DataFrame]],
+    json_obj: dict[str, Any],
+    stats: RequestStats,
+) -> tuple[int, pd.DataFrame]:
+    start = time.perf_counter()
+    rows_count, df = parse(json_obj)
+    stats.decode = time.perf_counter() - start
+    stats.rows = len(df)
+    return rows_count, df
+
+
+async def gather_scanner_data(
+    queries: Iterable[Query],
+    concurrency: int = 16,
+    transport: AsyncTransport | None = None,
+    **kwargs,
+) -> list[tuple[int, pd.DataFrame]]:
+    """
+    Execute many queries concurrently, with at most `concurrency` requests in flight at any time.
+
+    The results are returned in the same order as the queries.
+
+    Examples:
+
+    >>> import asyncio
+    >>> from tradingview_screener import AsyncTransport, Query, gather_scanner_data
+    >>> queries = [Query().set_tickers(t) for t in ('NASDAQ:AAPL', 'NASDAQ:TSLA', 'NYSE:GME')]
+    >>> async def main():
+    ...     async with AsyncTransport() as transport:
+    ...         return await gather_scanner_data(queries, concurrency=8, transport=transport)
+    >>> results = asyncio.run(main())
+    >>> [df['ticker'].tolist() for _, df in results]
+    [['NASDAQ:AAPL'], ['NASDAQ:TSLA'], ['NYSE:GME']]
+
+    :param queries: the `Query` objects to execute
+    :param concurrency: max number of requests in flight at the same time
+    :param transport: the `AsyncTransport` to use, defaults to the process-wide one
+    :param kwargs: kwargs to pass to `aiohttp.ClientSession.request()`
+    :return: a list of `(total_count, dataframe)` tuples, one for each query
+    """
+    import asyncio
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(query: Query) -> tuple[int, pd.DataFrame]:
+        async with semaphore:
+            return await query.aget_scanner_data(transport=transport, **kwargs)
+
+    return list(await asyncio.gather(*(run(q) for q in queries)))
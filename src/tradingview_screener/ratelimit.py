@@ -0,0 +1,210 @@
+"""
+Client-side rate limiting for the scanner API.
+
+When many scans are sent at once, `scanner.tradingview.com` starts answering with 429 (Too Many
+Requests). A `RateLimiter` keeps the request rate and the concurrency of every host within what the
+server tolerates, instead of failing the whole batch:
+
+- a token bucket limits the number of requests per second (with bursts)
+- the concurrency limit is adaptive: it's halved on every 429 and slowly grows back on success
+- a `Retry-After` header pauses every request to that host for the given time
+
+Examples:
+
+>>> from tradingview_screener import RateLimiter, Transport, set_default_transport
+>>> limiter = RateLimiter(rate=10, burst=20, max_concurrency=8)
+>>> set_default_transport(Transport(rate_limiter=limiter))
+>>> ...
+>>> limiter.metrics()
+{'scanner.tradingview.com': {'requests': 412, 'throttled': 3, 'failed': 0, 'waited': 4.73,
+                             'concurrency': 5.6, 'in_flight': 0}}
+"""
+
+from __future__ import annotations
+
+__all__ = ['RateLimiter', 'retry_delay', 'parse_retry_after']
+
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+POLL_INTERVAL = 0.01  # how often to check for a free slot when the concurrency limit is reached
+
+
+class _HostState:
+    def __init__(self, burst: float, max_concurrency: int) -> None:
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.concurrency = float(max_concurrency)
+        self.in_flight = 0
+        self.requests = 0
+        self.throttled = 0
+        self.failed = 0
+        self.waited = 0.0
+
+
+class RateLimiter:
+    """
+    A token bucket and an adaptive (AIMD) concurrency limit for every host.
+
+    The limiter is shared by all the threads (and coroutines) that use the same transport, and
+    it's safe to share it between a `Transport` and an `AsyncTransport`.
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        burst: int = 20,
+        max_concurrency: int = 16,
+        min_concurrency: int = 1,
+    ) -> None:
+        """
+        :param rate: max number of requests per second sent to a host
+        :param burst: max number of requests that can be sent at once, after a quiet period
+        :param max_concurrency: max number of requests in flight to a host
+        :param min_concurrency: the concurrency is never reduced below this value
+        """
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self._hosts: dict[str, _HostState] = {}
+        self._lock = threading.Lock()
+
+    def _host(self, url: str) -> _HostState:
+        host = urlsplit(url).netloc
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = _HostState(self.burst, self.max_concurrency)
+        return state
+
+    def _reserve(self, url: str) -> float:
+        # take a token and a concurrency slot, or return how long to wait before trying again
+        with self._lock:
+            state = self._host(url)
+            now = time.monotonic()
+            state.tokens = min(self.burst, state.tokens + (now - state.updated) * self.rate)
+            state.updated = now
+
+            if state.paused_until > now:
+                return state.paused_until - now
+            if state.in_flight >= int(state.concurrency):
+                return POLL_INTERVAL
+            if state.tokens < 1:
+                return (1 - state.tokens) / self.rate
+
+            state.tokens -= 1
+            state.in_flight += 1
+            state.requests += 1
+            return 0.0
+
+    def _add_wait(self, url: str, seconds: float) -> None:
+        with self._lock:
+            self._host(url).waited += seconds
+
+    def acquire(self, url: str) -> None:
+        """
+        Block until a request to the host of `url` can be sent.
+        """
+        start = time.monotonic()
+        while True:
+            wait = self._reserve(url)
+            if not wait:
+                break
+            time.sleep(wait)
+        self._add_wait(url, time.monotonic() - start)
+
+    async def aacquire(self, url: str) -> None:
+        """
+        The async version of `acquire()`.
+        """
+        import asyncio
+
+        start = time.monotonic()
+        while True:
+            wait = self._reserve(url)
+            if not wait:
+                break
+            await asyncio.sleep(wait)
+        self._add_wait(url, time.monotonic() - start)
+
+    def release(self, url: str, status: int | None, retry_after: float | None = None) -> None:
+        """
+        Free the slot taken by `acquire()`, and adapt the limits to the response.
+
+        :param url: the URL of the request
+        :param status: the HTTP status of the response, `None` if the request failed
+        :param retry_after: the value of the `Retry-After` header, in seconds
+        """
+        with self._lock:
+            state = self._host(url)
+            state.in_flight -= 1
+            if status == 429:
+                # multiplicative decrease
+                state.throttled += 1
+                state.concurrency = max(self.min_concurrency, state.concurrency / 2)
+                state.tokens = min(state.tokens, 0)
+            elif status is None or status >= 500:
+                state.failed += 1
+            else:
+                # additive increase, by one slot after `concurrency` successful requests
+                state.concurrency = min(
+                    self.max_concurrency, state.concurrency + 1 / state.concurrency
+                )
+            if retry_after:
+                state.paused_until = max(state.paused_until, time.monotonic() + retry_after)
+
+    def metrics(self) -> dict[str, dict[str, float]]:
+        """
+        :return: the counters of every host
+        """
+        with self._lock:
+            return {
+                host: {
+                    'requests': state.requests,
+                    'throttled': state.throttled,
+                    'failed': state.failed,
+                    'waited': round(state.waited, 3),
+                    'concurrency': round(state.concurrency, 2),
+                    'in_flight': state.in_flight,
+                }
+                for host, state in self._hosts.items()
+            }
+
+    def __repr__(self) -> str:
+        return f'< RateLimiter(rate={self.rate!r}, burst={self.burst!r}) >'
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    :param value: the value of a `Retry-After` header, in seconds or as an HTTP date
+    :return: the number of seconds to wait, or `None`
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    from email.utils import parsedate_to_datetime
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def retry_delay(attempt: int, backoff_factor: float, retry_after: float | None = None) -> float:
+    """
+    Exponential backoff with "full jitter", so the clients that were throttled at the same time
+    don't all retry at the same time.
+
+    :param attempt: the number of the failed attempt, starting from 0
+    :param backoff_factor: the base delay, in seconds
+    :param retry_after: the value of the `Retry-After` header, it's used as the minimum delay
+    :return: the number of seconds to wait before retrying
+    """
+    delay = random.uniform(0, backoff_factor * 2**attempt)
+    return max(delay, retry_after or 0.0)
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
 
+from tradingview_screener import constants
 from tradingview_screener.query import Query
 from tradingview_screener.constants import URL
+from tradingview_screener.transport import Transport, get_default_transport
+from tradingview_screener.universe import SymbolCache, Universe
 
 
 DEFAULT_COLUMNS = ['name', 'close', 'volume', 'market_cap_basic']  # for the scanners
@@ -105,7 +109,11 @@ class Scanner:
         return [x for x in cls.__dict__.keys() if not x.startswith('_') and x != 'names']
 
 
-def get_all_symbols(market: str = 'america') -> list[str]:
+def get_all_symbols(
+    market: str = 'america',
+    transport: Transport | None = None,
+    cache: SymbolCache | None = None,
+) -> list[str]:
     """
     Get all the symbols of a given market.
 
@@ -154,11 +162,65 @@ def get_all_symbols(market: str = 'america') -> list[str]:
     >>> len(get_all_symbols(market='israel'))
     1034
 
+    The universe only changes a few times a day, so it can be kept on disk between runs:
+    >>> from tradingview_screener import SymbolCache
+    >>> cache = SymbolCache(max_age=6 * 3600)
+    >>> get_all_symbols(market='futures', cache=cache)  # only downloaded once every 6 hours
+    ['AMEX:BTC1!',
+     'AMEX:ETH1!',
+     ...
+
     :param market: any market from `tradingview_screener.constants.MARKETS`, default 'america'
+    :param transport: the `Transport` to send the request with, defaults to the process-wide one
+    :param cache: a `SymbolCache`, the symbols are only downloaded if the cached ones are missing
+     or older than its `max_age` (note that the cached symbols are sorted)
     :return: list of tickers
     """
-    r = requests.get(URL.format(market=market))
-    r.raise_for_status()
-    data = r.json()['data']  # [{'s': 'NYSE:HKD', 'd': []}, {'s': 'NASDAQ:ALTY', 'd': []}...]
+    if cache is not None:
+        symbols = cache.get(market)
+        if symbols is not None:
+            return symbols
+
+    transport = transport or get_default_transport()
+    # [{'s': 'NYSE:HKD', 'd': []}, {'s': 'NASDAQ:ALTY', 'd': []}...]
+    data = transport.scan(URL.format(market=market))['data']
+    symbols = [dct['s'] for dct in data]
+
+    if cache is not None:
+        cache.update(market, symbols)
+        return sorted(set(symbols))
+    return symbols
+
+
+def get_universe(
+    markets: Iterable[str] | None = None,
+    max_workers: int = 8,
+    transport: Transport | None = None,
+    cache: SymbolCache | None = None,
+) -> Universe:
+    """
+    Download the symbols of many markets concurrently, and merge them into a single `Universe`.
 
-    return [dct['s'] for dct in data]
+    Examples:
+
+    >>> from tradingview_screener import get_universe
+    >>> universe = get_universe(['america', 'uk', 'germany'])
+    >>> universe
+    < Universe(markets=['america', 'uk', 'germany'], symbols=49013) >
+    >>> 'NASDAQ:AAPL' in universe, 'NASDAQ:NOPE' in universe
+    (True, False)
+    >>> universe.isin(['NYSE:GME', 'LSE:VOD', 'XETR:NOPE'])
+    array([ True,  True, False])
+
+    :param markets: markets from `constants.MARKETS`, defaults to all of them
+    :param max_workers: max number of markets downloaded at the same time
+    :param transport: the `Transport` to send the requests with, defaults to the process-wide one
+    :param cache: a `SymbolCache`, see `get_all_symbols()`
+    :return: a `Universe` with the (deduplicated) symbols of all the markets
+    """
+    markets = sorted(constants.MARKETS) if markets is None else list(markets)
+    transport = transport or get_default_transport()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(lambda m: get_all_symbols(m, transport, cache), markets)
+        symbols = [symbol for market_symbols in results for symbol in market_symbols]
+    return Universe.from_symbols(symbols, markets)
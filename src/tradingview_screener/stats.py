@@ -0,0 +1,103 @@
+"""
+Timings and sizes of the requests sent to the scanner API.
+
+Every request executed through a `Transport` (or an `AsyncTransport`) produces a `RequestStats`,
+which is passed to the hooks of the transport once the request is complete. The hooks can be used
+to export the timings to a metrics pipeline.
+
+Examples:
+
+>>> from tradingview_screener import Query, Transport, set_default_transport
+>>> set_default_transport(Transport(hooks=[print]))
+>>> Query().select('close').get_scanner_data()
+< RequestStats(url='https://scanner.tradingview.com/america/scan', status=200, rows=50,
+  total=0.214, request=0.187, download=0.012, parse=0.001, decode=0.003, ...) >
+
+Or collect the stats of a single query:
+>>> from tradingview_screener import RequestStats
+>>> stats = RequestStats()
+>>> Query().select('close').get_scanner_data(stats=stats)
+>>> stats.request, stats.rows
+(0.187, 50)
+"""
+
+from __future__ import annotations
+
+__all__ = ['RequestStats']
+
+import time
+from typing import Any
+
+
+class RequestStats:
+    """
+    The phases of a single request, in seconds, plus the payload sizes and the row count.
+
+    The phases that don't apply are `None`: i.e. `dns` and `connect` are only measured by the
+    `AsyncTransport` (`requests` doesn't expose them), and a cached response has no network phases.
+    Opening the connection is always included in `request`.
+    """
+
+    __slots__ = (
+        'url',
+        'status',
+        'attempts',
+        'cached',
+        'shared',
+        'queued',
+        'dns',
+        'connect',
+        'request',
+        'download',
+        'parse',
+        'decode',
+        'request_bytes',
+        'raw_bytes',
+        'decoded_bytes',
+        'rows',
+        'total',
+        'started',
+    )
+
+    def __init__(self, url: str | None = None) -> None:
+        self.url = url
+        self.status: int | None = None  # the HTTP status of the last attempt
+        self.attempts = 0  # the number of requests sent (1 + retries)
+        self.cached = False  # served by the `ResponseCache`
+        self.shared = False  # served by an identical request of another thread (see `coalesce`)
+
+        self.queued: float | None = None  # waiting for the `RateLimiter`
+        self.dns: float | None = None  # resolving the host name
+        self.connect: float | None = None  # opening the connection (TCP and TLS)
+        self.request: float | None = None  # sending the request, until the headers are received
+        self.download: float | None = None  # receiving (and decompressing) the body
+        self.parse: float | None = None  # decoding the JSON
+        self.decode: float | None = None  # building the DataFrame
+
+        self.request_bytes: int | None = None
+        self.raw_bytes: int | None = None  # the body, as received over the network
+        self.decoded_bytes: int | None = None  # the body, after the decompression
+        self.rows: int | None = None
+        self.total: float | None = None  # from the start of the request to the DataFrame
+
+        self.started = time.perf_counter()
+
+    def add(self, phase: str, seconds: float) -> None:
+        """
+        Add some time to a phase (the retries add up).
+        """
+        setattr(self, phase, (getattr(self, phase) or 0.0) + seconds)
+
+    def finish(self) -> None:
+        self.total = time.perf_counter() - self.started
+
+    def as_dict(self) -> dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__ if name != 'started'}
+
+    def __repr__(self) -> str:
+        fields = []
+        for name, value in self.as_dict().items():
+            if value is None or value is False:
+                continue
+            fields.append(f'{name}={round(value, 6) if isinstance(value, float) else value!r}')
+        return f'< RequestStats({", ".join(fields)}) >'
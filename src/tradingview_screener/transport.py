@@ -0,0 +1,732 @@
+from __future__ import annotations
+
+__all__ = [
+    'Transport',
+    'AsyncTransport',
+    'Transfer',
+    'TransferLog',
+    'get_default_transport',
+    'set_default_transport',
+    'get_default_async_transport',
+    'set_default_async_transport',
+]
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterable, NamedTuple, Sequence, TypeVar
+
+from tradingview_screener import json_backend
+from tradingview_screener.cache import ResponseCache
+from tradingview_screener.constants import HEADERS
+from tradingview_screener.ratelimit import RateLimiter, parse_retry_after, retry_delay
+from tradingview_screener.stats import RequestStats
+
+if TYPE_CHECKING:
+    # asyncio is only needed by the async transport, so it's imported lazily
+    import asyncio
+
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+CHUNK_SIZE = 64 * 1024  # the responses are read (and decompressed) in chunks of this size
+
+T = TypeVar('T')
+Hook = Callable[[RequestStats], Any]
+
+
+class SingleFlight:
+    """
+    Deduplicate concurrent identical calls: the first caller of a given key runs the function, and
+    the callers that arrive while it's still running wait for it and get the same result (or the
+    same exception).
+    """
+
+    def __init__(self) -> None:
+        self.shared = 0  # how many calls were served by another caller's call
+        self._calls: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        with self._lock:
+            future = self._calls.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = self._calls[key] = Future()
+            else:
+                self.shared += 1
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class AsyncSingleFlight:
+    """
+    The asyncio version of `SingleFlight`, it deduplicates identical calls between the coroutines of
+    the same event loop.
+
+    The call runs in its own task, which every caller awaits through `asyncio.shield()`: cancelling
+    one caller (e.g. a `wait_for()` timeout) only cancels that caller, the others still get the
+    result. The task itself is cancelled once all of its callers are.
+    """
+
+    def __init__(self) -> None:
+        self.shared = 0
+        self._calls: dict[str, _AsyncCall] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        import asyncio
+
+        call = self._calls.get(key)
+        if call is not None and call.task.get_loop() is asyncio.get_running_loop():
+            self.shared += 1
+        else:
+            call = self._calls[key] = _AsyncCall(asyncio.ensure_future(fn()))
+            call.task.add_done_callback(lambda task: self._done(key, call))
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        except asyncio.CancelledError:
+            if call.waiters == 1:
+                call.task.cancel()  # nobody else is waiting for it
+            raise
+        finally:
+            call.waiters -= 1
+
+    def _done(self, key: str, call: _AsyncCall) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        if not call.task.cancelled():
+            call.task.exception()  # mark it as retrieved, in case nobody else was waiting for it
+
+
+class _AsyncCall:
+    __slots__ = ('task', 'waiters')
+
+    def __init__(self, task: asyncio.Future) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class Transfer(NamedTuple):
+    """
+    The size of a response, before and after decompression.
+    """
+
+    url: str
+    content_encoding: str  # i.e. `gzip`, `br`, `zstd`, or an empty string when not compressed
+    raw_bytes: int  # the bytes received over the network
+    decoded_bytes: int  # the bytes of the decompressed JSON
+
+
+class TransferLog:
+    """
+    Keeps the `Transfer` of the latest responses, and the total bytes received by a transport.
+
+    Examples:
+
+    >>> transport = Transport()
+    >>> Query().set_transport(transport).get_scanner_data()
+    >>> transport.transfers.records[-1]
+    Transfer(url='https://scanner.tradingview.com/america/scan', content_encoding='gzip',
+             raw_bytes=1542, decoded_bytes=5403)
+    >>> transport.transfers.ratio  # the fraction of bytes saved by the compression
+    0.7146
+    """
+
+    def __init__(self, maxlen: int = 1000) -> None:
+        """
+        :param maxlen: how many `Transfer` records to keep
+        """
+        self.records: deque[Transfer] = deque(maxlen=maxlen)
+        self.raw_bytes = 0
+        self.decoded_bytes = 0
+        self._lock = threading.Lock()
+
+    def add(self, transfer: Transfer) -> None:
+        with self._lock:
+            self.records.append(transfer)
+            self.raw_bytes += transfer.raw_bytes
+            self.decoded_bytes += transfer.decoded_bytes
+
+    @property
+    def ratio(self) -> float:
+        """
+        :return: the fraction of the bytes saved by the compression (0 if nothing was compressed)
+        """
+        if not self.decoded_bytes:
+            return 0.0
+        return round(1 - self.raw_bytes / self.decoded_bytes, 4)
+
+    def __repr__(self) -> str:
+        return (
+            f'< TransferLog(raw_bytes={self.raw_bytes}, decoded_bytes={self.decoded_bytes}, '
+            f'ratio={self.ratio}) >'
+        )
+
+
+def _accept_encoding(compression: bool | Sequence[str], supported: Sequence[str]) -> str:
+    if compression is True:
+        return ', '.join(supported)
+    if not compression:
+        return 'identity'
+    unsupported = [encoding for encoding in compression if encoding not in supported]
+    if unsupported:
+        raise ValueError(f'unsupported encodings: {unsupported}, choose from {supported}')
+    return ', '.join(compression)
+
+
+class Transport:
+    """
+    A pooled, keep-alive HTTP client used to talk to the scanner API.
+
+    Every `Query` sends its requests through a `Transport`. By default all the queries share a
+    single process-wide transport (see `get_default_transport()`), so consecutive scans reuse the
+    same warm TCP/TLS connections instead of paying a new handshake on every call.
+
+    Examples:
+
+    Use a bigger connection pool for the whole process
+    >>> from tradingview_screener import Transport, set_default_transport
+    >>> set_default_transport(Transport(pool_maxsize=32, max_retries=5))
+
+    Or use a dedicated transport for a single query
+    >>> transport = Transport(timeout=5)
+    >>> Query().set_transport(transport).get_scanner_data()
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 4,
+        pool_maxsize: int = 16,
+        max_retries: int = 3,
+        backoff_factor: float = 0.3,
+        timeout: float = 20,
+        headers: dict[str, str] | None = None,
+        cache: ResponseCache | None = None,
+        coalesce: bool = True,
+        compression: bool | Sequence[str] = True,
+        rate_limiter: RateLimiter | None = None,
+        hooks: Iterable[Hook] = (),
+    ) -> None:
+        """
+        :param pool_connections: number of host pools to keep (one per host)
+        :param pool_maxsize: max number of connections kept alive per host
+        :param max_retries: how many times to retry on connection errors and 429/5xx responses
+        :param backoff_factor: exponential backoff factor between retries (in seconds)
+        :param timeout: default timeout (in seconds) of every request
+        :param headers: headers sent with every request, defaults to `constants.HEADERS`
+        :param cache: an optional `ResponseCache`, disabled by default
+        :param coalesce: when multiple threads send the same request at the same time, only send
+         it once and share the response between all of them
+        :param compression: `True` to accept every encoding that can be decoded (gzip and deflate,
+         plus br and zstd when `brotli`/`zstandard` are installed), a list of encodings to accept
+         only those, or `False` to disable the compression
+        :param rate_limiter: an optional `RateLimiter`, to throttle the requests sent to every host
+        :param hooks: functions called with the `RequestStats` of every request, once it's complete
+        """
+        # requests is imported here rather than at the top of the module, so that it's only loaded
+        # once a transport is actually created (which happens on the first query)
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.request import ACCEPT_ENCODING
+        from urllib3.util.retry import Retry
+
+        self.timeout = timeout
+        self.cache = cache
+        self.coalesce = coalesce
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.rate_limiter = rate_limiter
+        self.hooks = list(hooks)
+        self.inflight = SingleFlight()
+        self.transfers = TransferLog()
+
+        # urllib3 only retries the connection errors, the 429/5xx responses are retried by
+        # `_request()` so that the rate limiter sees them
+        retry = Retry(
+            total=max_retries,
+            status=0,
+            backoff_factor=backoff_factor,
+            allowed_methods=None,  # the scan endpoint is read-only, so POST is safe to retry
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry
+        )
+
+        self.session = requests.Session()
+        self.session.headers.update(HEADERS if headers is None else headers)
+        self.session.headers['accept-encoding'] = _accept_encoding(
+            compression, ACCEPT_ENCODING.split(',')
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def scan(
+        self,
+        url: str,
+        payload: dict | bytes | None = None,
+        stats: RequestStats | None = None,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """
+        POST the payload to a scanner endpoint (or GET it when there is no payload) and return the
+        decoded JSON.
+
+        :param url: scanner URL, i.e. `https://scanner.tradingview.com/america/scan`
+        :param payload: the query dict (or its JSON encoding, see `Query.compile()`), if `None` a
+         GET request is sent instead
+        :param stats: a `RequestStats` to fill, if given the caller must pass it to `emit()` once
+         it's done with the response, otherwise the hooks are called before returning
+        :param kwargs: kwargs to pass to `requests.Session.request()`
+        :return: the JSON response as a dict
+        """
+        owner = stats is None
+        if owner:
+            stats = RequestStats(url)
+        stats.url = url
+
+        key = ResponseCache.make_key(url, payload, **kwargs)
+        json_obj = None if self.cache is None else self.cache.get(key)
+        if json_obj is not None:
+            stats.cached = True
+        elif self.coalesce:
+            json_obj = self.inflight.do(
+                key, lambda: self._request(key, url, payload, stats, **kwargs)
+            )
+            # only the thread that sent the request fills its stats
+            stats.shared = stats.status is None
+        else:
+            json_obj = self._request(key, url, payload, stats, **kwargs)
+
+        if owner:
+            self.emit(stats)
+        return json_obj
+
+    def emit(self, stats: RequestStats) -> None:
+        """
+        Complete the stats of a request, and pass them to the hooks.
+        """
+        stats.finish()
+        for hook in self.hooks:
+            hook(stats)
+
+    def _request(
+        self, key: str, url: str, payload: dict | bytes | None, stats: RequestStats, **kwargs
+    ) -> dict[str, Any]:
+        kwargs.setdefault('timeout', self.timeout)
+        kwargs['stream'] = True  # read the body in chunks, to count the compressed bytes
+        if payload is None:
+            method, kwargs['json'] = 'GET', None
+        elif isinstance(payload, bytes):
+            method, kwargs['data'] = 'POST', payload
+        else:
+            method, kwargs['json'] = 'POST', payload
+
+        limiter = self.rate_limiter
+        for attempt in range(self.max_retries + 1):
+            last_attempt = attempt == self.max_retries
+            if limiter is not None:
+                start = time.perf_counter()
+                limiter.acquire(url)
+                stats.add('queued', time.perf_counter() - start)
+            status = retry_after = None
+            try:
+                start = time.perf_counter()
+                r = self.session.request(method, url, **kwargs)
+                stats.add('request', time.perf_counter() - start)
+                stats.attempts += 1
+                stats.status = status = r.status_code
+                if status < 400:
+                    # the chunks are decompressed as they arrive, instead of after the whole body
+                    # is received
+                    start = time.perf_counter()
+                    content = b''.join(r.iter_content(CHUNK_SIZE))
+                    stats.add('download', time.perf_counter() - start)
+                    break
+                if status in RETRY_STATUSES:
+                    retry_after = parse_retry_after(r.headers.get('retry-after'))
+                if last_attempt or status not in RETRY_STATUSES:
+                    # add the body to the error message for debugging purposes
+                    r.reason += f'\n Body: {r.text}\n'
+                    r.raise_for_status()
+                r.content  # read the body, so that the connection can be reused
+            finally:
+                if limiter is not None:
+                    limiter.release(url, status, retry_after)
+            time.sleep(retry_delay(attempt, self.backoff_factor, retry_after))
+
+        encoding = r.headers.get('content-encoding', '')
+        transfer = Transfer(url, encoding, r.raw.tell(), len(content))
+        self.transfers.add(transfer)
+        stats.request_bytes = len(r.request.body or b'')
+        stats.raw_bytes = transfer.raw_bytes
+        stats.decoded_bytes = transfer.decoded_bytes
+
+        start = time.perf_counter()
+        json_obj = json_backend.loads(content)
+        stats.parse = time.perf_counter() - start
+        if self.cache is not None:
+            self.cache.set(key, json_obj)
+        return json_obj
+
+    def close(self) -> None:
+        self.session.close()
+
+    def __enter__(self) -> Transport:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f'< Transport(timeout={self.timeout!r}) >'
+
+
+class AsyncTransport:
+    """
+    The asyncio counterpart of `Transport`, built on top of `aiohttp` (which must be installed
+    separately: `pip install aiohttp`).
+
+    The underlying `aiohttp.ClientSession` is created lazily inside the running event loop, and it's
+    recreated if the transport is later used from a different loop (i.e. multiple `asyncio.run()`
+    calls). A session is closed by `close()`, or else when its loop shuts down, so the connections
+    of the process-wide transport don't outlive the `asyncio.run()` that opened them.
+
+    Examples:
+
+    >>> import asyncio
+    >>> from tradingview_screener import AsyncTransport, Query
+    >>> async def main():
+    ...     async with AsyncTransport(limit_per_host=32) as transport:
+    ...         return await Query().aget_scanner_data(transport=transport)
+    >>> asyncio.run(main())
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 16,
+        max_retries: int = 3,
+        backoff_factor: float = 0.3,
+        timeout: float = 20,
+        headers: dict[str, str] | None = None,
+        cache: ResponseCache | None = None,
+        coalesce: bool = True,
+        compression: bool | Sequence[str] = True,
+        rate_limiter: RateLimiter | None = None,
+        hooks: Iterable[Hook] = (),
+    ) -> None:
+        """
+        :param limit: max number of simultaneous connections
+        :param limit_per_host: max number of simultaneous connections per host
+        :param max_retries: how many times to retry on connection errors and 429/5xx responses
+        :param backoff_factor: exponential backoff factor between retries (in seconds)
+        :param timeout: default timeout (in seconds) of every request
+        :param headers: headers sent with every request, defaults to `constants.HEADERS`
+        :param cache: an optional `ResponseCache`, disabled by default
+        :param coalesce: when multiple coroutines send the same request at the same time, only send
+         it once and share the response between all of them
+        :param compression: `True` to accept every encoding that aiohttp can decode, a list of
+         encodings to accept only those, or `False` to disable the compression
+        :param rate_limiter: an optional `RateLimiter`, to throttle the requests sent to every host
+        :param hooks: functions called with the `RequestStats` of every request, once it's complete
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.timeout = timeout
+        self.headers = HEADERS if headers is None else headers
+        self.cache = cache
+        self.coalesce = coalesce
+        self.compression = compression
+        self.rate_limiter = rate_limiter
+        self.hooks = list(hooks)
+        self.inflight = AsyncSingleFlight()
+        self.transfers = TransferLog()
+        self._session = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._closer: asyncio.Task | None = None
+
+    def _get_session(self):
+        import asyncio
+
+        try:
+            import aiohttp
+        except ImportError as e:
+            raise ImportError('AsyncTransport requires aiohttp: `pip install aiohttp`') from e
+
+        loop = asyncio.get_running_loop()
+        if self._session is not None and self._loop is not loop:
+            self._detach_session()
+        if self._session is None or self._session.closed:
+            from aiohttp import compression_utils
+
+            supported = ['gzip', 'deflate']
+            if getattr(compression_utils, 'HAS_BROTLI', False):
+                supported.append('br')
+            if getattr(compression_utils, 'HAS_ZSTD', False):
+                supported.append('zstd')
+            headers = {
+                **self.headers,
+                'accept-encoding': _accept_encoding(self.compression, supported),
+            }
+
+            connector = aiohttp.TCPConnector(limit=self.limit, limit_per_host=self.limit_per_host)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                trace_configs=[_trace_config(aiohttp)],
+            )
+            self._loop = loop
+            # a session can't be closed once its loop is, and `asyncio.run()` cancels the pending
+            # tasks before closing the loop: this one closes the session on the way
+            self._closer = loop.create_task(_close_on_cancel(self._session))
+        return self._session
+
+    def _detach_session(self) -> None:
+        # the transport moved to another loop, the session stays with the old one
+        session, loop, closer = self._session, self._loop, self._closer
+        self._session = self._loop = self._closer = None
+        if not session.closed and not loop.is_closed():
+            # i.e. a loop that is still running in another thread
+            loop.call_soon_threadsafe(closer.cancel)
+
+    async def scan(
+        self,
+        url: str,
+        payload: dict | bytes | None = None,
+        stats: RequestStats | None = None,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """
+        The async version of `Transport.scan()`.
+
+        :param url: scanner URL, i.e. `https://scanner.tradingview.com/america/scan`
+        :param payload: the query dict (or its JSON encoding, see `Query.compile()`), if `None` a
+         GET request is sent instead
+        :param stats: a `RequestStats` to fill, if given the caller must pass it to `emit()` once
+         it's done with the response, otherwise the hooks are called before returning
+        :param kwargs: kwargs to pass to `aiohttp.ClientSession.request()`
+        :return: the JSON response as a dict
+        """
+        owner = stats is None
+        if owner:
+            stats = RequestStats(url)
+        stats.url = url
+
+        key = ResponseCache.make_key(url, payload, **kwargs)
+        json_obj = None if self.cache is None else self.cache.get(key)
+        if json_obj is not None:
+            stats.cached = True
+        elif self.coalesce:
+            json_obj = await self.inflight.do(
+                key, lambda: self._request(key, url, payload, stats, **kwargs)
+            )
+            # only the coroutine that sent the request fills its stats
+            stats.shared = stats.status is None
+        else:
+            json_obj = await self._request(key, url, payload, stats, **kwargs)
+
+        if owner:
+            self.emit(stats)
+        return json_obj
+
+    def emit(self, stats: RequestStats) -> None:
+        """
+        Complete the stats of a request, and pass them to the hooks.
+        """
+        stats.finish()
+        for hook in self.hooks:
+            hook(stats)
+
+    async def _request(
+        self, key: str, url: str, payload: dict | bytes | None, stats: RequestStats, **kwargs
+    ) -> dict[str, Any]:
+        import asyncio
+
+        import aiohttp
+
+        session = self._get_session()
+        method = 'GET' if payload is None else 'POST'
+        if isinstance(payload, bytes):
+            kwargs['data'] = payload
+        else:
+            kwargs['json'] = payload
+        limiter = self.rate_limiter
+        for attempt in range(self.max_retries + 1):
+            last_attempt = attempt == self.max_retries
+            if limiter is not None:
+                start = time.perf_counter()
+                await limiter.aacquire(url)
+                stats.add('queued', time.perf_counter() - start)
+            status = retry_after = None
+            try:
+                start = time.perf_counter()
+                async with session.request(method, url, trace_request_ctx=stats, **kwargs) as r:
+                    stats.add('request', time.perf_counter() - start)
+                    stats.attempts += 1
+                    stats.status = status = r.status
+                    if r.status in RETRY_STATUSES:
+                        retry_after = parse_retry_after(r.headers.get('retry-after'))
+                    if r.status < 400:
+                        start = time.perf_counter()
+                        content = await r.read()
+                        stats.add('download', time.perf_counter() - start)
+                        # aiohttp decompresses the chunks as they arrive
+                        raw_bytes = getattr(r.content, 'total_raw_bytes', len(content))
+                        encoding = r.headers.get('content-encoding', '')
+                        transfer = Transfer(url, encoding, raw_bytes, len(content))
+                        self.transfers.add(transfer)
+                        # aiohttp doesn't expose the encoded body of `json=`
+                        if 'data' in kwargs:
+                            stats.request_bytes = len(kwargs['data'])
+                        stats.raw_bytes = transfer.raw_bytes
+                        stats.decoded_bytes = transfer.decoded_bytes
+
+                        start = time.perf_counter()
+                        json_obj = json_backend.loads(content)
+                        stats.parse = time.perf_counter() - start
+                        if self.cache is not None:
+                            self.cache.set(key, json_obj)
+                        return json_obj
+                    if last_attempt or r.status not in RETRY_STATUSES:
+                        # add the body to the error message for debugging purposes
+                        body = await r.text()
+                        raise aiohttp.ClientResponseError(
+                            r.request_info,
+                            r.history,
+                            status=r.status,
+                            message=f'{r.reason}\n Body: {body}\n',
+                            headers=r.headers,
+                        )
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if last_attempt:
+                    raise
+            finally:
+                if limiter is not None:
+                    limiter.release(url, status, retry_after)
+            await asyncio.sleep(retry_delay(attempt, self.backoff_factor, retry_after))
+
+    async def close(self) -> None:
+        import asyncio
+
+        session, closer = self._session, self._closer
+        self._session = self._loop = self._closer = None
+        if session is not None:
+            await session.close()
+        if closer is not None and not closer.done():
+            closer.cancel()
+            if closer.get_loop() is asyncio.get_running_loop():
+                await asyncio.wait([closer])  # don't leave it pending when the loop is closed
+
+    async def __aenter__(self) -> AsyncTransport:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    def __repr__(self) -> str:
+        return f'< AsyncTransport(timeout={self.timeout!r}) >'
+
+
+async def _close_on_cancel(session) -> None:
+    import asyncio
+
+    try:
+        await asyncio.get_running_loop().create_future()  # i.e. until the loop shuts down
+    except asyncio.CancelledError:
+        await session.close()
+        raise
+
+
+def _trace_config(aiohttp):
+    # measure the DNS and connection phases of the requests of an `AsyncTransport`, the
+    # `RequestStats` is passed to every request as `trace_request_ctx`
+    trace_config = aiohttp.TraceConfig()
+
+    def add_phase(name: str, start_signal, end_signal) -> None:
+        async def on_start(session, context, params) -> None:
+            setattr(context, f'{name}_started', time.perf_counter())
+
+        async def on_end(session, context, params) -> None:
+            stats = context.trace_request_ctx
+            started = getattr(context, f'{name}_started', None)
+            if isinstance(stats, RequestStats) and started is not None:
+                stats.add(name, time.perf_counter() - started)
+
+        start_signal.append(on_start)
+        end_signal.append(on_end)
+
+    add_phase('dns', trace_config.on_dns_resolvehost_start, trace_config.on_dns_resolvehost_end)
+    add_phase(
+        'connect', trace_config.on_connection_create_start, trace_config.on_connection_create_end
+    )
+    return trace_config
+
+
+_default_transport: Transport | None = None
+_default_async_transport: AsyncTransport | None = None
+_default_lock = threading.Lock()
+
+
+def get_default_transport() -> Transport:
+    """
+    Return the process-wide transport, creating it on first use.
+    """
+    global _default_transport
+    if _default_transport is None:
+        with _default_lock:
+            if _default_transport is None:
+                _default_transport = Transport()
+    return _default_transport
+
+
+def set_default_transport(transport: Transport) -> None:
+    """
+    Replace the process-wide transport used by every `Query` that doesn't have its own.
+
+    :param transport: the new default `Transport`
+    """
+    global _default_transport
+    with _default_lock:
+        _default_transport = transport
+
+
+def get_default_async_transport() -> AsyncTransport:
+    """
+    Return the process-wide async transport, creating it on first use.
+    """
+    global _default_async_transport
+    if _default_async_transport is None:
+        with _default_lock:
+            if _default_async_transport is None:
+                _default_async_transport = AsyncTransport()
+    return _default_async_transport
+
+
+def set_default_async_transport(transport: AsyncTransport) -> None:
+    """
+    Replace the process-wide async transport used by `Query.aget_scanner_data()`.
+
+    :param transport: the new default `AsyncTransport`
+    """
+    global _default_async_transport
+    with _default_lock:
+        _default_async_transport = transport
@@ -0,0 +1,283 @@
+"""
+The symbol universe: a persistent, on-disk cache of the symbols of every market, and a merged,
+deduplicated set of symbols with fast lookups.
+
+The universe of a market (the list returned by `get_all_symbols()`) is tens of thousands of
+tickers, but it only changes a few times a day, so there is no reason to download it on every
+start. A `SymbolCache` keeps it in a SQLite file, and `get_all_symbols(cache=...)` only goes to
+the network once the cached list is older than `max_age`.
+
+Examples:
+
+>>> from tradingview_screener import SymbolCache, get_all_symbols
+>>> cache = SymbolCache(max_age=6 * 3600)
+>>> symbols = get_all_symbols('america', cache=cache)  # network (or the file, if it's fresh)
+>>> symbols = get_all_symbols('america', cache=cache)  # the file, in a couple of milliseconds
+>>> cache.age('america')
+12.3
+>>> cache.last_changes('america')
+(['NASDAQ:NEWCO'], ['NYSE:GONE'])
+
+Download many markets at once, and validate tickers against all of them:
+>>> from tradingview_screener import get_universe
+>>> universe = get_universe(['america', 'canada', 'crypto'], cache=cache)
+>>> 'NASDAQ:AAPL' in universe
+True
+>>> universe.exchange('TSX')
+Index(['TSX:AAA', 'TSX:AAB', ...], dtype='object', name='ticker', length=2273)
+"""
+
+from __future__ import annotations
+
+__all__ = ['SymbolCache', 'Universe', 'default_cache_path']
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from functools import cached_property
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Iterator, Sequence
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS universe (
+    market TEXT PRIMARY KEY,
+    updated REAL NOT NULL,  -- unix time of the last download
+    count INTEGER NOT NULL,
+    symbols BLOB NOT NULL,  -- the sorted tickers, joined with newlines and zlib compressed
+    added TEXT NOT NULL,  -- JSON lists of the tickers added/removed by the last change
+    removed TEXT NOT NULL
+) WITHOUT ROWID
+"""
+
+
+def default_cache_path() -> Path:
+    """
+    :return: `$XDG_CACHE_HOME/tradingview_screener/symbols.sqlite` (`~/.cache/...` by default)
+    """
+    root = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(root) / 'tradingview_screener' / 'symbols.sqlite'
+
+
+def _encode(symbols: list[str]) -> bytes:
+    return zlib.compress('\n'.join(symbols).encode(), 6)
+
+
+def _decode(blob: bytes) -> list[str]:
+    text = zlib.decompress(blob).decode()
+    return text.split('\n') if text else []
+
+
+class SymbolCache:
+    """
+    The symbols of every market, stored in a SQLite file with the time they were downloaded.
+
+    Each market is a single row holding the compressed, sorted list of tickers, so loading even
+    the largest universe is one read and one `split()`. The refresh is incremental: the new list
+    is compared with the stored one, the file is only rewritten if something changed, and the
+    tickers that were added or removed are kept (see `last_changes()`).
+
+    The cache can be shared between threads, and between processes (the file uses WAL mode).
+    """
+
+    def __init__(self, path: str | Path | None = None, max_age: float = 24 * 3600) -> None:
+        """
+        :param path: the SQLite file, defaults to `default_cache_path()`
+        :param max_age: how many seconds a market stays valid after it was downloaded
+        """
+        self.path = Path(path) if path is not None else default_cache_path()
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def age(self, market: str) -> float | None:
+        """
+        :return: how many seconds ago the market was downloaded, or `None` if it's not cached
+        """
+        with self._lock:
+            row = self._connect().execute(
+                'SELECT updated FROM universe WHERE market = ?', (market,)
+            ).fetchone()
+        return None if row is None else time.time() - row[0]
+
+    def get(self, market: str, max_age: float | None = None) -> list[str] | None:
+        """
+        :param market: any market from `constants.MARKETS`
+        :param max_age: overrides the `max_age` of the cache
+        :return: the sorted symbols of the market, or `None` if they are missing or too old
+        """
+        max_age = self.max_age if max_age is None else max_age
+        with self._lock:
+            row = self._connect().execute(
+                'SELECT updated, symbols FROM universe WHERE market = ?', (market,)
+            ).fetchone()
+        if row is None or time.time() - row[0] > max_age:
+            return None
+        return _decode(row[1])
+
+    def update(self, market: str, symbols: Iterable[str]) -> tuple[list[str], list[str]]:
+        """
+        Store a freshly downloaded list of symbols, and reset the age of the market.
+
+        :param market: any market from `constants.MARKETS`
+        :param symbols: all the symbols of the market
+        :return: the tickers that were added and removed since the previous update
+        """
+        new = sorted(set(symbols))
+        with self._lock:
+            conn = self._connect()
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                row = conn.execute(
+                    'SELECT symbols FROM universe WHERE market = ?', (market,)
+                ).fetchone()
+                old = _decode(row[0]) if row is not None else []
+                if row is not None and old == new:
+                    conn.execute(
+                        'UPDATE universe SET updated = ? WHERE market = ?', (time.time(), market)
+                    )
+                    added, removed = [], []
+                else:
+                    old_set, new_set = set(old), set(new)
+                    added = [s for s in new if s not in old_set]
+                    removed = [s for s in old if s not in new_set]
+                    # the first download isn't a change, don't store the whole list twice
+                    changes = (added, removed) if row is not None else ([], [])
+                    conn.execute(
+                        'INSERT OR REPLACE INTO universe VALUES (?, ?, ?, ?, ?, ?)',
+                        (
+                            market,
+                            time.time(),
+                            len(new),
+                            _encode(new),
+                            json.dumps(changes[0]),
+                            json.dumps(changes[1]),
+                        ),
+                    )
+                conn.execute('COMMIT')
+            except BaseException:
+                conn.execute('ROLLBACK')
+                raise
+        return added, removed
+
+    def last_changes(self, market: str) -> tuple[list[str], list[str]] | None:
+        """
+        :return: the tickers added and removed by the last update that changed the market (both
+         empty until the market is downloaded a second time), or `None` if it's not cached
+        """
+        with self._lock:
+            row = self._connect().execute(
+                'SELECT added, removed FROM universe WHERE market = ?', (market,)
+            ).fetchone()
+        return None if row is None else (json.loads(row[0]), json.loads(row[1]))
+
+    def markets(self) -> dict[str, int]:
+        """
+        :return: the number of symbols of every cached market
+        """
+        with self._lock:
+            rows = self._connect().execute('SELECT market, count FROM universe').fetchall()
+        return dict(rows)
+
+    def invalidate(self, market: str | None = None) -> None:
+        """
+        Delete a market (or all of them) from the cache.
+        """
+        with self._lock:
+            if market is None:
+                self._connect().execute('DELETE FROM universe')
+            else:
+                self._connect().execute('DELETE FROM universe WHERE market = ?', (market,))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __enter__(self) -> SymbolCache:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f'< SymbolCache(path={str(self.path)!r}, max_age={self.max_age!r}) >'
+
+
+class Universe:
+    """
+    A deduplicated set of symbols (from one or more markets), sorted by exchange and ticker.
+
+    The symbols are kept in a `pandas.Index`, so `ticker in universe` and `universe.isin(...)` are
+    hash lookups (O(1) per ticker), and since every ticker starts with its exchange, the symbols
+    of an exchange are a contiguous slice of the index.
+    """
+
+    def __init__(self, tickers: pd.Index, markets: Sequence[str] = ()) -> None:
+        """
+        :param tickers: a sorted index of unique `EXCHANGE:SYMBOL` tickers (see `from_symbols()`)
+        :param markets: the markets the tickers were downloaded from
+        """
+        self.tickers = tickers
+        self.markets = list(markets)
+
+    @classmethod
+    def from_symbols(cls, symbols: Iterable[str], markets: Sequence[str] = ()) -> Universe:
+        import pandas as pd
+
+        # sorting the Python strings is faster than `Index.sort_values()` on an object array
+        index = pd.Index(sorted(set(symbols)), dtype=object, name='ticker')
+        return cls(index, markets)
+
+    @cached_property
+    def exchanges(self) -> list[str]:
+        """
+        :return: the sorted names of the exchanges in the universe
+        """
+        return sorted(self.tickers.str.split(':', n=1).str[0].unique())
+
+    def exchange(self, name: str) -> pd.Index:
+        """
+        :param name: the name of an exchange, i.e. `NASDAQ`
+        :return: the tickers of the exchange (a binary search, without scanning the index)
+        """
+        # every ticker of the exchange is between `NAME:` and `NAME;` (`;` comes after `:`)
+        start = self.tickers.searchsorted(f'{name}:', side='left')
+        end = self.tickers.searchsorted(f'{name};', side='left')
+        return self.tickers[start:end]
+
+    def isin(self, tickers: Iterable[str]) -> np.ndarray:
+        """
+        :return: a boolean array telling which of the tickers are in the universe
+        """
+        import pandas as pd
+
+        return self.tickers.get_indexer(pd.Index(list(tickers), dtype=object)) >= 0
+
+    def __contains__(self, ticker: object) -> bool:
+        return ticker in self.tickers
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.tickers)
+
+    def __len__(self) -> int:
+        return len(self.tickers)
+
+    def __repr__(self) -> str:
+        return f'< Universe(markets={self.markets!r}, symbols={len(self)}) >'
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import gzip
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class MockScanner:
+    """
+    A tiny stand-in for `scanner.tradingview.com` that serves `n_rows` synthetic rows and honors the
+    `range` and `columns` of the payload.
+    """
+
+    def __init__(self, n_rows: int = 100) -> None:
+        self.n_rows = n_rows
+        self.delay = 0.0  # seconds to wait before replying
+        self.requests: list[dict | None] = []
+        self.client_ports: set[int] = set()
+        self.accept_encodings: list[str] = []
+        self.errors: list[int] = []  # statuses to reply with (in order) before the real responses
+
+    def row(self, i: int, columns: list[str]) -> dict:
+        return {'s': f'NASDAQ:T{i}', 'd': [float(i) for _ in columns]}
+
+    def ticker_row(self, ticker: str, columns: list[str]) -> dict:
+        return self.row(int(ticker.split(':T')[-1]), columns)
+
+    def respond(self, payload: dict | None) -> dict:
+        if payload is None:
+            data = [{'s': f'NASDAQ:T{i}', 'd': []} for i in range(self.n_rows)]
+            return {'totalCount': self.n_rows, 'data': data}
+
+        columns = payload.get('columns', [])
+        tickers = payload.get('symbols', {}).get('tickers')
+        if tickers:
+            rows = [self.ticker_row(t, columns) for t in tickers]
+            return {'totalCount': len(rows), 'data': rows}
+
+        start, end = payload.get('range', [0, self.n_rows])
+        rows = [self.row(i, columns) for i in range(start, min(end, self.n_rows))]
+        return {'totalCount': self.n_rows, 'data': rows}
+
+
+@pytest.fixture
+def mock_scanner():
+    scanner = MockScanner()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def _reply(self, payload: dict | None) -> None:
+            time.sleep(scanner.delay)
+            scanner.requests.append(payload)
+            if scanner.errors:
+                body = b'{"error": "Too many requests"}'
+                self.send_response(scanner.errors.pop(0))
+                self.send_header('Retry-After', '0.1')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                return
+            scanner.client_ports.add(self.client_address[1])
+            body = json.dumps(scanner.respond(payload)).encode()
+            accept_encoding = self.headers.get('Accept-Encoding', '')
+            scanner.accept_encodings.append(accept_encoding)
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            if 'gzip' in accept_encoding:
+                body = gzip.compress(body)
+                self.send_header('Content-Encoding', 'gzip')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self) -> None:
+            self._reply(None)
+
+        def do_POST(self) -> None:
+            length = int(self.headers.get('Content-Length', 0))
+            self._reply(json.loads(self.rfile.read(length)))
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    scanner.url = f'http://127.0.0.1:{server.server_port}/america/scan'
+    yield scanner
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import asyncio
+import gc
+import warnings
+
+import pytest
+
+import tradingview_screener.transport as transport_module
+from tradingview_screener import AsyncTransport, Query, gather_scanner_data
+from tradingview_screener.transport import AsyncSingleFlight
+
+pytest.importorskip('aiohttp')
+
+
+def test_gather_scanner_data_keeps_order(mock_scanner):
+    tickers = [f'NASDAQ:T{i}' for i in range(30)]
+    queries = []
+    for ticker in tickers:
+        q = Query().select('close').set_tickers(ticker)
+        q.url = mock_scanner.url
+        queries.append(q)
+
+    async def main():
+        async with AsyncTransport() as transport:
+            return await gather_scanner_data(queries, concurrency=4, transport=transport)
+
+    results = asyncio.run(main())
+    assert [df['ticker'].tolist() for _, df in results] == [[t] for t in tickers]
+    assert len(mock_scanner.requests) == 30
+
+
+def test_async_identical_requests_are_coalesced(mock_scanner):
+    mock_scanner.delay = 0.2
+    q = Query().select('close')
+    q.url = mock_scanner.url
+
+    async def main():
+        async with AsyncTransport() as transport:
+            results = await gather_scanner_data([q] * 5, transport=transport)
+            return results, transport.inflight.shared
+
+    results, shared = asyncio.run(main())
+    assert len(results) == 5
+    assert len(mock_scanner.requests) == 1
+    assert shared == 4
+
+
+def test_async_compression(mock_scanner):
+    async def main():
+        async with AsyncTransport() as transport:
+            await transport.scan(mock_scanner.url, {'columns': ['close'], 'range': [0, 100]})
+            return transport.transfers.records[-1]
+
+    transfer = asyncio.run(main())
+    assert transfer.content_encoding == 'gzip'
+    assert transfer.raw_bytes < transfer.decoded_bytes
+
+
+def test_async_single_flight_leader_cancelled():
+    inflight = AsyncSingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        return 'result'
+
+    async def main():
+        leader = asyncio.ensure_future(inflight.do('key', fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(inflight.do('key', fetch))
+        await asyncio.sleep(0.01)
+        # e.g. a `wait_for()` timeout of the first caller only
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(main()) == 'result'
+    assert calls == [1]
+    assert inflight.shared == 1
+    assert inflight._calls == {}
+
+
+def test_async_single_flight_all_cancelled():
+    inflight = AsyncSingleFlight()
+    cancelled = []
+
+    async def fetch():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(1)
+            raise
+
+    async def main():
+        callers = [asyncio.ensure_future(inflight.do('key', fetch)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        for caller in callers:
+            caller.cancel()
+        await asyncio.gather(*callers, return_exceptions=True)
+        await asyncio.sleep(0)
+        # the next call starts over
+        return await asyncio.wait_for(inflight.do('key', lambda: asyncio.sleep(0, 'again')), 1)
+
+    assert asyncio.run(main()) == 'again'
+    assert cancelled == [1]
+    assert inflight._calls == {}
+
+
+def test_async_single_flight_exception_is_shared():
+    inflight = AsyncSingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.01)
+        raise ValueError('boom')
+
+    async def main():
+        return await asyncio.gather(
+            *(inflight.do('key', fetch) for _ in range(3)), return_exceptions=True
+        )
+
+    results = asyncio.run(main())
+    assert [type(r) for r in results] == [ValueError] * 3
+    assert inflight.shared == 2
+
+
+def test_default_transport_is_closed_with_its_loop(mock_scanner, monkeypatch):
+    monkeypatch.setattr(transport_module, '_default_async_transport', None)
+    q = Query().select('close')
+    q.url = mock_scanner.url
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        # every `asyncio.run()` has its own loop, the sessions must not outlive them
+        for _ in range(3):
+            _, df = asyncio.run(q.aget_scanner_data())
+            assert len(df) == 50
+        gc.collect()
+    assert [w.message for w in caught if issubclass(w.category, ResourceWarning)] == []
+    assert len(mock_scanner.requests) == 3
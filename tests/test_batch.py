@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from tradingview_screener import Column, Query, Transport, batch_scanner_data
+
+
+def test_batch_scanner_data(mock_scanner):
+    # the mock server returns `i` for every column of the ticker `NASDAQ:Ti`
+    transport = Transport()
+    breaks = {f'NASDAQ:T{i}': 10.5 for i in range(30)}
+    queries = [
+        Query().select('name', 'close').where(Column('close|5') > price).set_tickers(ticker)
+        for ticker, price in breaks.items()
+    ]
+    trend = Query().select('name', 'close').where(Column('EMA8|5') < Column('VWAP|5'))
+    queries.append(trend.set_tickers('NASDAQ:T1'))
+    crossing = Query().select('name').where(Column('EMA8').crosses_above(Column('EMA25')))
+    queries.append(crossing.set_tickers('NASDAQ:T40'))
+    for q in queries:
+        q.url = mock_scanner.url
+        q.set_transport(transport)
+
+    results = batch_scanner_data(queries, max_tickers=20)
+
+    # two merged requests for the 30 tickers, the `crosses_above()` query is sent on its own
+    merged = [r for r in mock_scanner.requests if 'filter' not in r]
+    assert len(mock_scanner.requests) == 3
+    assert [len(r['symbols']['tickers']) for r in merged] == [20, 10]
+    assert 'close|5' in merged[0]['columns']
+    for i, (count, df) in enumerate(results[:30]):
+        assert df.columns.tolist() == ['ticker', 'name', 'close']
+        assert count == len(df) == (1 if i > 10.5 else 0)
+    assert results[30][0] == 0
+    assert results[31][1]['ticker'].tolist() == ['NASDAQ:T40']
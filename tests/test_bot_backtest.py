@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import contextlib
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bot.backtest import _scan_frame, pivot_candles, replay_indicators, run_backtest
+from bot.broker import PaperBroker
+from bot.config import EMA_LONG, EMA_SHORT, EMA_TREND, POSITION_SIZE
+from bot.indicators import IndicatorEngine
+from bot.signals import format_ts
+from bot.strategy import run_strategies
+from bot.trader import execute_signals
+
+TF = '5'
+WARMUP = 50
+
+
+def make_candles(tickers: int = 6, days: int = 3, seed: int = 0) -> pd.DataFrame:
+    # 5-minute candles from 4:00 to 20:00, a few tickers skip some of them
+    rnd = np.random.default_rng(seed)
+    index = pd.DatetimeIndex([
+        ts
+        for day in pd.date_range('2026-10-12 04:00', periods=days, freq='D')
+        for ts in pd.date_range(day, periods=192, freq='5min')
+    ])
+    frames = []
+    for i in range(tickers):
+        close = 50 + 10 * i + rnd.standard_normal(len(index)).cumsum() * 0.3
+        frame = pd.DataFrame({
+            'timestamp': index,
+            'ticker': f'T{i}',
+            'open': close,
+            'high': close + rnd.random(len(index)),
+            'low': close - rnd.random(len(index)),
+            'close': close,
+            'volume': rnd.integers(100, 5000, len(index)).astype(float),
+        })
+        if i % 2:
+            frame = frame.drop(index=rnd.choice(len(frame), 40, replace=False))
+        frames.append(frame)
+    # stored candles aren't sorted
+    candles = pd.concat(frames, ignore_index=True)
+    return candles.sample(frac=1, random_state=seed).reset_index(drop=True)
+
+
+def reference_trades(candles: pd.DataFrame) -> tuple[list[dict], PaperBroker]:
+    # the strategies evaluated bar by bar, like the live bot
+    frame = _scan_frame(replay_indicators(pivot_candles(candles)).query(f'bar >= {WARMUP}'), TF)
+    with contextlib.redirect_stdout(io.StringIO()):
+        broker = PaperBroker(10_000)
+        for ts, bar in frame.groupby('ts', sort=True):
+            n_trades = len(broker.trade_log)
+            for batch in run_strategies(bar, TF).values():
+                execute_signals(batch, broker)
+            bar_time = format_ts(ts)
+            for trade in broker.trade_log[n_trades:]:
+                trade['time'] = bar_time
+    return broker.trade_log, broker
+
+
+@pytest.fixture(scope='module')
+def candles():
+    return make_candles()
+
+
+def test_replay_indicators_match_the_engine(candles):
+    indicators = replay_indicators(pivot_candles(candles))
+    assert indicators['timestamp'].is_monotonic_increasing
+
+    engine = IndicatorEngine()
+    columns = [f'EMA{p}' for p in (EMA_SHORT, EMA_LONG, EMA_TREND)] + ['VWAP', 'RSI']
+    for ticker, bars in candles.sort_values('timestamp').groupby('ticker'):
+        expected = engine.replay(ticker, bars.set_index('timestamp'))
+        result = indicators[indicators['ticker'] == ticker]
+        # the same operations: exactly the same values, not just close ones
+        np.testing.assert_array_equal(result[columns].to_numpy(), expected[columns].to_numpy())
+        np.testing.assert_array_equal(result['timestamp'], expected.index)
+        np.testing.assert_array_equal(result['close'], bars['close'])
+        np.testing.assert_array_equal(result['bar'], np.arange(len(bars)))
+
+
+def test_timestamps_are_in_market_time(candles):
+    # naive timestamps are market time, the same candles in UTC give the same indicators
+    utc = candles.assign(
+        timestamp=candles['timestamp'].dt.tz_localize('America/New_York').dt.tz_convert('UTC')
+    )
+    naive, aware = replay_indicators(pivot_candles(candles)), replay_indicators(pivot_candles(utc))
+    pd.testing.assert_frame_equal(naive, aware)
+    assert str(naive['timestamp'].dt.tz) == 'America/New_York'
+
+    # the VWAP starts over at midnight market time (the first candle of the day is 4:00)
+    first = naive.groupby(naive['timestamp'].dt.date).head(1)
+    assert (first['timestamp'].dt.hour == 4).all()
+    ticker = naive[naive['ticker'] == 'T0']
+    day_start = ticker[ticker['timestamp'].dt.strftime('%H:%M') == '04:00']
+    bars = candles[candles['ticker'] == 'T0'].set_index('timestamp').loc[
+        day_start['timestamp'].dt.tz_localize(None)
+    ]
+    np.testing.assert_allclose(
+        day_start['VWAP'], (bars['high'] + bars['low'] + bars['close']) / 3, rtol=1e-12
+    )
+
+    # the trades are stored in market time, like the live signals
+    report = run_backtest(utc, TF, starting_capital=10_000, warmup=WARMUP)
+    assert report.trades['time'].min() >= '2026-10-12T04:00:00'
+    assert report.trades['time'].str.slice(11).max() <= '20:00:00'
+
+
+@pytest.fixture(scope='module')
+def report(candles):
+    return run_backtest(candles, TF, starting_capital=10_000, warmup=WARMUP)
+
+
+def test_backtest_matches_bar_by_bar(candles, report):
+    trades, broker = reference_trades(candles)
+    assert len(trades) > 0
+    pd.testing.assert_frame_equal(report.trades, pd.DataFrame(trades))
+
+    last = candles.sort_values('timestamp').groupby('ticker')['close'].last().to_dict()
+    assert report.final_value == pytest.approx(broker.get_portfolio_value(last))
+    assert report.pnl == pytest.approx(report.final_value - 10_000)
+    assert report.trades['pnl'].notna().any()
+
+
+def test_backtest_fills(candles, report):
+    bars = candles.sort_values('timestamp').set_index(['ticker', 'timestamp'])
+    bars['bar'] = bars.groupby(level='ticker').cumcount()
+    for trade in report.trades.itertuples():
+        bar = bars.loc[(trade.ticker, pd.Timestamp(trade.time))]
+        # filled at the close of the bar that gave the signal, sized like the live bot
+        assert trade.price == bar['close']
+        if trade.action in ('BUY', 'SHORT'):
+            assert trade.qty == int(POSITION_SIZE // trade.price)
+        # no trades while the indicators of the ticker warm up
+        assert bar['bar'] >= WARMUP
+
+    # one equity value per day, the last one marked with the last prices
+    assert len(report.equity) == 3
+    assert report.equity.iloc[-1] == pytest.approx(report.final_value)
+
+
+def test_backtest_workers(candles, report):
+    parallel = run_backtest(candles, TF, starting_capital=10_000, warmup=WARMUP, workers=2)
+    pd.testing.assert_frame_equal(parallel.trades, report.trades)
+    pd.testing.assert_series_equal(parallel.equity, report.equity)
+    assert parallel.final_value == report.final_value
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bot.config import EMA_LONG, EMA_SHORT, EMA_TREND
+from bot.indicators import MAX_BARS, IndicatorEngine
+
+PERIODS = (EMA_SHORT, EMA_LONG, EMA_TREND)
+
+
+# the pandas computations that the scanner used to run over every download, as references
+def _calc_ema(series: pd.Series, period: int) -> pd.Series:
+    return series.ewm(span=period, adjust=False).mean()
+
+
+def _vwap_series(high, low, close, volume):
+    typical_price = (high + low + close) / 3
+    cum_tp_vol = (typical_price * volume).cumsum()
+    cum_vol = volume.cumsum()
+    return cum_tp_vol / cum_vol.replace(0, np.nan)
+
+
+def _rsi_series(series, period: int = 14):
+    delta = series.diff()
+    gain = delta.where(delta > 0, 0.0)
+    loss = (-delta).where(delta < 0, 0.0)
+    avg_gain = gain.ewm(com=period - 1, min_periods=period).mean()
+    avg_loss = loss.ewm(com=period - 1, min_periods=period).mean()
+    rs = avg_gain / avg_loss.replace(0, np.nan)
+    return 100 - (100 / (1 + rs))
+
+
+def make_bars(n: int, start: str = '2026-10-12 04:00', seed: int = 0) -> pd.DataFrame:
+    # 5-minute candles from 4:00 to 20:00 (extended hours), over several days
+    rnd = np.random.default_rng(seed)
+    days = pd.date_range(start, periods=n // 192 + 2, freq='D', tz='America/New_York')
+    index = pd.DatetimeIndex(
+        [ts for day in days for ts in pd.date_range(day, periods=192, freq='5min')][:n]
+    )
+    close = 100 + rnd.standard_normal(n).cumsum()
+    return pd.DataFrame(
+        {
+            'open': close,
+            'high': close + rnd.random(n),
+            'low': close - rnd.random(n),
+            'close': close,
+            'volume': rnd.integers(0, 5000, n).astype(float),
+        },
+        index=index,
+    )
+
+
+def expected(bars: pd.DataFrame) -> dict:
+    # the indicators recomputed from scratch over the whole history
+    close = bars['close']
+    day = bars[bars.index.normalize() == bars.index[-1].normalize()]
+    return {
+        'ema': {p: _calc_ema(close, p).iloc[-1] for p in PERIODS},
+        'rsi': _rsi_series(close).iloc[-1],
+        'vwap': _vwap_series(day['high'], day['low'], day['close'], day['volume']).iloc[-1],
+        'volume': bars['volume'].tail(MAX_BARS).sum(),
+    }
+
+
+def assert_matches(result: dict, bars: pd.DataFrame) -> None:
+    exp = expected(bars)
+    for p in PERIODS:
+        assert result['ema'][p] == pytest.approx(exp['ema'][p], rel=1e-12)
+    assert result['rsi'] == pytest.approx(exp['rsi'], rel=1e-12, nan_ok=True)
+    assert result['vwap'] == pytest.approx(exp['vwap'], rel=1e-12, nan_ok=True)
+    assert result['volume'] == exp['volume']
+
+
+def test_incremental_updates_match_full_recomputation(tmp_path):
+    bars = make_bars(600)
+    path = str(tmp_path / 'state.json')
+    engine = IndicatorEngine(path)
+
+    assert engine.bars_needed('X') == MAX_BARS
+    assert_matches(engine.update('X', bars.iloc[:MAX_BARS]), bars.iloc[:MAX_BARS])
+    for end in range(MAX_BARS + 1, len(bars) + 1):
+        if end == 400:
+            # a restart: the state comes back from the file
+            engine.save()
+            engine = IndicatorEngine.load(path)
+            assert list(engine.states) == ['X']
+        # overlapping downloads, the last candle of each one is still forming
+        assert_matches(engine.update('X', bars.iloc[end - 3 : end]), bars.iloc[:end])
+
+
+def test_forming_candle_is_not_committed(tmp_path):
+    bars = make_bars(300)
+    engine = IndicatorEngine(str(tmp_path / 'state.json'))
+    engine.update('X', bars.iloc[:260])
+
+    # the last candle changes until it's complete
+    partial = bars.iloc[:260].copy()
+    partial.iloc[-1, partial.columns.get_loc('close')] += 5
+    assert_matches(engine.update('X', partial.tail(3)), partial)
+    assert_matches(engine.update('X', bars.iloc[257:262]), bars.iloc[:262])
+
+
+def test_missing_candles_reseed_the_state(tmp_path, capsys):
+    bars = make_bars(900)
+    engine = IndicatorEngine(str(tmp_path / 'state.json'))
+    engine.update('X', bars.iloc[:300])
+
+    # down for longer than MAX_BARS candles: the capped download doesn't reach the state
+    download = bars.iloc[600:850]
+    assert_matches(engine.update('X', download), download)
+    assert 're-seeding' in capsys.readouterr().out
+
+
+def test_candles_need_timestamps(tmp_path):
+    engine = IndicatorEngine(str(tmp_path / 'state.json'))
+    with pytest.raises(ValueError):
+        engine.update('X', make_bars(10).reset_index(drop=True))
+    assert engine.states == {}
+    # a `timestamp` column works as well
+    bars = make_bars(300).rename_axis('timestamp').reset_index()
+    assert_matches(engine.update('X', bars), make_bars(300))
+
+
+def test_replay_matches_full_recomputation(tmp_path):
+    bars = make_bars(500)
+    engine = IndicatorEngine(str(tmp_path / 'state.json'))
+    first = engine.replay('X', bars.iloc[:300])
+    # the overlapping candles are skipped
+    rest = engine.replay('X', bars.iloc[200:])
+    result = pd.concat([first, rest])
+
+    close = bars['close']
+    for p in PERIODS:
+        np.testing.assert_allclose(result[f'EMA{p}'], _calc_ema(close, p), rtol=1e-12)
+    np.testing.assert_allclose(result['RSI'], _rsi_series(close), rtol=1e-12)
+    vwap = bars.groupby(bars.index.normalize(), group_keys=False).apply(
+        lambda d: _vwap_series(d['high'], d['low'], d['close'], d['volume'])
+    )
+    np.testing.assert_allclose(result['VWAP'], vwap, rtol=1e-12)
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import dataclasses
+import math
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bot.config import EMA_LONG, EMA_SHORT, EMA_TREND
+from bot.strategy import STRATEGIES, Signal, ema_crossover, register, run_strategies
+
+TF = '5'
+EMA_S, EMA_L, EMA_T = f'EMA{EMA_SHORT}|{TF}', f'EMA{EMA_LONG}|{TF}', f'EMA{EMA_TREND}|{TF}'
+
+
+def reference_ema_crossover(df: pd.DataFrame, tf: str) -> list[tuple]:
+    # the row-by-row implementation that the vectorized one replaced
+    signals = []
+    for _, row in df.iterrows():
+        ticker = row.get('ticker', row.get('name', 'UNKNOWN'))
+        price = row.get(f'close|{tf}', row.get('close', 0))
+        ema_s = row.get(f'EMA{EMA_SHORT}|{tf}', None)
+        ema_l = row.get(f'EMA{EMA_LONG}|{tf}', None)
+        ema_t = row.get(f'EMA{EMA_TREND}|{tf}', None)
+        vwap = row.get(f'VWAP|{tf}', None)
+        rsi = row.get(f'RSI|{tf}', None)
+        if ema_s is None or ema_l is None or ema_t is None or vwap is None:
+            continue
+
+        action = None
+        ema_bullish = ema_s > ema_l
+        above_vwap = price > vwap
+        above_trend = price > ema_t
+        if ema_bullish and above_vwap and above_trend:
+            action = 'buy'
+            if rsi and 40 < rsi < 70:
+                action = 'strong_buy'
+        elif not ema_bullish and not above_vwap:
+            action = 'strong_sell'
+        elif not ema_bullish and above_vwap:
+            action = 'sell_ema_cross'
+        elif ema_bullish and not above_vwap:
+            action = 'sell_vwap_break'
+        if action:
+            signals.append((ticker, action, price, ema_s, ema_l, ema_t, vwap, rsi))
+    return signals
+
+
+def _normalize(value):
+    # NaN and None are both "missing"
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return None
+    return float(value) if not isinstance(value, str) else value
+
+
+def _random_frame(seed: int, n: int = 400, with_none: bool = True) -> pd.DataFrame:
+    rnd = np.random.default_rng(seed)
+
+    def column(missing: bool = True):
+        # few distinct values, so the comparisons often hit equality
+        values = rnd.integers(95, 106, n).astype(float).tolist()
+        if missing:
+            for i in rnd.choice(n, n // 10, replace=False):
+                values[i] = None if with_none and rnd.random() < 0.5 else float('nan')
+        # object columns keep the None values (a float column would turn them into NaN)
+        return pd.Series(values, dtype=object if with_none else float)
+
+    return pd.DataFrame(
+        {
+            'ticker': [f'NASDAQ:T{i}' for i in range(n)],
+            'name': [f'T{i}' for i in range(n)],
+            f'close|{TF}': column(missing=False),
+            EMA_S: column(),
+            EMA_L: column(),
+            EMA_T: column(),
+            f'VWAP|{TF}': column(),
+            f'RSI|{TF}': column().map(
+                lambda v: v if v is None or math.isnan(v) else v * 3 - 245
+            ),  # 40..70, including the edges
+        }
+    )
+
+
+@pytest.mark.parametrize('with_none', [True, False])
+@pytest.mark.parametrize('seed', range(5))
+def test_ema_crossover_matches_row_by_row(seed, with_none):
+    df = _random_frame(seed, with_none=with_none)
+    expected = [tuple(map(_normalize, s)) for s in reference_ema_crossover(df, TF)]
+    batch = ema_crossover(df, TF)
+    fields = ('ticker', 'action', 'price', 'ema_short', 'ema_long', 'ema_trend', 'vwap', 'rsi')
+    actual = [tuple(_normalize(getattr(s, f)) for f in fields) for s in batch]
+    assert actual == expected
+
+
+def test_ema_crossover_edge_cases():
+    df = pd.DataFrame(
+        {
+            'name': ['EQ', 'RSI40', 'RSI70', 'NORSI', 'NOEMA'],
+            'close': [100.0, 101.0, 101.0, 101.0, 101.0],  # no `close|5`: falls back to `close`
+            EMA_S: pd.Series([100.0, 100.0, 100.0, 100.0, None], dtype=object),
+            EMA_L: [100.0, 99.0, 99.0, 99.0, 99.0],
+            EMA_T: [90.0, 90.0, 90.0, 90.0, 90.0],
+            f'VWAP|{TF}': [100.0, 100.0, 100.0, 100.0, 100.0],
+            f'RSI|{TF}': pd.Series([50.0, 40.0, 70.0, None, 50.0], dtype=object),
+        }
+    )
+    expected = [tuple(map(_normalize, s)) for s in reference_ema_crossover(df, TF)]
+    batch = ema_crossover(df, TF)
+    assert [(s.ticker, s.action) for s in batch] == [(e[0], e[1]) for e in expected] == [
+        ('EQ', 'strong_sell'),  # equal EMAs aren't bullish, a price equal to VWAP isn't above
+        ('RSI40', 'buy'),  # the RSI band excludes its edges
+        ('RSI70', 'buy'),
+        ('NORSI', 'buy'),
+    ]
+    # a missing column means no signals at all
+    assert len(ema_crossover(df.drop(columns=[f'VWAP|{TF}']), TF)) == 0
+
+
+@pytest.fixture
+def broken_strategy():
+    @register('broken', lambda tf: ['close'])
+    def broken(df, tf):
+        raise ZeroDivisionError('boom')
+
+    yield 'broken'
+    del STRATEGIES['broken']
+
+
+def test_run_strategies_logs_failures(broken_strategy, caplog):
+    df = _random_frame(0)
+    results = run_strategies(df, TF, ['ema_crossover', broken_strategy])
+    # the other strategies still run
+    assert len(results['ema_crossover']) > 0
+    assert len(results[broken_strategy]) == 0
+    [record] = [r for r in caplog.records if r.name == 'bot.strategy']
+    assert record.levelname == 'ERROR'
+    assert 'broken failed' in record.getMessage()
+    assert record.exc_info[0] is ZeroDivisionError
+
+    with pytest.raises(ZeroDivisionError):
+        run_strategies(df, TF, ['ema_crossover', broken_strategy], strict=True)
+    with pytest.raises(ZeroDivisionError):
+        run_strategies(df, TF, ['ema_crossover', broken_strategy], max_workers=2, strict=True)
+
+
+def test_signal_is_slotted():
+    signal = Signal('NASDAQ:A', 'buy', 10.0, 9.0, 8.0, 7.0, rsi=55.0)
+    # on every supported Python version, not only where `dataclass(slots=True)` exists
+    assert not hasattr(signal, '__dict__')
+    assert Signal.__slots__ == tuple(f.name for f in dataclasses.fields(Signal))
+    assert signal.vwap is None
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        signal.price = 11.0
+    assert pickle.loads(pickle.dumps(signal)) == signal
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from tradingview_screener import Query, ResponseCache, Transport
+
+
+def test_cache_hits(mock_scanner):
+    cache = ResponseCache(ttl=60)
+    q = Query().select('close').set_transport(Transport(cache=cache))
+    q.url = mock_scanner.url
+
+    _, first = q.get_scanner_data()
+    _, second = q.get_scanner_data()
+    q.limit(10).get_scanner_data()  # different payload
+
+    assert first.equals(second)
+    assert len(mock_scanner.requests) == 2
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_cache_expiry_and_eviction():
+    cache = ResponseCache(ttl=0)
+    cache.set('a', 1)
+    assert cache.get('a') is None
+
+    cache = ResponseCache(ttl=60, maxsize=2)
+    for key in 'abc':
+        cache.set(key, key)
+    assert cache.get('a') is None
+    assert cache.get('c') == 'c'
+    assert len(cache) == 2
+
+
+def test_cache_key_is_canonical():
+    url = 'https://scanner.tradingview.com/america/scan'
+    key = ResponseCache.make_key(url, {'columns': ['close'], 'range': [0, 5]})
+    assert key == ResponseCache.make_key(url, {'range': [0, 5], 'columns': ['close']}, timeout=3)
+    assert key != ResponseCache.make_key(url, {'range': [0, 6], 'columns': ['close']})
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import pytest
+
+from tradingview_screener import Column, Query
+from tradingview_screener.columns import resolve_column
+
+
+def test_resolve_column():
+    assert resolve_column('Volume Weighted Average Price') == 'VWAP'
+    assert resolve_column('Volume Weighted Average Price|15') == 'VWAP|15'
+    assert resolve_column('EMA8|5') == 'EMA8|5'
+    assert resolve_column('24h_close_prev|1') == '24h_close_prev|1'
+    # the result is cached and interned
+    assert resolve_column(''.join(['close', '|5'])) is resolve_column('close|5')
+
+    with pytest.raises(ValueError, match="did you mean 'volume'"):
+        resolve_column('volumee|5')
+    with pytest.raises(ValueError, match='timeframe'):
+        resolve_column('close|')
+
+
+def test_column_validation():
+    assert Query().select('close|5', Column('EMA8|5')).query['columns'] == ['close|5', 'EMA8|5']
+    with pytest.raises(ValueError):
+        Query().select('close', 'volumee')
+    with pytest.raises(ValueError):
+        Column('closee') > 5
+    assert Column.from_unknown_name('new_field|5').name == 'new_field|5'
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from tradingview_screener.decoder import decode_rows
+
+
+def test_decode_rows_dtypes():
+    columns = ['name', 'exchange', 'close', 'volume', 'EMA8|5', 'typespecs', 'close']
+    data = [
+        {'s': 'NASDAQ:AAPL', 'd': ['AAPL', 'NASDAQ', 185.5, 1000, None, ['common'], 185.5]},
+        {'s': 'NYSE:GME', 'd': ['GME', 'NYSE', 17.7, 2000, 17.1, [], 17.7]},
+        {'s': 'NASDAQ:TSLA', 'd': ['TSLA', 'NASDAQ', 248.5, None, 250.0, ['common'], 248.5]},
+    ]
+    df = decode_rows(data, columns)
+
+    assert df.columns.tolist() == ['ticker', *columns]
+    assert df['ticker'].tolist() == ['NASDAQ:AAPL', 'NYSE:GME', 'NASDAQ:TSLA']
+    assert isinstance(df['exchange'].dtype, pd.CategoricalDtype)
+    assert df['exchange'].tolist() == ['NASDAQ', 'NYSE', 'NASDAQ']
+    assert df['volume'].dtype == np.float64
+    assert np.isnan(df['volume'].iloc[2])
+    assert df['EMA8|5'].dtype == np.float64
+    assert df['typespecs'].tolist() == [['common'], [], ['common']]
+
+
+def test_decode_rows_empty():
+    df = decode_rows([], ['close', 'volume'])
+    assert df.columns.tolist() == ['ticker', 'close', 'volume']
+    assert df.empty
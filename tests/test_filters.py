@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import json
+
+import pandas as pd
+import pytest
+
+from tradingview_screener import Column, apply_filters, filter_mask
+
+
+@pytest.fixture
+def df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            'ticker': ['NASDAQ:AAPL', 'NASDAQ:TSLA', 'NYSE:GME', 'OTC:ABCD'],
+            'description': ['Apple Inc.', 'Tesla, Inc.', 'GameStop Corp.', None],
+            'type': pd.Categorical(['stock', 'stock', 'stock', 'fund']),
+            'close': [185.0, 250.0, 17.5, float('nan')],
+            'VWAP': [180.0, 255.0, 17.0, 1.0],
+            'EMA5': [184.0, 249.0, 18.0, 1.0],
+            'EMA20': [186.0, 251.0, 16.0, 1.0],
+        }
+    )
+
+
+def test_filter_mask(df):
+    assert filter_mask(df, Column('close') > 100).tolist() == [True, True, False, False]
+    assert filter_mask(df, Column('close') > Column('VWAP')).tolist() == [
+        True,
+        False,
+        True,
+        False,
+    ]
+    assert filter_mask(df, Column('close').between(Column('EMA5'), Column('EMA20'))).tolist() == [
+        True,
+        True,
+        False,
+        False,
+    ]
+    assert filter_mask(df, Column('close').not_between(100, 200)).tolist() == [
+        False,
+        True,
+        True,
+        True,
+    ]
+    assert filter_mask(df, Column('type').isin(['fund'])).tolist() == [False, False, False, True]
+    assert filter_mask(df, Column('description').like('inc')).tolist() == [
+        True,
+        True,
+        False,
+        False,
+    ]
+    # the expressions are combined with AND
+    both = apply_filters(df, Column('close') > Column('VWAP'), Column('type') == 'stock')
+    assert both['ticker'].tolist() == ['NASDAQ:AAPL', 'NYSE:GME']
+
+
+def test_filter_isin_two_numbers(df):
+    # a set of two values, not a `[low, high]` range like `between()`
+    assert filter_mask(df, Column('close').isin([17.5, 250.0])).tolist() == [
+        False,
+        True,
+        True,
+        False,
+    ]
+    assert filter_mask(df, Column('close').between(17.5, 250.0)).tolist() == [
+        True,
+        True,
+        True,
+        False,
+    ]
+    # the values are still a plain JSON list in the request
+    expr = Column('close').isin([17.5, 250.0])
+    assert json.dumps(expr) == '{"left": "close", "operation": "in_range", "right": [17.5, 250.0]}'
+
+
+def test_filter_crosses(df):
+    previous = df.assign(EMA5=[187.0, 248.0, 15.0, 1.0]).iloc[::-1]
+    expr = Column('EMA5').crosses_above(Column('EMA20'))
+    assert filter_mask(df, expr, previous=previous).tolist() == [False, False, True, False]
+    expr = Column('EMA5').crosses(Column('EMA20'))
+    assert filter_mask(df, expr, previous=previous).tolist() == [True, False, True, False]
+    with pytest.raises(ValueError):
+        filter_mask(df, expr)
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import pytest
+
+from tradingview_screener import Column, FrozenQuery, Query
+
+
+def test_frozen_query_is_persistent():
+    template = Query().select('name', 'close|5').order_by('volume').freeze()
+    derived = template.where(Column('close|5') > 10).set_tickers('NASDAQ:AAPL').limit(10)
+
+    assert isinstance(derived, FrozenQuery)
+    assert 'filter' not in template.query
+    assert template.query['markets'] == ['america']
+    assert template.query['range'] == [0, 50]
+    assert template.url == 'https://scanner.tradingview.com/america/scan'
+    assert derived.query['symbols'] == {'tickers': ['NASDAQ:AAPL']}
+    assert derived.query['range'] == [0, 10]
+    assert derived.url == 'https://scanner.tradingview.com/global/scan'
+    # the values that didn't change are shared, not copied
+    assert derived.query['columns'] is template.query['columns']
+    assert derived.query['sort'] is template.query['sort']
+
+    with pytest.raises(AttributeError):
+        template.url = 'https://example.com'
+
+
+def test_copy_is_independent():
+    q = Query().limit(10)
+    frozen = q.freeze()
+    mutable = frozen.copy()
+    q.offset(5)
+    mutable.query['range'][1] = 20
+
+    assert frozen.query['range'] == [0, 10]
+    assert q.query['range'] == [5, 10]
+    assert type(mutable) is Query and mutable.query['range'] == [0, 20]
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import tradingview_screener
+
+SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'elapsed': elapsed, 'modules': sorted(sys.modules)}}))
+"""
+
+
+def _import_time(statement: str, repeat: int = 3) -> tuple[float, list[str]]:
+    # every measurement runs in a fresh interpreter, so nothing is already imported
+    env = {**os.environ, 'PYTHONPATH': str(Path(tradingview_screener.__file__).parents[1])}
+    results = []
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, '-c', SCRIPT.format(statement=statement)],
+            env=env,
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        results.append(json.loads(out.stdout))
+    best = min(results, key=lambda r: r['elapsed'])
+    return best['elapsed'], best['modules']
+
+
+def test_import_is_lazy():
+    statement = (
+        'from tradingview_screener import Column, Query\n'
+        "Query().select('name', 'close').where(Column('close') > 5)"
+    )
+    elapsed, modules = _import_time(statement)
+    # building a query doesn't need pandas/requests, only executing it does
+    for heavy in ('pandas', 'numpy', 'requests', 'asyncio'):
+        assert heavy not in modules
+
+    baseline, _ = _import_time('import pandas, requests')
+    print(f'\nimport tradingview_screener: {elapsed * 1e3:.1f}ms')
+    print(f'import pandas, requests:     {baseline * 1e3:.1f}ms')
+    assert elapsed < baseline
+
+
+def test_catalog_is_loaded_on_first_access():
+    _, modules = _import_time('import tradingview_screener.constants')
+    assert 'tradingview_screener._catalog' not in modules
+
+    from tradingview_screener import constants
+
+    assert constants.COLUMNS['Volume Weighted Average Price'] == 'VWAP'
+    assert 'america' in constants.MARKETS
+    assert 'COLUMNS' in dir(constants)
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from tradingview_screener import Query
+
+
+class OverlappingTransport:
+    """
+    Simulates live data: every page after the first one starts with the last row of the previous
+    page, like when a ticker moves down the ranking between two requests.
+    """
+
+    def __init__(self, n_rows: int) -> None:
+        self.n_rows = n_rows
+
+    def scan(self, url: str, payload: dict, **kwargs) -> dict:
+        start, end = payload['range']
+        start = max(start - 1, 0) if start else 0
+        rows = [{'s': f'NASDAQ:T{i}', 'd': [i]} for i in range(start, min(end, self.n_rows))]
+        return {'totalCount': self.n_rows, 'data': rows}
+
+
+def test_fetch_all(mock_scanner):
+    mock_scanner.n_rows = 1234
+    q = Query().select('close')
+    q.url = mock_scanner.url
+
+    total, df = q.fetch_all(page_size=100, max_workers=4)
+    assert total == 1234
+    assert df['ticker'].tolist() == [f'NASDAQ:T{i}' for i in range(1234)]
+    assert len(mock_scanner.requests) == 13
+    assert q.query['range'] == [0, 50]  # the query itself isn't modified
+
+
+def test_fetch_all_drops_duplicates():
+    q = Query().select('close').set_transport(OverlappingTransport(250))
+    total, df = q.fetch_all(page_size=100)
+    assert total == 250
+    assert df['ticker'].tolist() == [f'NASDAQ:T{i}' for i in range(250)]
+
+
+def test_iter_pages(mock_scanner):
+    mock_scanner.n_rows = 450
+    q = Query().select('close')
+    q.url = mock_scanner.url
+
+    pages = list(q.iter_pages(page_size=100))
+    assert [len(df) for df in pages] == [100, 100, 100, 100, 50]
+    assert pages[-1]['ticker'].iloc[-1] == 'NASDAQ:T449'
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from tradingview_screener import Column, Query, Transport
+
+
+def test_compile_body():
+    q = Query().select('name', 'close|5').where(Column('close') > 5).order_by('volume')
+    prepared = q.compile()
+
+    assert json.loads(prepared.body()) == q.query
+    body = json.loads(prepared.body(tickers=['NASDAQ:AAPL'], range=(0, 10)))
+    assert body == {
+        **{k: v for k, v in q.query.items() if k != 'markets'},
+        'symbols': {'tickers': ['NASDAQ:AAPL']},
+        'range': [0, 10],
+    }
+    # changing the query afterwards doesn't affect the prepared one
+    q.select('volume')
+    assert json.loads(prepared.body())['columns'] == ['name', 'close|5']
+    with pytest.raises(AttributeError):
+        prepared.url = 'https://example.com'
+
+
+def test_prepared_get_scanner_data(mock_scanner):
+    q = Query().select('name', 'close').set_transport(Transport())
+    q.url = mock_scanner.url
+    prepared = q.compile()
+
+    total, df = prepared.get_scanner_data()
+    assert (total, len(df)) == (100, 50)
+    assert df.columns.tolist() == ['ticker', 'name', 'close']
+
+    total, df = prepared.get_scanner_data(tickers=['NASDAQ:T3', 'NASDAQ:T7'])
+    assert total == 2
+    assert df['ticker'].tolist() == ['NASDAQ:T3', 'NASDAQ:T7']
+    assert mock_scanner.requests[-1]['symbols'] == {'tickers': ['NASDAQ:T3', 'NASDAQ:T7']}
+    assert 'markets' not in mock_scanner.requests[-1]
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from tradingview_screener import RateLimiter, Transport
+from tradingview_screener.ratelimit import parse_retry_after, retry_delay
+
+
+def test_token_bucket():
+    limiter = RateLimiter(rate=50, burst=5)
+    url = 'https://scanner.tradingview.com/america/scan'
+    start = time.monotonic()
+    for _ in range(15):
+        limiter.acquire(url)
+        limiter.release(url, 200)
+    # the first 5 requests are a burst, the other 10 are sent at 50/s
+    assert 0.15 < time.monotonic() - start < 0.6
+    assert limiter.metrics()['scanner.tradingview.com']['requests'] == 15
+
+
+def test_adaptive_concurrency():
+    limiter = RateLimiter(rate=1000, burst=1000, max_concurrency=8)
+    url = 'https://scanner.tradingview.com/america/scan'
+    limiter.acquire(url)
+    limiter.release(url, 429)
+    limiter.acquire(url)
+    limiter.release(url, 429)
+    assert limiter.metrics()['scanner.tradingview.com']['concurrency'] == 2
+    for _ in range(10):
+        limiter.acquire(url)
+        limiter.release(url, 200)
+    metrics = limiter.metrics()['scanner.tradingview.com']
+    assert 2 < metrics['concurrency'] <= 8
+    assert metrics['throttled'] == 2
+
+
+def test_retry_after():
+    assert parse_retry_after('1.5') == 1.5
+    assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0
+    assert parse_retry_after('soon') is None
+    assert 0 <= retry_delay(3, 0.1) <= 0.8
+    assert retry_delay(0, 0.1, retry_after=2) == 2
+
+
+def test_transport_retries_throttled_requests(mock_scanner):
+    mock_scanner.errors = [429, 503]
+    limiter = RateLimiter(max_concurrency=4)
+    with Transport(rate_limiter=limiter, backoff_factor=0.01) as transport:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            payloads = [{'columns': ['close'], 'range': [i, i + 1]} for i in range(8)]
+            results = list(executor.map(lambda p: transport.scan(mock_scanner.url, p), payloads))
+
+    assert [r['data'][0]['s'] for r in results] == [f'NASDAQ:T{i}' for i in range(8)]
+    metrics = limiter.metrics()[mock_scanner.url.split('/')[2]]
+    assert metrics['requests'] == 10
+    assert metrics['throttled'] == 1
+    assert metrics['failed'] == 1
+    assert metrics['in_flight'] == 0
+
+    mock_scanner.errors = [429] * 3
+    with Transport(max_retries=2, backoff_factor=0.01) as transport:
+        with pytest.raises(requests.HTTPError, match='Too many requests'):
+            transport.scan(mock_scanner.url, {'columns': ['close']})
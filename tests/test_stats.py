@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from tradingview_screener import AsyncTransport, Query, RequestStats, ResponseCache, Transport
+
+
+def test_hooks_receive_stats(mock_scanner):
+    received = []
+    q = Query().select('close', 'volume')
+    q.url = mock_scanner.url
+    with Transport(hooks=[received.append]) as transport:
+        q.set_transport(transport)
+        q.get_scanner_data()
+
+    (stats,) = received
+    assert stats.url == mock_scanner.url
+    assert stats.status == 200
+    assert stats.attempts == 1
+    assert stats.rows == 50
+    assert stats.request_bytes > 0
+    assert stats.raw_bytes > 0
+    assert stats.decoded_bytes >= stats.raw_bytes
+    for phase in ('request', 'download', 'parse', 'decode', 'total'):
+        assert getattr(stats, phase) > 0
+    assert stats.total >= stats.request + stats.download + stats.parse + stats.decode
+    assert not stats.cached
+
+
+def test_stats_of_retried_and_cached_requests(mock_scanner):
+    mock_scanner.errors = [503]
+    q = Query().select('close')
+    q.url = mock_scanner.url
+    q.set_transport(Transport(cache=ResponseCache(ttl=60), backoff_factor=0.01))
+
+    first = RequestStats()
+    q.get_scanner_data(stats=first)
+    assert first.attempts == 2
+    assert first.status == 200
+
+    second = RequestStats()
+    q.get_scanner_data(stats=second)
+    assert second.cached
+    assert second.attempts == 0
+    assert second.request is None
+    assert second.rows == 50
+    assert 'cached=True' in repr(second)
+
+
+def test_transport_scan_calls_hooks(mock_scanner):
+    received = []
+    transport = Transport(hooks=[received.append])
+    transport.scan(mock_scanner.url, {'columns': ['close'], 'range': [0, 5]})
+    assert len(received) == 1
+    assert received[0].rows is None  # the rows are only counted when they are decoded
+    assert received[0].total > 0
+
+
+def test_async_stats(mock_scanner):
+    pytest.importorskip('aiohttp')
+    received = []
+    q = Query().select('close')
+    q.url = mock_scanner.url
+
+    async def main():
+        transport = AsyncTransport(hooks=[received.append])
+        async with transport:
+            await q.aget_scanner_data(transport=transport)
+            prepared = q.compile()
+            await prepared.aget_scanner_data(transport=transport)
+
+    asyncio.run(main())
+    assert [s.status for s in received] == [200, 200]
+    assert [s.rows for s in received] == [50, 50]
+    assert received[0].connect is not None  # the first request opens the connection
+    assert received[1].request_bytes > 0
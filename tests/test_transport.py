@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tradingview_screener import Query, Transport
+from tradingview_screener.transport import get_default_transport, set_default_transport
+
+
+def test_transport_reuses_connections(mock_scanner):
+    q = Query().select('close', 'volume')
+    q.url = mock_scanner.url
+    with Transport() as transport:
+        q.set_transport(transport)
+        for _ in range(5):
+            total, df = q.get_scanner_data()
+
+    assert total == 100
+    assert df.columns.tolist() == ['ticker', 'close', 'volume']
+    assert len(df) == 50
+    assert len(mock_scanner.requests) == 5
+    assert len(mock_scanner.client_ports) == 1  # keep-alive: a single TCP connection
+
+
+def test_default_transport_is_shared():
+    previous = get_default_transport()
+    try:
+        transport = Transport()
+        set_default_transport(transport)
+        assert get_default_transport() is transport
+    finally:
+        set_default_transport(previous)
+
+
+def test_concurrent_identical_requests_are_coalesced(mock_scanner):
+    mock_scanner.delay = 0.3
+    transport = Transport()
+    barrier = threading.Barrier(8)
+
+    def scan():
+        barrier.wait()
+        return transport.scan(mock_scanner.url, {'columns': ['close'], 'range': [0, 5]})
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: scan(), range(8)))
+
+    assert len(mock_scanner.requests) == 1
+    assert transport.inflight.shared == 7
+    assert all(r is results[0] for r in results)
+
+
+def test_compression(mock_scanner):
+    payload = {'columns': ['close', 'volume'], 'range': [0, 100]}
+    with Transport() as transport:
+        json_obj = transport.scan(mock_scanner.url, payload)
+    transfer = transport.transfers.records[-1]
+
+    assert len(json_obj['data']) == 100
+    assert 'gzip' in mock_scanner.accept_encodings[-1]
+    assert transfer.content_encoding == 'gzip'
+    assert transfer.raw_bytes < transfer.decoded_bytes
+    assert transport.transfers.ratio > 0.5
+
+    with Transport(compression=False) as transport:
+        transport.scan(mock_scanner.url, payload)
+    transfer = transport.transfers.records[-1]
+    assert mock_scanner.accept_encodings[-1] == 'identity'
+    assert transfer.raw_bytes == transfer.decoded_bytes
+
+    with pytest.raises(ValueError):
+        Transport(compression=['gzip', 'lzma'])
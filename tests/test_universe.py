@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import time
+
+import pandas  # noqa: F401 (imported by `Universe`, keep it out of the timings)
+import pytest
+
+import tradingview_screener.screener as screener
+from tradingview_screener import SymbolCache, Transport, Universe
+
+
+@pytest.fixture
+def symbols_url(mock_scanner, monkeypatch):
+    monkeypatch.setattr(screener, 'URL', mock_scanner.url.replace('/america/', '/{market}/'))
+    return mock_scanner
+
+
+def test_get_all_symbols_uses_the_cache(symbols_url, tmp_path):
+    cache = SymbolCache(tmp_path / 'symbols.sqlite', max_age=60)
+    transport = Transport()
+
+    first = screener.get_all_symbols('america', transport=transport, cache=cache)
+    second = screener.get_all_symbols('america', transport=transport, cache=cache)
+    assert len(symbols_url.requests) == 1
+    assert first == second == sorted(f'NASDAQ:T{i}' for i in range(100))
+    assert cache.markets() == {'america': 100}
+    assert cache.age('america') < 5
+    cache.close()
+
+    # a new process loads the universe from the file
+    with SymbolCache(tmp_path / 'symbols.sqlite', max_age=60) as warm:
+        assert warm.get('america') == first
+        assert warm.get('america', max_age=0) is None
+        assert warm.get('crypto') is None
+
+
+def test_stale_markets_are_downloaded_again(symbols_url, tmp_path):
+    cache = SymbolCache(tmp_path / 'symbols.sqlite', max_age=0.05)
+    screener.get_all_symbols('america', cache=cache, transport=Transport())
+    time.sleep(0.1)
+    screener.get_all_symbols('america', cache=cache, transport=Transport())
+    assert len(symbols_url.requests) == 2
+
+
+def test_incremental_update(tmp_path):
+    cache = SymbolCache(tmp_path / 'symbols.sqlite')
+    assert cache.update('america', ['NYSE:A', 'NYSE:B', 'NYSE:C']) == (
+        ['NYSE:A', 'NYSE:B', 'NYSE:C'],
+        [],
+    )
+    assert cache.last_changes('america') == ([], [])
+
+    assert cache.update('america', ['NYSE:D', 'NYSE:A', 'NYSE:C']) == (['NYSE:D'], ['NYSE:B'])
+    # an unchanged list only resets the age, and keeps the last changes
+    assert cache.update('america', ['NYSE:A', 'NYSE:C', 'NYSE:D']) == ([], [])
+    assert cache.last_changes('america') == (['NYSE:D'], ['NYSE:B'])
+    assert cache.get('america') == ['NYSE:A', 'NYSE:C', 'NYSE:D']
+
+    cache.invalidate('america')
+    assert cache.get('america') is None
+    assert cache.last_changes('america') is None
+
+
+def test_get_universe_merges_the_markets(symbols_url, tmp_path):
+    symbols_url.delay = 0.3
+    start = time.perf_counter()
+    universe = screener.get_universe(['america', 'canada', 'crypto'], transport=Transport())
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.8  # downloaded concurrently
+    assert len(symbols_url.requests) == 3
+    assert len(universe) == 100  # the mock returns the same symbols for every market
+    assert universe.markets == ['america', 'canada', 'crypto']
+    assert 'NASDAQ:T5' in universe
+    assert 'NASDAQ:T500' not in universe
+
+
+def test_universe_lookups():
+    universe = Universe.from_symbols(
+        ['NYSE:B', 'NASDAQ:A', 'NYSE:A', 'NASDAQ1:X', 'NASDAQ:A', 'AMEX:SPY'], markets=['america']
+    )
+    assert list(universe) == ['AMEX:SPY', 'NASDAQ1:X', 'NASDAQ:A', 'NYSE:A', 'NYSE:B']
+    assert universe.exchanges == ['AMEX', 'NASDAQ', 'NASDAQ1', 'NYSE']
+    assert universe.exchange('NASDAQ').tolist() == ['NASDAQ:A']
+    assert universe.exchange('NYSE').tolist() == ['NYSE:A', 'NYSE:B']
+    assert universe.exchange('LSE').tolist() == []
+    assert universe.isin(['NYSE:B', 'NYSE:C', 'AMEX:SPY']).tolist() == [True, False, True]